@@ -0,0 +1,37 @@
+"""
+Migration script to add an index on log_entries.timestamp
+Run this script to speed up date-range and paginated log entry queries on an existing database.
+"""
+import sqlite3
+import os
+
+# Get the database path (relative to this script's location)
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'fitness.db')
+
+def migrate():
+    print(f"Connecting to database at: {os.path.abspath(DB_PATH)}")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    # Check if the index already exists
+    cursor.execute("""
+        SELECT name FROM sqlite_master 
+        WHERE type='index' AND name='ix_log_entries_timestamp'
+    """)
+    
+    if cursor.fetchone():
+        print("Index 'ix_log_entries_timestamp' already exists. Skipping migration.")
+        conn.close()
+        return
+    
+    print("Creating index ix_log_entries_timestamp...")
+    
+    cursor.execute("CREATE INDEX ix_log_entries_timestamp ON log_entries (timestamp)")
+    
+    conn.commit()
+    print("Migration completed successfully!")
+    
+    conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,57 @@
+"""
+Migration script to add log_entries.entry_date and indexes on foreign key columns
+Run this script on an existing database so per-day lookups and child-row loads can use indexes.
+"""
+import sqlite3
+import os
+
+# Get the database path (relative to this script's location)
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'fitness.db')
+
+# (index name, table, column) - names match the ones SQLAlchemy generates for index=True
+INDEXES = [
+    ("ix_log_entries_entry_date", "log_entries", "entry_date"),
+    ("ix_log_entry_foods_log_entry_id", "log_entry_foods", "log_entry_id"),
+    ("ix_log_entry_supplements_log_entry_id", "log_entry_supplements", "log_entry_id"),
+    ("ix_log_entry_activities_log_entry_id", "log_entry_activities", "log_entry_id"),
+    ("ix_activity_exercises_activity_id", "activity_exercises", "activity_id"),
+    ("ix_activity_sets_activity_exercise_id", "activity_sets", "activity_exercise_id"),
+    ("ix_progress_pictures_log_entry_id", "progress_pictures", "log_entry_id"),
+]
+
+def migrate():
+    print(f"Connecting to database at: {os.path.abspath(DB_PATH)}")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    
+    # Add and backfill the stored entry date
+    cursor.execute("PRAGMA table_info(log_entries)")
+    columns = [row[1] for row in cursor.fetchall()]
+    if "entry_date" in columns:
+        print("Column 'entry_date' already exists. Skipping.")
+    else:
+        print("Adding column log_entries.entry_date...")
+        cursor.execute("ALTER TABLE log_entries ADD COLUMN entry_date DATE")
+    cursor.execute("UPDATE log_entries SET entry_date = date(timestamp) WHERE entry_date IS NULL")
+    print(f"Backfilled entry_date for {cursor.rowcount} log entries")
+    
+    for name, table, column in INDEXES:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
+        if not cursor.fetchone():
+            print(f"Table '{table}' does not exist. Skipping index '{name}'.")
+            continue
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name=?", (name,))
+        if cursor.fetchone():
+            print(f"Index '{name}' already exists. Skipping.")
+            continue
+        print(f"Creating index {name}...")
+        cursor.execute(f"CREATE INDEX {name} ON {table} ({column})")
+    
+    cursor.execute("ANALYZE")
+    conn.commit()
+    print("Migration completed successfully!")
+    
+    conn.close()
+
+if __name__ == "__main__":
+    migrate()
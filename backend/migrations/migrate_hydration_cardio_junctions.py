@@ -0,0 +1,83 @@
+"""
+Migration script to move log_entries.hydration_ids and log_entries.cardio_ids from JSON arrays
+to the log_entry_hydrations and log_entry_cardio junction tables.
+Existing arrays are copied in order, then the JSON columns are dropped.
+"""
+import sqlite3
+import json
+import os
+
+# Get the database path (relative to this script's location)
+DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'fitness.db')
+
+# (JSON column on log_entries, junction table, id column, referenced table)
+JUNCTIONS = [
+    ("hydration_ids", "log_entry_hydrations", "hydration_id", "hydration"),
+    ("cardio_ids", "log_entry_cardio", "cardio_id", "cardio"),
+]
+
+def migrate():
+    print(f"Connecting to database at: {os.path.abspath(DB_PATH)}")
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(log_entries)")
+        columns = [row[1] for row in cursor.fetchall()]
+
+        for json_column, table, id_column, referenced in JUNCTIONS:
+            # The app creates the (empty) junction tables on startup, so they may already exist
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY,
+                    log_entry_id INTEGER NOT NULL REFERENCES log_entries(id),
+                    {id_column} INTEGER NOT NULL REFERENCES {referenced}(id)
+                )
+            """)
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_id ON {table} (id)")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_log_entry_id ON {table} (log_entry_id)")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_{id_column} ON {table} ({id_column})")
+
+            if json_column not in columns:
+                print(f"Already migrated: log_entries.{json_column} does not exist")
+                continue
+
+            # Entries that already have links were saved by the new code after the upgrade;
+            # their JSON array is stale
+            cursor.execute(f"""
+                SELECT id, {json_column} FROM log_entries
+                WHERE {json_column} IS NOT NULL
+                  AND id NOT IN (SELECT log_entry_id FROM {table})
+                ORDER BY id
+            """)
+            rows = cursor.fetchall()
+
+            links = []
+            for log_entry_id, ids_json in rows:
+                try:
+                    ids = json.loads(ids_json)
+                except json.JSONDecodeError:
+                    print(f"Warning: Could not parse {json_column} for log_entry {log_entry_id}")
+                    continue
+                links.extend((log_entry_id, i) for i in ids or [])
+            cursor.executemany(
+                f"INSERT INTO {table} (log_entry_id, {id_column}) VALUES (?, ?)", links
+            )
+            print(f"Migrated {len(links)} {id_column} links from {len(rows)} log entries")
+
+            print(f"Removing {json_column} column from log_entries...")
+            cursor.execute(f"ALTER TABLE log_entries DROP COLUMN {json_column}")
+
+        cursor.execute("ANALYZE")
+        conn.commit()
+        print("Migration completed successfully!")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    migrate()
@@ -15,12 +15,12 @@ class ExerciseRequest(BaseModel):
 
 
 @exercise_router.get("/", response_model=list[Exercise])
-async def get_all_exercises(db: Session = Depends(get_db)) -> list[Exercise]:
+def get_all_exercises(db: Session = Depends(get_db)) -> list[Exercise]:
     return ExerciseService(db).get_all_exercises()
 
 
 @exercise_router.get("/{id}", response_model=Exercise)
-async def get_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
+def get_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
     exercise = ExerciseService(db).get_exercise(id)
     if exercise is None:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -28,12 +28,12 @@ async def get_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
 
 
 @exercise_router.post("/", response_model=Exercise)
-async def create_exercise(exercise: ExerciseRequest, db: Session = Depends(get_db)) -> Exercise:
+def create_exercise(exercise: ExerciseRequest, db: Session = Depends(get_db)) -> Exercise:
     return ExerciseService(db).create_exercise(exercise.name, exercise.movement_pattern_id, exercise.notes)
 
 
 @exercise_router.put("/{id}", response_model=Exercise)
-async def update_exercise(id: int, exercise: ExerciseRequest, db: Session = Depends(get_db)) -> Exercise:
+def update_exercise(id: int, exercise: ExerciseRequest, db: Session = Depends(get_db)) -> Exercise:
     updated = ExerciseService(db).update_exercise(id, exercise.name, exercise.movement_pattern_id, exercise.notes)
     if updated is None:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -41,7 +41,7 @@ async def update_exercise(id: int, exercise: ExerciseRequest, db: Session = Depe
 
 
 @exercise_router.delete("/{id}", response_model=Exercise)
-async def delete_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
+def delete_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
     deleted = ExerciseService(db).delete_exercise(id)
     if deleted is None:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -49,6 +49,6 @@ async def delete_exercise(id: int, db: Session = Depends(get_db)) -> Exercise:
 
 
 @exercise_router.delete("/", status_code=204)
-async def delete_all_exercises(db: Session = Depends(get_db)):
+def delete_all_exercises(db: Session = Depends(get_db)):
     ExerciseService(db).delete_all_exercises()
 
@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from src.domain.Export.export_service import ExportService
+from src.domain.Export.schemas import ExportDataset, ExportFormat
+
+export_router = APIRouter(prefix="/export", tags=["Export"])
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+@export_router.get("/{dataset}")
+def export_dataset(dataset: ExportDataset, format: ExportFormat = ExportFormat.NDJSON):
+    """Download a full dataset as NDJSON (one object per line, same shape as the GET endpoints)
+    or CSV (nested fields as JSON). Rows are streamed in chunks, so memory use does not grow with history.
+    """
+    return StreamingResponse(
+        ExportService().stream(dataset, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{dataset.value}.{format.value}"'},
+    )
@@ -1,27 +1,94 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+import codecs
+import io
+from datetime import date, datetime
+from typing import Literal
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
 from sqlalchemy.orm import Session
 from src.database import get_db
 from src.domain.LogEntry.log_entry_service import LogEntryService
-from src.domain.LogEntry.schemas import LogEntry
-from src.api.schemas import LogEntryRequest
+from src.domain.LogEntry.schemas import LogEntry, LogEntryImportResult
+from src.api.schemas import LogEntryRequest, LogEntryPatchRequest
 
 log_entry_router = APIRouter(prefix="/log-entries", tags=["Log Entries"])
 
-
-@log_entry_router.get("/", response_model=list[LogEntry])
-def get_all_log_entries(db: Session = Depends(get_db)):
-    return LogEntryService().get_all_log_entries(db)
-
-
-@log_entry_router.get("/date/{date}", response_model=LogEntry | None)
-def get_log_entry_by_date(date: str, db: Session = Depends(get_db)):
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def parse_cursor(cursor: str) -> tuple[datetime, int]:
+    """Parse a "<timestamp>,<id>" keyset cursor"""
+    try:
+        timestamp_str, id_str = cursor.rsplit(",", 1)
+        return datetime.fromisoformat(timestamp_str), int(id_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}. Expected '<timestamp>,<id>'")
+
+
+def format_cursor(log_entry: LogEntry) -> str:
+    return f"{log_entry.timestamp.isoformat()},{log_entry.id}"
+
+
+def parse_fields(
+    fields: str | None = Query(
+        default=None,
+        description="Comma-separated LogEntry fields to include (id and timestamp are always returned)"
+    )
+) -> set[str] | None:
+    """Parse the sparse fieldset parameter; None means every section"""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - LogEntry.model_fields.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+
+# Sections left out by `fields` are not loaded and are omitted from the response
+@log_entry_router.get("/", response_model=list[LogEntry], response_model_exclude_unset=True)
+def get_all_log_entries(
+    response: Response,
+    after: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    fields: set[str] | None = Depends(parse_fields),
+    db: Session = Depends(get_db)
+):
+    """Get log entries. Without after/limit the full history is returned.
+    With either, entries are paginated by (timestamp, id); pass the X-Next-Cursor
+    response header back as `after` to fetch the next page.
+    """
+    if after is None and limit is None:
+        return LogEntryService().get_all_log_entries(db, fields)
+    
+    cursor = parse_cursor(after) if after else None
+    entries, has_more = LogEntryService().get_log_entries_page(db, cursor, limit or DEFAULT_PAGE_SIZE, fields)
+    if has_more:
+        response.headers["X-Next-Cursor"] = format_cursor(entries[-1])
+    return entries
+
+
+@log_entry_router.get("/range", response_model=list[LogEntry], response_model_exclude_unset=True)
+def get_log_entries_in_range(
+    start: date,
+    end: date,
+    fields: set[str] | None = Depends(parse_fields),
+    db: Session = Depends(get_db)
+):
+    """Get log entries between start and end dates (YYYY-MM-DD, inclusive)"""
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must be on or after start")
+    return LogEntryService().get_log_entries_in_range(db, start, end, fields)
+
+
+@log_entry_router.get("/date/{date}", response_model=LogEntry | None, response_model_exclude_unset=True)
+def get_log_entry_by_date(date: str, fields: set[str] | None = Depends(parse_fields), db: Session = Depends(get_db)):
     """Get log entry by date (YYYY-MM-DD format)"""
-    return LogEntryService().get_log_entry_by_date(db, date)
+    return LogEntryService().get_log_entry_by_date(db, date, fields)
 
 
-@log_entry_router.get("/{log_entry_id}", response_model=LogEntry)
-def get_log_entry(log_entry_id: int, db: Session = Depends(get_db)):
-    log_entry = LogEntryService().get_log_entry(db, log_entry_id)
+@log_entry_router.get("/{log_entry_id}", response_model=LogEntry, response_model_exclude_unset=True)
+def get_log_entry(log_entry_id: int, fields: set[str] | None = Depends(parse_fields), db: Session = Depends(get_db)):
+    log_entry = LogEntryService().get_log_entry(db, log_entry_id, fields)
     if log_entry is None:
         raise HTTPException(status_code=404, detail="Log entry not found")
     return log_entry
@@ -32,6 +99,38 @@ def create_log_entry(log_entry: LogEntryRequest, db: Session = Depends(get_db)):
     return LogEntryService().create_log_entry(db, log_entry)
 
 
+@log_entry_router.post("/import", response_model=LogEntryImportResult)
+def import_log_entries(
+    file: UploadFile = File(...),
+    format: Literal["ndjson", "csv"] | None = Query(
+        default=None,
+        description="File format; defaults to csv for .csv uploads and ndjson otherwise"
+    ),
+    db: Session = Depends(get_db)
+):
+    """Bulk import log entries from an uploaded file.
+    ndjson: one LogEntryRequest object per line. csv: a header row of LogEntryRequest field names,
+    with nested fields (phase, sleep, hydration, foods, activities, cardio, supplements, stress) as JSON.
+    The file is read row by row and inserted in large batches; rows that fail are listed in `errors`.
+    """
+    file_format = format or ("csv" if (file.filename or "").lower().endswith(".csv") else "ndjson")
+    # Check the encoding up front so a bad byte can't stop the import halfway through
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for chunk in iter(lambda: file.file.read(1024 * 1024), b""):
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
+    file.file.seek(0)
+
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="" if file_format == "csv" else None)
+    try:
+        return LogEntryService().import_log_entries(db, lines, file_format)
+    finally:
+        lines.detach()
+
+
 @log_entry_router.put("/{log_entry_id}", response_model=LogEntry)
 def update_log_entry(log_entry_id: int, log_entry: LogEntryRequest, db: Session = Depends(get_db)):
     updated = LogEntryService().update_log_entry(db, log_entry_id, log_entry)
@@ -40,6 +139,22 @@ def update_log_entry(log_entry_id: int, log_entry: LogEntryRequest, db: Session
     return updated
 
 
+# Only id, timestamp and the sections the operations changed are returned
+@log_entry_router.patch("/{log_entry_id}", response_model=LogEntry, response_model_exclude_unset=True)
+def patch_log_entry(log_entry_id: int, patch: LogEntryPatchRequest, db: Session = Depends(get_db)):
+    """Apply partial updates to a log entry without re-sending it whole.
+    Operations run in order and either all apply or none do: append_hydration, remove_hydration,
+    add_food, update_food and remove_food (by position in the entry's foods), set_morning_weight.
+    """
+    try:
+        patched = LogEntryService().patch_log_entry(db, log_entry_id, patch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if patched is None:
+        raise HTTPException(status_code=404, detail="Log entry not found")
+    return patched
+
+
 @log_entry_router.delete("/{log_entry_id}", response_model=LogEntry)
 def delete_log_entry(log_entry_id: int, db: Session = Depends(get_db)):
     deleted = LogEntryService().delete_log_entry(db, log_entry_id)
@@ -1,12 +1,18 @@
+import mimetypes
 import os
 import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from hashlib import md5
 from pathlib import Path
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.database import get_db
+from src.database import get_db, get_async_db
 from src.domain.ProgressPicture import progress_picture_service
 from src.domain.ProgressPicture.schemas import ProgressPicture
+from src.domain.ProgressPicture.variants import PictureSize, get_or_create_variant, delete_variants
 
 progress_picture_router = APIRouter(prefix="/api/progress-pictures", tags=["progress-pictures"])
 
@@ -31,6 +37,19 @@ MAX_FILE_SIZE = 10 * 1024 * 1024
 UPLOAD_DIR = Path("uploads/progress_pictures")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Resized copies of uploads, created on first request
+VARIANT_DIR = Path("uploads/progress_picture_variants")
+VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Pictures are stored under random, never reused filenames and never change afterwards,
+# so clients may keep them for as long as they like
+FILE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Uploads are copied to disk this much at a time
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def validate_image_file(file: UploadFile) -> None:
     """Validate that the uploaded file is a valid image"""
@@ -57,56 +76,157 @@ def generate_unique_filename(original_filename: str) -> str:
     return f"{uuid.uuid4()}{ext}"
 
 
+def has_image_magic_bytes(head: bytes) -> bool:
+    """Check the file's leading bytes against the signatures of the allowed formats"""
+    return (
+        head[:3] == b'\xff\xd8\xff' or  # JPEG
+        head[:8] == b'\x89PNG\r\n\x1a\n' or  # PNG
+        head[:6] in (b'GIF87a', b'GIF89a') or  # GIF
+        (head[:4] == b'RIFF' and head[8:12] == b'WEBP') or  # WebP
+        head[:4] == b'\x00\x00\x00\x0c'  # HEIC (simplified check)
+    )
+
+
+async def save_upload(file: UploadFile, dest: Path) -> None:
+    """Copy an upload to dest a chunk at a time, checking the magic bytes on the first chunk and the
+    size as it goes. Writes run in the threadpool so the event loop keeps serving other requests,
+    and go to a temporary file that is only renamed to dest once the whole upload is accepted.
+    """
+    tmp = dest.with_name(f".{dest.name}.tmp")
+    f = await run_in_threadpool(open, tmp, "wb")
+    try:
+        total = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            if total == 0 and not has_image_magic_bytes(chunk[:12]):
+                raise HTTPException(
+                    status_code=400,
+                    detail="File content does not match a valid image format"
+                )
+            total += len(chunk)
+            if total > MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
+                )
+            await run_in_threadpool(f.write, chunk)
+        if total == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="File content does not match a valid image format"
+            )
+        await run_in_threadpool(f.close)
+        await run_in_threadpool(os.replace, tmp, dest)
+    finally:
+        f.close()
+        tmp.unlink(missing_ok=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _parse_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """Inclusive (start, end) of a single "bytes=" range, or None to ignore the header and send the
+    whole file (malformed, other units, or several ranges). Raises 416 if the range is out of bounds.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        return None
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start > end:
+            if start < size:
+                return None  # last-byte-pos before first-byte-pos: invalid, so ignored
+            raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+    else:
+        # Suffix range: the last N bytes
+        if int(last) == 0 or size == 0:
+            raise HTTPException(status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"})
+        start, end = max(size - int(last), 0), size - 1
+    return start, end
+
+
+def _read_range(path: Path, start: int, end: int):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(FILE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def serve_file(request: Request, path: Path, media_type: str | None = None) -> Response:
+    """FileResponse with a strong ETag, long-lived caching, conditional GET (304) and single byte ranges"""
+    stat_result = path.stat()
+    etag = '"' + md5(f"{path.name}-{stat_result.st_size}-{stat_result.st_mtime_ns}".encode()).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": FILE_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+    
+    # If-None-Match takes precedence; If-Modified-Since is only used without it
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    elif "if-modified-since" in request.headers:
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"]).timestamp()
+        except (TypeError, ValueError):
+            since = None
+        if since is not None and int(stat_result.st_mtime) <= since:
+            return Response(status_code=304, headers=headers)
+    
+    range_header = request.headers.get("range")
+    # If-Range: only honour the range if the client's copy is still current
+    if range_header and request.headers.get("if-range", etag) == etag:
+        byte_range = _parse_range(range_header, stat_result.st_size)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat_result.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=206,
+                media_type=media_type or mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+                headers=headers,
+            )
+    
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+
 @progress_picture_router.post("/{log_entry_id}", response_model=ProgressPicture)
 async def upload_progress_picture(
     log_entry_id: int,
     file: UploadFile = File(...),
     label: str = Form(default=None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload a progress picture for a log entry"""
     # Validate file type
     validate_image_file(file)
     
-    # Read file content and check size
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
-        )
-    
-    # Additional validation: check file magic bytes for common image formats
-    # JPEG: FF D8 FF
-    # PNG: 89 50 4E 47
-    # GIF: 47 49 46
-    # WebP: 52 49 46 46 ... 57 45 42 50
-    magic_bytes = content[:12]
-    is_valid_magic = (
-        magic_bytes[:3] == b'\xff\xd8\xff' or  # JPEG
-        magic_bytes[:8] == b'\x89PNG\r\n\x1a\n' or  # PNG
-        magic_bytes[:6] in (b'GIF87a', b'GIF89a') or  # GIF
-        (magic_bytes[:4] == b'RIFF' and magic_bytes[8:12] == b'WEBP') or  # WebP
-        magic_bytes[:4] == b'\x00\x00\x00\x0c'  # HEIC (simplified check)
-    )
-    
-    if not is_valid_magic:
-        raise HTTPException(
-            status_code=400,
-            detail="File content does not match a valid image format"
-        )
-    
     # Generate unique filename and save
     unique_filename = generate_unique_filename(file.filename)
     file_path = UPLOAD_DIR / unique_filename
-    
-    with open(file_path, "wb") as f:
-        f.write(content)
+    await save_upload(file, file_path)
     
     # Create database record
     try:
-        picture = progress_picture_service.create_progress_picture(
-            db=db,
+        picture = await db.run_sync(
+            progress_picture_service.create_progress_picture,
             log_entry_id=log_entry_id,
             filename=unique_filename,
             original_filename=file.filename or "image",
@@ -134,8 +254,11 @@ def get_pictures_for_log_entry(log_entry_id: int, db: Session = Depends(get_db))
 
 
 @progress_picture_router.get("/file/{filename}")
-def get_picture_file(filename: str):
-    """Serve a progress picture file"""
+def get_picture_file(request: Request, filename: str, size: PictureSize | None = None):
+    """Serve a progress picture file.
+    size: thumb or medium for a resized WebP copy; the original is served if omitted
+    or if the image can't be resized (e.g. HEIC).
+    """
     # Sanitize filename to prevent path traversal
     safe_filename = Path(filename).name
     file_path = UPLOAD_DIR / safe_filename
@@ -143,7 +266,12 @@ def get_picture_file(filename: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
     
-    return FileResponse(file_path)
+    if size is not None:
+        variant = get_or_create_variant(file_path, VARIANT_DIR, size)
+        if variant is not None:
+            return serve_file(request, variant, media_type="image/webp")
+    
+    return serve_file(request, file_path)
 
 
 @progress_picture_router.put("/{picture_id}", response_model=ProgressPicture)
@@ -170,6 +298,7 @@ def delete_picture(picture_id: int, db: Session = Depends(get_db)):
     file_path = UPLOAD_DIR / filename
     if file_path.exists():
         file_path.unlink()
+    delete_variants(VARIANT_DIR, filename)
     
     return {"status": "deleted"}
 
@@ -255,3 +255,53 @@ class LogEntryRequest(BaseModel):
     num_standard_drinks: int | None = None
     notes: str | None = None
     carb_cycle_day_id: int | None = None  # Selected carb cycle day
+
+
+# =============================================================================
+# LogEntry Patch (partial updates, applied in order)
+# =============================================================================
+
+class AppendHydrationOperation(BaseModel):
+    op: Literal["append_hydration"]
+    hydration: HydrationInput
+
+
+class RemoveHydrationOperation(BaseModel):
+    op: Literal["remove_hydration"]
+    hydration_id: int
+
+
+class AddFoodOperation(BaseModel):
+    op: Literal["add_food"]
+    food_id: int
+    servings: float = 1.0
+
+
+class UpdateFoodOperation(BaseModel):
+    op: Literal["update_food"]
+    index: int = Field(ge=0)  # Position in the log entry's foods
+    servings: float
+
+
+class RemoveFoodOperation(BaseModel):
+    op: Literal["remove_food"]
+    index: int = Field(ge=0)  # Position in the log entry's foods
+
+
+class SetMorningWeightOperation(BaseModel):
+    op: Literal["set_morning_weight"]
+    morning_weight: float | None
+
+
+LogEntryPatchOperation = Annotated[
+    Union[
+        AppendHydrationOperation, RemoveHydrationOperation,
+        AddFoodOperation, UpdateFoodOperation, RemoveFoodOperation,
+        SetMorningWeightOperation,
+    ],
+    Field(discriminator="op")
+]
+
+
+class LogEntryPatchRequest(BaseModel):
+    operations: list[LogEntryPatchOperation] = Field(min_length=1)
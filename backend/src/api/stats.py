@@ -4,6 +4,7 @@ from src.database import get_db
 from src.domain.Stats import stats_service
 from src.domain.Stats.schemas import (
     StatsQueryRequest, StatsQueryResponse,
+    StatsBatchQueryRequest, StatsBatchQueryResponse,
     StatsConfiguration, StatsConfigurationRequest,
     MetricType, DateRangeType, AggregationType
 )
@@ -17,6 +18,28 @@ def query_stats(request: StatsQueryRequest, db: Session = Depends(get_db)):
     return stats_service.query_stats(db, request)
 
 
+@stats_router.post("/query-batch", response_model=StatsBatchQueryResponse)
+def query_stats_batch(request: StatsBatchQueryRequest, db: Session = Depends(get_db)):
+    """Query several statistics at once, given directly or as saved configuration ids"""
+    configs = stats_service.get_configurations_by_ids(db, request.configuration_ids)
+    missing = [config_id for config_id in request.configuration_ids if config_id not in configs]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Configurations not found: {missing}")
+    requests = list(request.queries) + [
+        stats_service.configuration_to_request(configs[config_id]) for config_id in request.configuration_ids
+    ]
+    
+    responses = stats_service.query_stats_batch(db, requests)
+    num_queries = len(request.queries)
+    return StatsBatchQueryResponse(queries=responses[:num_queries], configurations=responses[num_queries:])
+
+
+@stats_router.get("/cache")
+def get_cache_info():
+    """Get hit/miss counters and size of the stats query cache"""
+    return stats_service.get_cache_info()
+
+
 @stats_router.get("/metrics")
 def get_available_metrics():
     """Get list of available metrics"""
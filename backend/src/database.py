@@ -1,14 +1,142 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import os
+from threading import Lock
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 
-DATABASE_URL = "sqlite:///./fitness.db"
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./fitness.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# Max ids per IN (...) clause; SQLite builds before 3.32 cap bound variables at 999
+IN_CHUNK_SIZE = 500
+
+# Pragmas applied to every new SQLite connection, each overridable through the environment.
+# WAL lets readers run alongside a writer and, with synchronous=NORMAL, only fsyncs at checkpoints.
+# Foreign keys stay off by default: several delete paths still rely on leaving references dangling.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", "-65536")),  # Negative is KiB: 64 MiB
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "temp_store": os.environ.get("SQLITE_TEMP_STORE", "MEMORY"),
+    "foreign_keys": os.environ.get("SQLITE_FOREIGN_KEYS", "OFF"),
+}
+
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+
+def _is_in_memory(url) -> bool:
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+def _sqlite_pragmas(url, pragmas: dict | None) -> dict:
+    pragmas = dict(SQLITE_PRAGMAS if pragmas is None else pragmas)
+    if _is_in_memory(url):
+        # WAL needs a file; an in-memory database only supports the memory journal
+        pragmas.pop("journal_mode", None)
+    return pragmas
+
+def _apply_pragmas_on_connect(engine: Engine, pragmas: dict) -> None:
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def create_db_engine(url: str = DATABASE_URL, pragmas: dict | None = None) -> Engine:
+    """Create an engine for url, tuned for SQLite when the URL points at SQLite.
+    File databases get a connection pool with the pragmas applied on connect; in-memory databases
+    share one connection, since each new connection would otherwise see an empty database.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return create_engine(url, pool_pre_ping=True, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    
+    if _is_in_memory(parsed):
+        engine = create_engine(url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    else:
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+        )
+    _apply_pragmas_on_connect(engine, _sqlite_pragmas(parsed, pragmas))
+    return engine
+
+def to_async_url(url: str) -> str:
+    """The async driver URL for a sync database URL (sqlite:// -> sqlite+aiosqlite://)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.get_driver_name() != "aiosqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+def create_async_db_engine(url: str = DATABASE_URL, pragmas: dict | None = None) -> AsyncEngine:
+    """Async counterpart of create_db_engine, using aiosqlite for SQLite URLs.
+    An in-memory database is not shared with the sync engine: each engine sees its own.
+    """
+    url = to_async_url(url)
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return create_async_engine(url, pool_pre_ping=True, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+    
+    if _is_in_memory(parsed):
+        engine = create_async_engine(url, poolclass=StaticPool)
+    else:
+        # aiosqlite defaults to opening a new connection (and thread) per checkout
+        engine = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+        )
+    _apply_pragmas_on_connect(engine.sync_engine, _sqlite_pragmas(parsed, pragmas))
+    return engine
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 class Base(DeclarativeBase):
     pass
 
+# Per-table write counters, bumped when a transaction that wrote to the table commits.
+# Caches of derived data compare them to tell whether an entry is stale.
+_data_versions: dict[str, int] = {}
+_data_versions_lock = Lock()
+
+def data_version(tables) -> tuple[int, ...]:
+    """Current write counters of the given tables"""
+    return tuple(_data_versions.get(table, 0) for table in tables)
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session, flush_context):
+    changed = session.info.setdefault("changed_tables", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        changed.add(obj.__table__.name)
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = orm_execute_state.statement.table
+        orm_execute_state.session.info.setdefault("changed_tables", set()).add(table.name)
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_versions(session):
+    changed = session.info.pop("changed_tables", set())
+    with _data_versions_lock:
+        for table in changed:
+            _data_versions[table] = _data_versions.get(table, 0) + 1
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_tables(session):
+    session.info.pop("changed_tables", None)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -16,6 +144,15 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """AsyncSession dependency for async def routes, which must not use a sync Session: its queries,
+    and any wait for a pooled connection, would block the event loop.
+    Repositories run on it through AsyncSession.run_sync. Routes with nothing to await besides the
+    database should be plain def routes on get_db instead; the threadpool measured faster here.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def init_db():
     # Import all models to ensure they're registered with SQLAlchemy
     from src.domain.Food.models import FoodModel
@@ -36,7 +173,24 @@ def init_db():
     from src.domain.Cycles.SupplementCycle.models import SupplementCycleModel, SupplementCycleDayModel, SupplementCycleDayItemModel
     from src.domain.Cycles.Mesocycle.models import MesocycleModel, MicrocycleModel, MicrocycleDayModel
     from src.domain.ProgressPicture.models import ProgressPictureModel
-    from src.domain.Stats.models import StatsConfigurationModel
+    from src.domain.Stats.models import StatsConfigurationModel, DailyMetricsModel
     
     Base.metadata.create_all(bind=engine)
 
+    # Queue days missing from the daily stats rollup (new table or older database) for a rebuild
+    from src.domain.Stats.repository import DailyMetricsRepository
+    db = SessionLocal()
+    try:
+        DailyMetricsRepository(db).mark_missing_dirty()
+        db.commit()
+    finally:
+        db.close()
+
+    # Create the food name search index, filling it from existing foods
+    from src.domain.Food.search import ensure_search_index
+    db = SessionLocal()
+    try:
+        ensure_search_index(db)
+    finally:
+        db.close()
+
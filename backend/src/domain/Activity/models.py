@@ -8,7 +8,7 @@ class ActivitySetModel(Base):
     __tablename__ = "activity_sets"
 
     id = Column(Integer, primary_key=True, index=True)
-    activity_exercise_id = Column(Integer, ForeignKey('activity_exercises.id'), nullable=False)
+    activity_exercise_id = Column(Integer, ForeignKey('activity_exercises.id'), nullable=False, index=True)
     reps = Column(Integer, nullable=False)
     weight = Column(Float, nullable=False)
     unit = Column(String, nullable=True)  # "kg" or "lb"
@@ -23,7 +23,7 @@ class ActivityExerciseModel(Base):
     __tablename__ = "activity_exercises"
 
     id = Column(Integer, primary_key=True, index=True)
-    activity_id = Column(Integer, ForeignKey('activities.id'), nullable=False)
+    activity_id = Column(Integer, ForeignKey('activities.id'), nullable=False, index=True)
     exercise_id = Column(Integer, ForeignKey('exercises.id'), nullable=False)
     position = Column(Integer, nullable=False)  # Order in the activity
     session_notes = Column(Text, nullable=True)  # Notes specific to this session
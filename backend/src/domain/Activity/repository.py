@@ -1,7 +1,22 @@
-from sqlalchemy.orm import Session
+from typing import Iterator
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 from src.domain.Activity.models import ActivityModel, ActivityExerciseModel, ActivitySetModel
+from src.domain.Exercise.models import ExerciseModel
+from src.domain.MovementPattern.models import MovementPatternModel
+from src.domain.Workout.models import WorkoutModel
 from src.domain.Activity.schemas import Activity, ActivityExercise, ActivitySet, ActivityWorkout
-from src.domain.Exercise.schemas import Exercise, Unit
+from src.domain.Exercise.schemas import Unit
+from src.domain.Exercise.repository import exercise_cache
+from src.domain.LogEntry.models import LogEntryModel, LogEntryActivityModel
+from src.domain.Stats.repository import DailyMetricsRepository
+
+# Columns of the rows yielded by ActivityRepository.iter_set_rows
+SET_ROW_COLUMNS = (
+    "set_id", "activity_id", "activity_time", "workout_id", "workout_name",
+    "position", "exercise_id", "exercise_name", "movement_pattern_id", "movement_pattern_name",
+    "set_number", "reps", "weight", "unit", "rir", "notes",
+)
 
 
 class ActivityRepository:
@@ -9,8 +24,12 @@ class ActivityRepository:
         self.db = db
 
     def _model_to_schema(self, model: ActivityModel) -> Activity:
+        exercise_by_id = exercise_cache.get_many(self.db, [ex.exercise_id for ex in model.exercises])
         exercises = []
         for ex in model.exercises:
+            # Skip if exercise was deleted (orphaned reference)
+            if ex.exercise_id not in exercise_by_id:
+                continue
             sets = []
             for s in ex.sets:
                 sets.append(ActivitySet(
@@ -22,16 +41,9 @@ class ActivityRepository:
                     notes=s.notes
                 ))
             
-            exercise = Exercise(
-                id=ex.exercise.id,
-                name=ex.exercise.name,
-                movement_pattern_id=ex.exercise.movement_pattern_id,
-                notes=ex.exercise.notes
-            )
-            
             exercises.append(ActivityExercise(
                 id=ex.id,
-                exercise=exercise,
+                exercise=exercise_by_id[ex.exercise_id],
                 position=ex.position,
                 session_notes=ex.session_notes,
                 sets=sets
@@ -55,14 +67,24 @@ class ActivityRepository:
             exercises=exercises
         )
 
+    def _load_options(self) -> tuple:
+        """Eager loads for everything _model_to_schema reads, in a fixed number of queries.
+        Exercises come from exercise_cache instead.
+        """
+        return (
+            joinedload(ActivityModel.workout),
+            selectinload(ActivityModel.exercises).selectinload(ActivityExerciseModel.sets),
+        )
+
     def get_by_id(self, activity_id: int) -> Activity | None:
-        model = self.db.query(ActivityModel).filter(ActivityModel.id == activity_id).first()
+        model = self.db.query(ActivityModel).options(*self._load_options()).filter(ActivityModel.id == activity_id).first()
         if model is None:
             return None
         return self._model_to_schema(model)
 
     def get_all(self) -> list[Activity]:
-        models = self.db.query(ActivityModel).all()
+        models = self.db.query(ActivityModel).options(*self._load_options()).all()
+        exercise_cache.get_many(self.db, (ex.exercise_id for m in models for ex in m.exercises))
         return [self._model_to_schema(m) for m in models]
 
     def create(self, time, workout_id: int | None, notes: str | None, exercises: list[dict]) -> Activity:
@@ -73,38 +95,57 @@ class ActivityRepository:
             "sets": [{"reps": int, "weight": float, "unit": str | None, "rir": int | None, "notes": str | None}]
         }
         """
-        model = ActivityModel(
-            workout_id=workout_id,
-            time=time,
-            notes=notes
+        activity_id = self.insert_activity(time, workout_id, notes, exercises)
+        self.db.commit()
+        return self.get_by_id(activity_id)
+
+    def insert_activity(self, time, workout_id: int | None, notes: str | None, exercises: list[dict]) -> int:
+        """Insert an activity with its exercises and sets, without committing. Returns the new id.
+        Takes one statement per table however many exercises there are; exercises as for create().
+        """
+        activity_id = self.db.execute(
+            insert(ActivityModel).returning(ActivityModel.id),
+            {"workout_id": workout_id, "time": time, "notes": notes}
+        ).scalar_one()
+        self._insert_exercises(activity_id, exercises)
+        return activity_id
+
+    def _insert_exercises(self, activity_id: int, exercises: list[dict]) -> None:
+        if not exercises:
+            return
+        # A multi-row INSERT ... RETURNING doesn't promise to return rows in order,
+        # so each new id is matched back to its exercise by position
+        result = self.db.execute(
+            insert(ActivityExerciseModel).execution_options(render_nulls=True).returning(
+                ActivityExerciseModel.id, ActivityExerciseModel.position
+            ),
+            [
+                {
+                    "activity_id": activity_id,
+                    "exercise_id": ex_data["exercise_id"],
+                    "position": position,
+                    "session_notes": ex_data.get("session_notes"),
+                }
+                for position, ex_data in enumerate(exercises)
+            ]
         )
-        self.db.add(model)
-        self.db.flush()
-        
-        for position, ex_data in enumerate(exercises):
-            ex_model = ActivityExerciseModel(
-                activity_id=model.id,
-                exercise_id=ex_data["exercise_id"],
-                position=position,
-                session_notes=ex_data.get("session_notes")
-            )
-            self.db.add(ex_model)
-            self.db.flush()
-            
-            for set_data in ex_data.get("sets", []):
-                set_model = ActivitySetModel(
-                    activity_exercise_id=ex_model.id,
-                    reps=set_data["reps"],
-                    weight=set_data["weight"],
-                    unit=set_data.get("unit"),
-                    rir=set_data.get("rir"),
-                    notes=set_data.get("notes")
-                )
-                self.db.add(set_model)
+        ids_by_position = {position: ex_id for ex_id, position in result}
         
-        self.db.commit()
-        self.db.refresh(model)
-        return self._model_to_schema(model)
+        set_rows = [
+            {
+                "activity_exercise_id": ids_by_position[position],
+                "reps": set_data["reps"],
+                "weight": set_data["weight"],
+                "unit": set_data.get("unit"),
+                "rir": set_data.get("rir"),
+                "notes": set_data.get("notes"),
+            }
+            for position, ex_data in enumerate(exercises)
+            for set_data in ex_data.get("sets", [])
+        ]
+        if set_rows:
+            # render_nulls keeps rows that differ only in which columns are null in one executemany
+            self.db.execute(insert(ActivitySetModel).execution_options(render_nulls=True), set_rows)
 
     def update(self, activity_id: int, time, workout_id: int | None, notes: str | None, exercises: list[dict]) -> Activity | None:
         model = self.db.query(ActivityModel).filter(ActivityModel.id == activity_id).first()
@@ -115,37 +156,24 @@ class ActivityRepository:
         model.time = time
         model.notes = notes
         
-        # Delete existing exercises and sets
-        for ex in model.exercises:
-            for s in ex.sets:
-                self.db.delete(s)
-            self.db.delete(ex)
-        
-        # Add new exercises and sets
-        for position, ex_data in enumerate(exercises):
-            ex_model = ActivityExerciseModel(
-                activity_id=model.id,
-                exercise_id=ex_data["exercise_id"],
-                position=position,
-                session_notes=ex_data.get("session_notes")
-            )
-            self.db.add(ex_model)
-            self.db.flush()
-            
-            for set_data in ex_data.get("sets", []):
-                set_model = ActivitySetModel(
-                    activity_exercise_id=ex_model.id,
-                    reps=set_data["reps"],
-                    weight=set_data["weight"],
-                    unit=set_data.get("unit"),
-                    rir=set_data.get("rir"),
-                    notes=set_data.get("notes")
-                )
-                self.db.add(set_model)
+        # Replace exercises and sets with set-wise deletes and inserts
+        self.db.execute(
+            delete(ActivitySetModel)
+            .where(ActivitySetModel.activity_exercise_id.in_(
+                select(ActivityExerciseModel.id).where(ActivityExerciseModel.activity_id == activity_id)
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        self.db.execute(
+            delete(ActivityExerciseModel)
+            .where(ActivityExerciseModel.activity_id == activity_id)
+            .execution_options(synchronize_session=False)
+        )
+        self._insert_exercises(activity_id, exercises)
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.log_entry_activities.any(LogEntryActivityModel.activity_id == activity_id))
         self.db.commit()
-        self.db.refresh(model)
-        return self._model_to_schema(model)
+        return self.get_by_id(activity_id)
 
     def delete(self, activity_id: int) -> Activity | None:
         model = self.db.query(ActivityModel).filter(ActivityModel.id == activity_id).first()
@@ -153,6 +181,7 @@ class ActivityRepository:
             return None
         activity = self._model_to_schema(model)
         self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.log_entry_activities.any(LogEntryActivityModel.activity_id == activity_id))
         self.db.commit()
         return activity
 
@@ -161,6 +190,53 @@ class ActivityRepository:
         activities = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
         return activities
 
+    def iter_set_rows(self, chunk_size: int) -> Iterator[list[tuple]]:
+        """Yield every set as a flat SET_ROW_COLUMNS tuple, chunk_size rows at a time, ordered by
+        activity time, exercise position and set. The rows come from a single join streamed off
+        one cursor; no ORM objects are built.
+        """
+        query = (
+            select(
+                ActivitySetModel.id,
+                ActivityModel.id,
+                ActivityModel.time,
+                WorkoutModel.id,
+                WorkoutModel.name,
+                ActivityExerciseModel.position,
+                ExerciseModel.id,
+                ExerciseModel.name,
+                MovementPatternModel.id,
+                MovementPatternModel.name,
+                ActivitySetModel.reps,
+                ActivitySetModel.weight,
+                ActivitySetModel.unit,
+                ActivitySetModel.rir,
+                ActivitySetModel.notes,
+                ActivityExerciseModel.id,
+            )
+            .select_from(ActivitySetModel)
+            .join(ActivityExerciseModel, ActivityExerciseModel.id == ActivitySetModel.activity_exercise_id)
+            .join(ActivityModel, ActivityModel.id == ActivityExerciseModel.activity_id)
+            .outerjoin(ExerciseModel, ExerciseModel.id == ActivityExerciseModel.exercise_id)
+            .outerjoin(MovementPatternModel, MovementPatternModel.id == ExerciseModel.movement_pattern_id)
+            .outerjoin(WorkoutModel, WorkoutModel.id == ActivityModel.workout_id)
+            .order_by(ActivityModel.time, ActivityModel.id, ActivityExerciseModel.position, ActivitySetModel.id)
+        )
+        # Executed on the session's connection rather than the session, which skips ORM row processing
+        result = self.db.connection().execute(query.execution_options(yield_per=chunk_size))
+        # Sets are numbered within their activity exercise, in the order they were logged
+        current_exercise, set_number = None, 0
+        for rows in result.partitions():
+            chunk = []
+            for *columns, activity_exercise_id in rows:
+                if activity_exercise_id != current_exercise:
+                    current_exercise, set_number = activity_exercise_id, 0
+                set_number += 1
+                # isoformat() like the API and the activities export, fractional seconds included
+                columns[2] = columns[2].isoformat()
+                chunk.append((*columns[:10], set_number, *columns[10:]))
+            yield chunk
@@ -5,6 +5,8 @@ from src.domain.Cardio.schemas import (
     InclineWalking, Sprints, Walking, Running, Cycling, Swimming, Other
 )
 from src.api.schemas import CardioRequest
+from src.domain.LogEntry.models import LogEntryModel, LogEntryCardioModel
+from src.domain.Stats.repository import DailyMetricsRepository
 
 
 class CardioRepository:
@@ -67,6 +69,9 @@ class CardioRepository:
         model.exercise_type = cardio.exercise.type
         model.exercise_data = cardio.exercise.model_dump()
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(
+            LogEntryModel.log_entry_cardios.any(LogEntryCardioModel.cardio_id == cardio_id)
+        )
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -77,6 +82,9 @@ class CardioRepository:
             return None
         cardio = self._model_to_schema(model)
         self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(
+            LogEntryModel.log_entry_cardios.any(LogEntryCardioModel.cardio_id == cardio_id)
+        )
         self.db.commit()
         return cardio
 
@@ -85,6 +93,7 @@ class CardioRepository:
         cardios = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
         return cardios
 
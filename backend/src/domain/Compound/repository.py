@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from src.domain.Compound.models import CompoundModel
 from src.domain.Compound.schemas import Compound, CompoundUnit
+from src.reference_cache import ReferenceCache
 
 
 class CompoundRepository:
@@ -15,10 +16,7 @@ class CompoundRepository:
         )
 
     def get_by_id(self, compound_id: int) -> Compound | None:
-        model = self.db.query(CompoundModel).filter(CompoundModel.id == compound_id).first()
-        if model is None:
-            return None
-        return self._model_to_schema(model)
+        return compound_cache.get(self.db, compound_id)
 
     def get_all(self) -> list[Compound]:
         models = self.db.query(CompoundModel).all()
@@ -43,6 +41,7 @@ class CompoundRepository:
         model.unit = unit.value
         
         self.db.commit()
+        compound_cache.invalidate([compound_id])
         self.db.refresh(model)
         return self._model_to_schema(model)
 
@@ -53,6 +52,7 @@ class CompoundRepository:
         compound = self._model_to_schema(model)
         self.db.delete(model)
         self.db.commit()
+        compound_cache.invalidate([compound_id])
         return compound
 
     def delete_all(self) -> list[Compound]:
@@ -61,5 +61,8 @@ class CompoundRepository:
         for model in models:
             self.db.delete(model)
         self.db.commit()
+        compound_cache.invalidate()
         return compounds
 
+
+compound_cache = ReferenceCache("compounds", CompoundModel, lambda db, model: CompoundRepository(db)._model_to_schema(model))
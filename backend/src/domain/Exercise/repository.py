@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from src.domain.Exercise.models import ExerciseModel
 from src.domain.Exercise.schemas import Exercise
+from src.reference_cache import ReferenceCache
 
 
 class ExerciseRepository:
@@ -16,10 +17,7 @@ class ExerciseRepository:
         )
 
     def get_by_id(self, exercise_id: int) -> Exercise | None:
-        model = self.db.query(ExerciseModel).filter(ExerciseModel.id == exercise_id).first()
-        if model is None:
-            return None
-        return self._model_to_schema(model)
+        return exercise_cache.get(self.db, exercise_id)
 
     def get_all(self) -> list[Exercise]:
         models = self.db.query(ExerciseModel).all()
@@ -52,6 +50,7 @@ class ExerciseRepository:
         model.notes = notes
         
         self.db.commit()
+        exercise_cache.invalidate([exercise_id])
         self.db.refresh(model)
         return self._model_to_schema(model)
 
@@ -62,6 +61,7 @@ class ExerciseRepository:
         exercise = self._model_to_schema(model)
         self.db.delete(model)
         self.db.commit()
+        exercise_cache.invalidate([exercise_id])
         return exercise
 
     def delete_all(self) -> list[Exercise]:
@@ -70,4 +70,8 @@ class ExerciseRepository:
         for model in models:
             self.db.delete(model)
         self.db.commit()
+        exercise_cache.invalidate()
         return exercises
+
+
+exercise_cache = ReferenceCache("exercises", ExerciseModel, lambda db, model: ExerciseRepository(db)._model_to_schema(model))
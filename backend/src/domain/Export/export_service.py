@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+from typing import Iterator
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload, joinedload
+from src.database import SessionLocal
+from src.domain.Export.schemas import ExportDataset, ExportFormat
+from src.domain.LogEntry.repository import LogEntryRepository
+from src.domain.LogEntry.schemas import LogEntry
+from src.domain.Food.models import FoodModel
+from src.domain.Food.repository import FoodRepository
+from src.domain.Food.schemas import Food
+from src.domain.Meal.models import MealModel
+from src.domain.Meal.repository import MealRepository
+from src.domain.Meal.schemas import Meal
+from src.domain.Exercise.models import ExerciseModel
+from src.domain.Exercise.repository import ExerciseRepository
+from src.domain.Exercise.schemas import Exercise
+from src.domain.Workout.models import WorkoutModel, WorkoutItemModel
+from src.domain.Workout.repository import WorkoutRepository
+from src.domain.Workout.schemas import Workout
+from src.domain.Activity.models import ActivityModel, ActivityExerciseModel
+from src.domain.Activity.repository import ActivityRepository, SET_ROW_COLUMNS
+from src.domain.Activity.schemas import Activity
+from src.domain.Cardio.models import CardioModel
+from src.domain.Cardio.repository import CardioRepository
+from src.domain.Cardio.schemas import Cardio
+from src.domain.Sleep.models import SleepModel
+from src.domain.Sleep.repository import SleepRepository
+from src.domain.Sleep.schemas import Sleep
+from src.domain.Stress.models import StressModel
+from src.domain.Stress.repository import StressRepository
+from src.domain.Stress.schemas import Stress
+from src.domain.Hydration.models import HydrationModel
+from src.domain.Hydration.repository import HydrationRepository
+from src.domain.Hydration.schemas import Hydration
+from src.domain.Supplement.models import SupplementModel
+from src.domain.Supplement.repository import SupplementRepository
+from src.domain.Supplement.schemas import Supplement
+from src.domain.Phase.models import PhaseModel
+from src.domain.Phase.repository import PhaseRepository
+from src.domain.Phase.schemas import Phase
+
+# Rows fetched from the cursor, converted and written out at a time
+EXPORT_CHUNK_SIZE = 500
+# Flat datasets come straight from SQL rows, which are much cheaper per row than schemas
+FLAT_EXPORT_CHUNK_SIZE = 5000
+
+
+def _stream_models(db: Session, model_cls, to_schema, *options) -> Iterator[list[BaseModel]]:
+    """Yield schemas for every row of model_cls in id order, EXPORT_CHUNK_SIZE at a time.
+    Ids are streamed from a single cursor and each chunk is then loaded with options, which should
+    eager load whatever to_schema reads. (yield_per can't be combined with eager loading of ordered
+    collections such as ActivityModel.exercises.)
+    """
+    ids = db.scalars(select(model_cls.id).order_by(model_cls.id), execution_options={"yield_per": EXPORT_CHUNK_SIZE})
+    for chunk_ids in ids.partitions():
+        models = db.scalars(
+            select(model_cls).where(model_cls.id.in_(chunk_ids)).options(*options).order_by(model_cls.id)
+        ).all()
+        yield [to_schema(m) for m in models]
+
+
+def _csv_value(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+class ExportService:
+    def _chunks(self, db: Session, dataset: ExportDataset) -> tuple[type[BaseModel], Iterator[list[BaseModel]]]:
+        """The schema of a dataset and its rows in chunks"""
+        if dataset == ExportDataset.LOG_ENTRIES:
+            return LogEntry, LogEntryRepository(db).iter_all(EXPORT_CHUNK_SIZE)
+        if dataset == ExportDataset.FOODS:
+            return Food, _stream_models(db, FoodModel, FoodRepository(db)._model_to_schema)
+        if dataset == ExportDataset.MEALS:
+            return Meal, _stream_models(
+                db, MealModel, MealRepository(db)._model_to_schema,
+                selectinload(MealModel.meal_foods)
+            )
+        if dataset == ExportDataset.EXERCISES:
+            return Exercise, _stream_models(db, ExerciseModel, ExerciseRepository(db)._model_to_schema)
+        if dataset == ExportDataset.WORKOUTS:
+            return Workout, _stream_models(
+                db, WorkoutModel, WorkoutRepository(db)._model_to_schema,
+                selectinload(WorkoutModel.items).joinedload(WorkoutItemModel.movement_pattern)
+            )
+        if dataset == ExportDataset.ACTIVITIES:
+            return Activity, _stream_models(
+                db, ActivityModel, ActivityRepository(db)._model_to_schema,
+                joinedload(ActivityModel.workout),
+                selectinload(ActivityModel.exercises).selectinload(ActivityExerciseModel.sets)
+            )
+        if dataset == ExportDataset.CARDIO:
+            return Cardio, _stream_models(db, CardioModel, CardioRepository(db)._model_to_schema)
+        if dataset == ExportDataset.SLEEP:
+            return Sleep, _stream_models(db, SleepModel, SleepRepository(db)._model_to_schema)
+        if dataset == ExportDataset.STRESS:
+            return Stress, _stream_models(db, StressModel, StressRepository(db)._model_to_schema)
+        if dataset == ExportDataset.HYDRATION:
+            return Hydration, _stream_models(db, HydrationModel, HydrationRepository(db)._model_to_schema)
+        if dataset == ExportDataset.SUPPLEMENTS:
+            return Supplement, _stream_models(
+                db, SupplementModel, SupplementRepository(db)._model_to_schema,
+                selectinload(SupplementModel.supplement_compounds)
+            )
+        return Phase, _stream_models(db, PhaseModel, PhaseRepository(db)._model_to_schema)
+
+    def _stream_rows(self, columns, chunks: Iterator[list[tuple]], export_format: ExportFormat) -> Iterator[str]:
+        """Write flat rows as NDJSON objects or CSV rows, one chunk of text per chunk of rows"""
+        if export_format == ExportFormat.NDJSON:
+            for chunk in chunks:
+                yield "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in chunk)
+            return
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def stream(self, dataset: ExportDataset, export_format: ExportFormat) -> Iterator[str]:
+        """Yield a dataset as NDJSON lines or CSV rows, one chunk of text per chunk of rows.
+        CSV has one column per top-level schema field, with nested values written as JSON;
+        flat datasets such as training sets have plain columns in either format.
+        The generator opens its own session, since it is still running after the request handler returns.
+        """
+        db = SessionLocal()
+        try:
+            if dataset == ExportDataset.TRAINING_SETS:
+                chunks = ActivityRepository(db).iter_set_rows(FLAT_EXPORT_CHUNK_SIZE)
+                yield from self._stream_rows(SET_ROW_COLUMNS, chunks, export_format)
+                return
+
+            schema_cls, chunks = self._chunks(db, dataset)
+            if export_format == ExportFormat.NDJSON:
+                for chunk in chunks:
+                    yield "".join(item.model_dump_json() + "\n" for item in chunk)
+                return
+
+            columns = list(schema_cls.model_fields)
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for chunk in chunks:
+                for item in chunk:
+                    row = item.model_dump(mode="json")
+                    writer.writerow([_csv_value(row[column]) for column in columns])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+        finally:
+            db.close()
@@ -0,0 +1,23 @@
+from enum import Enum
+
+
+class ExportDataset(str, Enum):
+    LOG_ENTRIES = "log-entries"
+    FOODS = "foods"
+    MEALS = "meals"
+    EXERCISES = "exercises"
+    WORKOUTS = "workouts"
+    ACTIVITIES = "activities"
+    CARDIO = "cardio"
+    SLEEP = "sleep"
+    STRESS = "stress"
+    HYDRATION = "hydration"
+    SUPPLEMENTS = "supplements"
+    PHASES = "phases"
+    # One flat row per set, joined with its exercise, movement pattern, activity and workout
+    TRAINING_SETS = "training-sets"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -14,6 +14,9 @@ class FoodService:
     def get_all_foods(self) -> list[Food]:
         return self.repository.get_all()
 
+    def search_foods(self, query: str, limit: int) -> list[Food]:
+        return self.repository.search(query, limit)
+
     def create_food(self, food: FoodRequest) -> Food:
         return self.repository.create(food)
 
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from src.domain.Food.models import FoodModel
 from src.domain.Food.schemas import Food, Protein, Carbs, Fat, AminoAcid
+from src.domain.Food.search import index_food, search_food_ids, unindex_food
 from src.api.schemas import FoodRequest
+from src.domain.LogEntry.models import LogEntryModel, LogEntryFoodModel
+from src.domain.Stats.repository import DailyMetricsRepository
+from src.reference_cache import ReferenceCache
 
 
 class FoodRepository:
@@ -42,15 +46,17 @@ class FoodRepository:
         )
 
     def get_by_id(self, food_id: int) -> Food | None:
-        model = self.db.query(FoodModel).filter(FoodModel.id == food_id).first()
-        if model is None:
-            return None
-        return self._model_to_schema(model)
+        return food_cache.get(self.db, food_id)
 
     def get_all(self) -> list[Food]:
         models = self.db.query(FoodModel).all()
         return [self._model_to_schema(m) for m in models]
 
+    def search(self, query: str, limit: int) -> list[Food]:
+        food_ids = search_food_ids(self.db, query, limit)
+        foods = food_cache.get_many(self.db, food_ids)
+        return [foods[food_id] for food_id in food_ids if food_id in foods]
+
     def create(self, food: FoodRequest) -> Food:
         amino_acids_json = None
         if food.protein.amino_acids:
@@ -76,6 +82,8 @@ class FoodRepository:
             fat_cholesterol=food.fat.cholesterol
         )
         self.db.add(model)
+        self.db.flush()
+        index_food(self.db, model.id, model.name)
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -106,8 +114,11 @@ class FoodRepository:
         model.fat_polyunsaturated = food.fat.polyunsaturated
         model.fat_trans = food.fat.trans
         model.fat_cholesterol = food.fat.cholesterol
+        index_food(self.db, food_id, food.name)
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.log_entry_foods.any(LogEntryFoodModel.food_id == food_id))
         self.db.commit()
+        food_cache.invalidate([food_id])
         self.db.refresh(model)
         return self._model_to_schema(model)
 
@@ -117,7 +128,10 @@ class FoodRepository:
             return None
         food = self._model_to_schema(model)
         self.db.delete(model)
+        unindex_food(self.db, food_id)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.log_entry_foods.any(LogEntryFoodModel.food_id == food_id))
         self.db.commit()
+        food_cache.invalidate([food_id])
         return food
 
     def delete_all(self) -> list[Food]:
@@ -125,5 +139,11 @@ class FoodRepository:
         foods = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        unindex_food(self.db)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
+        food_cache.invalidate()
         return foods
+
+
+food_cache = ReferenceCache("foods", FoodModel, lambda db, model: FoodRepository(db)._model_to_schema(model))
@@ -0,0 +1,181 @@
+"""Typeahead search over the food catalog.
+Names are indexed in an SQLite FTS5 table (food_search, rowid = food id) that FoodRepository keeps in
+sync with foods. A query fetches a bounded set of prefix matches from the index and ranks them here,
+together with every matching food that has been logged, boosted by how often and how recently.
+"""
+import math
+import re
+import unicodedata
+from datetime import date
+from threading import Lock
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from src.database import data_version
+from src.domain.LogEntry.models import LogEntryModel, LogEntryFoodModel
+from .models import FoodModel
+
+SEARCH_TABLE = "food_search"
+
+# Same folding as the Python tokenizer below: case-insensitive, accents ignored ("haagen" finds "Häagen").
+# The prefix indexes make one to three letter prefix queries, the typical typeahead input, cheap:
+# without them a one letter query has to merge the postings of every word starting with that letter.
+CREATE_SEARCH_TABLE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+    "USING fts5(name, tokenize='unicode61 remove_diacritics 2', prefix='1 2 3')"
+)
+
+# Max rows taken from the index per scan. Ranking every match of a one letter query would read most
+# of the catalog; a bounded scan stays in the low milliseconds and the list narrows as the user types.
+CANDIDATE_LIMIT = 200
+
+# Usage boost: log1p(times logged) * FREQUENCY_WEIGHT, plus RECENCY_WEIGHT halving every
+# RECENCY_HALF_LIFE_DAYS since the food was last logged
+FREQUENCY_WEIGHT = 1.0
+RECENCY_WEIGHT = 2.0
+RECENCY_HALF_LIFE_DAYS = 30
+
+# Tables the usage statistics are computed from
+USAGE_TABLES = ("foods", "log_entry_foods", "log_entries")
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(value: str) -> list[str]:
+    """Lowercased, accent-stripped words of value, split like the index's unicode61 tokenizer"""
+    if not value.isascii():
+        decomposed = unicodedata.normalize("NFKD", value)
+        value = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _TOKEN.findall(value.casefold())
+
+
+def match_expression(tokens: list[str], initial: bool = False) -> str:
+    """FTS5 query matching names that contain a word starting with each token.
+    With initial, the first token must also start the name. Tokens only hold word characters,
+    so quoting them is enough to keep FTS5 syntax out of user input.
+    """
+    terms = [f'"{token}"*' for token in tokens]
+    if initial:
+        terms[0] = "^" + terms[0]
+    return " ".join(terms)
+
+
+def matches(name_tokens: list[str], tokens: list[str]) -> bool:
+    return all(any(word.startswith(token) for word in name_tokens) for token in tokens)
+
+
+def score(name: str, tokens: list[str], usage: tuple[int, date | None] | None, today: date) -> float:
+    """Relevance of a matching name: whole-word matches, the name starting with the query and shorter
+    names rank higher, then foods logged often and recently get a boost on top.
+    """
+    name_tokens = tokenize(name)
+    result = sum(1.0 for token in tokens if token in name_tokens)
+    if name_tokens and name_tokens[0].startswith(tokens[0]):
+        result += 2.0
+    result += 1.0 / (1 + len(name_tokens))
+    if usage is not None:
+        uses, last_used = usage
+        result += FREQUENCY_WEIGHT * math.log1p(uses)
+        if last_used is not None:
+            days = max((today - last_used).days, 0)
+            result += RECENCY_WEIGHT * 0.5 ** (days / RECENCY_HALF_LIFE_DAYS)
+    return result
+
+
+class FoodUsageCache:
+    """Per-food usage statistics (times logged, last date logged, tokenized name) for foods that have
+    been logged at least once. Recomputed with one aggregate query after a write to any usage table.
+    """
+    def __init__(self):
+        self._version: tuple[int, ...] | None = None
+        self._usage: dict[int, tuple[int, date | None, list[str]]] = {}
+        self._lock = Lock()
+
+    def get(self, db: Session) -> dict[int, tuple[int, date | None, list[str]]]:
+        version = data_version(USAGE_TABLES)
+        with self._lock:
+            if version != self._version:
+                rows = db.execute(
+                    select(FoodModel.id, FoodModel.name, func.count(), func.max(LogEntryModel.entry_date))
+                    .join(LogEntryFoodModel, LogEntryFoodModel.food_id == FoodModel.id)
+                    .join(LogEntryModel, LogEntryModel.id == LogEntryFoodModel.log_entry_id)
+                    .group_by(FoodModel.id)
+                ).all()
+                self._usage = {food_id: (uses, last_used, tokenize(name)) for food_id, name, uses, last_used in rows}
+                self._version = version
+            return self._usage
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version = None
+            self._usage = {}
+
+
+food_usage_cache = FoodUsageCache()
+
+
+def is_supported(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def ensure_search_index(db: Session) -> None:
+    """Create the index if missing and rebuild it from foods if it has drifted (e.g. a database restored
+    from a copy made before the index existed). Does nothing on databases without FTS5.
+    """
+    if not is_supported(db):
+        return
+    db.execute(text(CREATE_SEARCH_TABLE))
+    indexed = db.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE}")).scalar()
+    foods = db.execute(select(func.count()).select_from(FoodModel)).scalar()
+    if indexed != foods:
+        db.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+        db.execute(text(f"INSERT INTO {SEARCH_TABLE}(rowid, name) SELECT id, name FROM foods"))
+    db.commit()
+
+
+def index_food(db: Session, food_id: int, name: str) -> None:
+    if is_supported(db):
+        db.execute(text(f"INSERT OR REPLACE INTO {SEARCH_TABLE}(rowid, name) VALUES (:id, :name)"), {"id": food_id, "name": name})
+
+
+def unindex_food(db: Session, food_id: int | None = None) -> None:
+    """Remove one food from the index, or every food if food_id is None"""
+    if not is_supported(db):
+        return
+    if food_id is None:
+        db.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    else:
+        db.execute(text(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = :id"), {"id": food_id})
+
+
+def search_food_ids(db: Session, query: str, limit: int) -> list[int]:
+    """Ids of the best matches for query, best first"""
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+
+    usage = food_usage_cache.get(db)
+    candidates: dict[int, str] = {}
+    if is_supported(db):
+        # Names starting with the query first, so the bounded scans don't cut them off
+        for initial in (True, False):
+            rows = db.execute(
+                text(f"SELECT rowid, name FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :q LIMIT :n"),
+                {"q": match_expression(tokens, initial), "n": CANDIDATE_LIMIT},
+            ).all()
+            candidates.update((food_id, name) for food_id, name in rows)
+    else:
+        conditions = [FoodModel.name.ilike(f"%{token}%") for token in tokens]
+        rows = db.execute(select(FoodModel.id, FoodModel.name).where(*conditions).limit(CANDIDATE_LIMIT)).all()
+        candidates.update((food_id, name) for food_id, name in rows if matches(tokenize(name), tokens))
+
+    today = date.today()
+    scores = {}
+    for food_id, name in candidates.items():
+        entry = usage.get(food_id)
+        scores[food_id] = score(name, tokens, entry[:2] if entry else None, today)
+    # Logged foods are matched here rather than trusted to the scans, which may have stopped before them
+    for food_id, (uses, last_used, name_tokens) in usage.items():
+        if food_id not in scores and matches(name_tokens, tokens):
+            scores[food_id] = score(" ".join(name_tokens), tokens, (uses, last_used), today)
+
+    return sorted(scores, key=lambda food_id: (-scores[food_id], food_id))[:limit]
@@ -1,6 +1,9 @@
 from sqlalchemy.orm import Session
 from src.domain.Hydration.models import HydrationModel, CupModel
 from src.domain.Hydration.schemas import Hydration, Cup, HydrationUnit
+from src.domain.LogEntry.models import LogEntryModel, LogEntryHydrationModel
+from src.domain.Stats.repository import DailyMetricsRepository
+from src.reference_cache import ReferenceCache
 
 
 class CupRepository:
@@ -16,10 +19,7 @@ class CupRepository:
         )
 
     def get_by_id(self, cup_id: int) -> Cup | None:
-        model = self.db.query(CupModel).filter(CupModel.id == cup_id).first()
-        if model is None:
-            return None
-        return self._model_to_schema(model)
+        return cup_cache.get(self.db, cup_id)
 
     def get_all(self) -> list[Cup]:
         models = self.db.query(CupModel).all()
@@ -36,6 +36,12 @@ class CupRepository:
         self.db.refresh(model)
         return self._model_to_schema(model)
 
+    def _mark_stats_dirty(self, cup_id: int) -> None:
+        """Flag the days whose hydration totals use this cup"""
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.log_entry_hydrations.any(
+            LogEntryHydrationModel.hydration.has(HydrationModel.cup_id == cup_id)
+        ))
+
     def update(self, cup_id: int, name: str, amount: float, unit: HydrationUnit) -> Cup | None:
         model = self.db.query(CupModel).filter(CupModel.id == cup_id).first()
         if model is None:
@@ -45,7 +51,9 @@ class CupRepository:
         model.amount = amount
         model.unit = unit.value
         
+        self._mark_stats_dirty(cup_id)
         self.db.commit()
+        cup_cache.invalidate([cup_id])
         self.db.refresh(model)
         return self._model_to_schema(model)
 
@@ -55,7 +63,9 @@ class CupRepository:
             return None
         cup = self._model_to_schema(model)
         self.db.delete(model)
+        self._mark_stats_dirty(cup_id)
         self.db.commit()
+        cup_cache.invalidate([cup_id])
         return cup
 
     def delete_all(self) -> list[Cup]:
@@ -63,25 +73,24 @@ class CupRepository:
         cups = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
+        cup_cache.invalidate()
         return cups
 
 
+cup_cache = ReferenceCache("cups", CupModel, lambda db, model: CupRepository(db)._model_to_schema(model))
+
+
 class HydrationRepository:
     def __init__(self, db: Session):
         self.db = db
 
     def _model_to_schema(self, model: HydrationModel) -> Hydration:
-        cup = Cup(
-            id=model.cup.id,
-            name=model.cup.name,
-            amount=model.cup.amount,
-            unit=HydrationUnit(model.cup.unit)
-        )
         return Hydration(
             id=model.id,
             timestamp=model.timestamp,
-            cup=cup,
+            cup=cup_cache.get(self.db, model.cup_id),
             servings=model.servings
         )
 
@@ -115,6 +124,9 @@ class HydrationRepository:
         model.cup_id = cup_id
         model.servings = servings
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(
+            LogEntryModel.log_entry_hydrations.any(LogEntryHydrationModel.hydration_id == hydration_id)
+        )
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -125,6 +137,9 @@ class HydrationRepository:
             return None
         hydration = self._model_to_schema(model)
         self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(
+            LogEntryModel.log_entry_hydrations.any(LogEntryHydrationModel.hydration_id == hydration_id)
+        )
         self.db.commit()
         return hydration
 
@@ -133,5 +148,6 @@ class HydrationRepository:
         hydrations = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
         return hydrations
@@ -1,18 +1,72 @@
+import csv
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from src.domain.LogEntry.schemas import LogEntry
+from src.domain.LogEntry.schemas import LogEntry, LogEntryImportError, LogEntryImportResult
 from src.domain.LogEntry.repository import LogEntryRepository
-from src.api.schemas import LogEntryRequest
+from src.api.schemas import LogEntryRequest, LogEntryPatchRequest
+
+# Rows validated and inserted per transaction during a bulk import
+IMPORT_BATCH_SIZE = 1000
+
+# LogEntryRequest fields whose CSV cells hold JSON; the other columns are plain values
+CSV_JSON_FIELDS = {"phase", "sleep", "hydration", "foods", "activities", "cardio", "supplements", "stress"}
+
+
+def _read_ndjson(lines: Iterable[str]) -> Iterator[tuple[int, dict | str]]:
+    """Yield (line number, object) per non-blank line, or (line number, error message)"""
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f"Invalid JSON: {e}"
+
+
+def _read_csv(lines: Iterable[str]) -> Iterator[tuple[int, dict | str]]:
+    """Yield (row number, object) per CSV row, or (row number, error message).
+    The header names LogEntryRequest fields; empty cells are left out.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        data = {}
+        try:
+            for field, value in row.items():
+                if field is None or value in (None, ""):
+                    continue
+                data[field] = json.loads(value) if field in CSV_JSON_FIELDS else value
+        except json.JSONDecodeError as e:
+            yield reader.line_num, f"Invalid JSON in column '{field}': {e}"
+            continue
+        yield reader.line_num, data
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+    )
 
 
 class LogEntryService:
-    def get_log_entry(self, db: Session, log_entry_id: int) -> LogEntry | None:
-        return LogEntryRepository(db).get_by_id(log_entry_id)
+    def get_log_entry(self, db: Session, log_entry_id: int, fields: set[str] | None = None) -> LogEntry | None:
+        return LogEntryRepository(db).get_by_id(log_entry_id, fields)
+
+    def get_all_log_entries(self, db: Session, fields: set[str] | None = None) -> list[LogEntry]:
+        return LogEntryRepository(db).get_all(fields)
+
+    def get_log_entries_in_range(self, db: Session, start: date, end: date, fields: set[str] | None = None) -> list[LogEntry]:
+        return LogEntryRepository(db).get_in_range(start, end, fields)
 
-    def get_all_log_entries(self, db: Session) -> list[LogEntry]:
-        return LogEntryRepository(db).get_all()
+    def get_log_entries_page(self, db: Session, after: tuple[datetime, int] | None, limit: int,
+                             fields: set[str] | None = None) -> tuple[list[LogEntry], bool]:
+        return LogEntryRepository(db).get_page(after, limit, fields)
 
-    def get_log_entry_by_date(self, db: Session, date_str: str) -> LogEntry | None:
-        return LogEntryRepository(db).get_by_date(date_str)
+    def get_log_entry_by_date(self, db: Session, date_str: str, fields: set[str] | None = None) -> LogEntry | None:
+        return LogEntryRepository(db).get_by_date(date_str, fields)
 
     def create_log_entry(self, db: Session, log_entry: LogEntryRequest) -> LogEntry:
         return LogEntryRepository(db).create(log_entry)
@@ -20,9 +74,65 @@ class LogEntryService:
     def update_log_entry(self, db: Session, log_entry_id: int, log_entry: LogEntryRequest) -> LogEntry | None:
         return LogEntryRepository(db).update(log_entry_id, log_entry)
 
+    def patch_log_entry(self, db: Session, log_entry_id: int, patch: LogEntryPatchRequest) -> LogEntry | None:
+        """Apply the patch and return the log entry with only the sections it changed loaded"""
+        repo = LogEntryRepository(db)
+        changed = repo.patch(log_entry_id, patch.operations)
+        if changed is None:
+            return None
+        return repo.get_by_id(log_entry_id, changed)
+
     def delete_log_entry(self, db: Session, log_entry_id: int) -> LogEntry | None:
         return LogEntryRepository(db).delete(log_entry_id)
 
     def delete_all_log_entries(self, db: Session) -> list[LogEntry]:
         return LogEntryRepository(db).delete_all()
 
+    def import_log_entries(self, db: Session, lines: Iterable[str], file_format: str) -> LogEntryImportResult:
+        """Validate and insert log entries from NDJSON lines or CSV rows, IMPORT_BATCH_SIZE per transaction.
+        Rows that fail to parse or validate are reported and skipped; the rest are still imported.
+        """
+        repo = LogEntryRepository(db)
+        rows = _read_csv(lines) if file_format == "csv" else _read_ndjson(lines)
+        ids: list[int] = []
+        errors: list[LogEntryImportError] = []
+        batch: list[tuple[int, LogEntryRequest]] = []
+        for line_no, data in rows:
+            if isinstance(data, str):
+                errors.append(LogEntryImportError(line=line_no, error=data))
+                continue
+            try:
+                batch.append((line_no, LogEntryRequest.model_validate(data)))
+            except ValidationError as e:
+                errors.append(LogEntryImportError(line=line_no, error=_format_validation_error(e)))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                self._import_batch(repo, batch, ids, errors)
+                batch = []
+        if batch:
+            self._import_batch(repo, batch, ids, errors)
+        errors.sort(key=lambda error: error.line)
+        return LogEntryImportResult(imported=len(ids), ids=ids, errors=errors)
+
+    def _import_batch(self, repo: LogEntryRepository, batch: list[tuple[int, LogEntryRequest]],
+                      ids: list[int], errors: list[LogEntryImportError]) -> None:
+        # SQLite doesn't enforce foreign keys by default, so check references explicitly
+        missing = repo.find_missing_references([log_entry for _, log_entry in batch])
+        for (line_no, _), message in zip(batch, missing):
+            if message:
+                errors.append(LogEntryImportError(line=line_no, error=message))
+        batch = [row for row, message in zip(batch, missing) if not message]
+        if not batch:
+            return
+        try:
+            ids.extend(repo.bulk_create([log_entry for _, log_entry in batch]))
+            return
+        except SQLAlchemyError:
+            repo.db.rollback()
+        # Retry row by row so only the offending rows are reported
+        for line_no, log_entry in batch:
+            try:
+                ids.extend(repo.bulk_create([log_entry]))
+            except SQLAlchemyError as e:
+                repo.db.rollback()
+                errors.append(LogEntryImportError(line=line_no, error=str(getattr(e, "orig", None) or e)))
+
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey
+from sqlalchemy.orm import relationship, validates
 from src.database import Base
 
 
@@ -8,7 +8,7 @@ class LogEntryFoodModel(Base):
     __tablename__ = "log_entry_foods"
 
     id = Column(Integer, primary_key=True, index=True)
-    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
     food_id = Column(Integer, ForeignKey('foods.id'), nullable=False)
     servings = Column(Float, nullable=False, default=1.0)
 
@@ -20,7 +20,7 @@ class LogEntrySupplementModel(Base):
     __tablename__ = "log_entry_supplements"
 
     id = Column(Integer, primary_key=True, index=True)
-    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
     supplement_id = Column(Integer, ForeignKey('supplements.id'), nullable=False)
     servings = Column(Float, nullable=False, default=1.0)
 
@@ -32,22 +32,44 @@ class LogEntryActivityModel(Base):
     __tablename__ = "log_entry_activities"
 
     id = Column(Integer, primary_key=True, index=True)
-    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
     activity_id = Column(Integer, ForeignKey('activities.id'), nullable=False)
 
     activity = relationship("ActivityModel")
 
 
+class LogEntryHydrationModel(Base):
+    """Junction table for log entry-hydration relationship"""
+    __tablename__ = "log_entry_hydrations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
+    hydration_id = Column(Integer, ForeignKey('hydration.id'), nullable=False, index=True)
+
+    hydration = relationship("HydrationModel")
+
+
+class LogEntryCardioModel(Base):
+    """Junction table for log entry-cardio relationship"""
+    __tablename__ = "log_entry_cardio"
+
+    id = Column(Integer, primary_key=True, index=True)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
+    cardio_id = Column(Integer, ForeignKey('cardio.id'), nullable=False, index=True)
+
+    cardio = relationship("CardioModel")
+
+
 class LogEntryModel(Base):
     __tablename__ = "log_entries"
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, nullable=False)
+    timestamp = Column(DateTime, nullable=False, index=True)
+    # Calendar date of timestamp, stored so per-day lookups and grouping can use an index
+    entry_date = Column(Date, nullable=False, index=True)
     phase_id = Column(Integer, ForeignKey('phases.id'), nullable=True)
     morning_weight = Column(Float, nullable=True)
     sleep_id = Column(Integer, ForeignKey('sleep.id'), nullable=True)
-    hydration_ids = Column(JSON, nullable=True)
-    cardio_ids = Column(JSON, nullable=True)  
     stress_id = Column(Integer, ForeignKey('stress.id'), nullable=True)
     num_standard_drinks = Column(Integer, nullable=True)
     notes = Column(String, nullable=True)
@@ -60,3 +82,11 @@ class LogEntryModel(Base):
     log_entry_supplements = relationship("LogEntrySupplementModel", cascade="all, delete-orphan")
     # Direct relationship to activities performed that day
     log_entry_activities = relationship("LogEntryActivityModel", cascade="all, delete-orphan")
+    # Hydration and cardio logged that day, in the order they were added
+    log_entry_hydrations = relationship("LogEntryHydrationModel", cascade="all, delete-orphan")
+    log_entry_cardios = relationship("LogEntryCardioModel", cascade="all, delete-orphan")
+
+    @validates("timestamp")
+    def _sync_entry_date(self, key, timestamp):
+        self.entry_date = timestamp.date()
+        return timestamp
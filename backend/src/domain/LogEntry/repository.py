@@ -1,31 +1,44 @@
-from sqlalchemy.orm import Session
-from src.domain.LogEntry.models import LogEntryModel, LogEntryFoodModel, LogEntrySupplementModel, LogEntryActivityModel
+from datetime import date, datetime
+from typing import Iterator
+from sqlalchemy import delete, func, insert, select, update, or_, and_
+from sqlalchemy.orm import Session, selectinload
+from src.database import IN_CHUNK_SIZE
+from src.domain.LogEntry.models import (
+    LogEntryModel, LogEntryFoodModel, LogEntrySupplementModel, LogEntryActivityModel,
+    LogEntryHydrationModel, LogEntryCardioModel,
+)
 from src.domain.LogEntry.schemas import LogEntry, LogEntrySupplement, LogEntryCarbCycle
 from src.domain.Phase.models import PhaseModel
 from src.domain.Phase.schemas import Phase
+from src.domain.Phase.repository import phase_cache
 from src.domain.Sleep.models import SleepModel
 from src.domain.Sleep.schemas import Sleep, Nap
 from src.domain.Hydration.models import HydrationModel, CupModel
-from src.domain.Hydration.schemas import Hydration, Cup, HydrationUnit
+from src.domain.Hydration.schemas import Hydration
+from src.domain.Hydration.repository import cup_cache
 from src.domain.Meal.schemas import MealFood
 from src.domain.Activity.models import ActivityModel, ActivityExerciseModel, ActivitySetModel
-from src.domain.Activity.schemas import Activity, ActivityExercise, ActivitySet, ActivityWorkout
+from src.domain.Activity.schemas import Activity
+from src.domain.Activity.repository import ActivityRepository
 from src.domain.Cardio.models import CardioModel
 from src.domain.Cardio.schemas import Cardio
 from src.domain.Cardio.repository import CardioRepository
 from src.domain.Supplement.models import SupplementModel, SupplementCompoundModel
-from src.domain.Supplement.schemas import Supplement, SupplementCompound
-from src.domain.Compound.schemas import Compound, CompoundUnit
+from src.domain.Supplement.repository import SupplementRepository
 from src.domain.Stress.models import StressModel
 from src.domain.Stress.schemas import Stress, StressLevel
 from src.domain.Food.models import FoodModel
-from src.domain.Food.repository import FoodRepository
-from src.domain.Exercise.schemas import Exercise, Unit
+from src.domain.Food.repository import food_cache
 from src.domain.Exercise.models import ExerciseModel
+from src.domain.Exercise.repository import exercise_cache
+from src.domain.Workout.models import WorkoutModel
+from src.domain.Compound.models import CompoundModel
+from src.domain.Compound.repository import compound_cache
 from src.domain.Cycles.CarbCycle.models import CarbCycleDayModel, CarbCycleModel
-from src.domain.Cycles.CarbCycle.schemas import CarbCycle, CarbCycleDay, CarbCycleDayType
+from src.domain.Cycles.CarbCycle.repository import CarbCycleRepository
 from src.domain.ProgressPicture.models import ProgressPictureModel
 from src.domain.ProgressPicture.schemas import ProgressPicture
+from src.domain.Stats.repository import DailyMetricsRepository
 from src.api.schemas import (
     LogEntryRequest,
     PhaseExisting, PhaseNew,
@@ -35,6 +48,19 @@ from src.api.schemas import (
     CardioExisting, CardioNew,
     SupplementExisting, SupplementNew,
     StressExisting, StressNew,
+    AppendHydrationOperation, RemoveHydrationOperation,
+    AddFoodOperation, UpdateFoodOperation, RemoveFoodOperation,
+    SetMorningWeightOperation,
+)
+
+# Tables written by bulk_create, parents before the rows that reference them
+BULK_INSERT_ORDER = (
+    PhaseModel, SleepModel, StressModel,
+    SupplementModel, SupplementCompoundModel,
+    ActivityModel, ActivityExerciseModel, ActivitySetModel,
+    HydrationModel, CardioModel,
+    LogEntryModel, LogEntryFoodModel, LogEntrySupplementModel, LogEntryActivityModel,
+    LogEntryHydrationModel, LogEntryCardioModel,
 )
 
 
@@ -98,41 +124,24 @@ class LogEntryRepository:
     def _create_or_get_activities(self, activities_input) -> list[int] | None:
         if not activities_input:
             return None
+        activity_repo = ActivityRepository(self.db)
         activity_ids = []
         for activity in activities_input:
             if isinstance(activity, ActivityExisting):
                 activity_ids.append(activity.id)
             elif isinstance(activity, ActivityNew):
-                model = ActivityModel(
-                    workout_id=activity.workout_id,
-                    time=activity.time,
-                    notes=activity.notes
-                )
-                self.db.add(model)
-                self.db.flush()
-                
-                for position, ex in enumerate(activity.exercises):
-                    ex_model = ActivityExerciseModel(
-                        activity_id=model.id,
-                        exercise_id=ex.exercise_id,
-                        position=position,
-                        session_notes=ex.session_notes
-                    )
-                    self.db.add(ex_model)
-                    self.db.flush()
-                    
-                    for s in ex.sets:
-                        set_model = ActivitySetModel(
-                            activity_exercise_id=ex_model.id,
-                            reps=s.reps,
-                            weight=s.weight,
-                            unit=s.unit.value if s.unit else None,
-                            rir=s.rir,
-                            notes=s.notes
-                        )
-                        self.db.add(set_model)
-                
-                activity_ids.append(model.id)
+                exercises = [
+                    {
+                        "exercise_id": ex.exercise_id,
+                        "session_notes": ex.session_notes,
+                        "sets": [
+                            {"reps": s.reps, "weight": s.weight, "unit": s.unit.value if s.unit else None, "rir": s.rir, "notes": s.notes}
+                            for s in ex.sets
+                        ]
+                    }
+                    for ex in activity.exercises
+                ]
+                activity_ids.append(activity_repo.insert_activity(activity.time, activity.workout_id, activity.notes, exercises))
         return activity_ids if activity_ids else None
 
     def _create_or_get_cardio(self, cardio_input) -> list[int] | None:
@@ -200,371 +209,388 @@ class LogEntryRepository:
         return None
 
     # =========================================================================
-    # Helper methods for handling log entry foods
+    # Helper methods for handling log entry child collections
     # =========================================================================
 
-    def _set_log_entry_foods(self, log_entry_id: int, foods_input) -> None:
-        """Set the foods for a log entry (replaces existing foods)"""
-        # Delete existing foods for this log entry
-        self.db.query(LogEntryFoodModel).filter(
-            LogEntryFoodModel.log_entry_id == log_entry_id
-        ).delete()
-        
-        if not foods_input:
-            return
-        
-        # Add new foods
-        for food_input in foods_input:
-            food_model = LogEntryFoodModel(
-                log_entry_id=log_entry_id,
-                food_id=food_input.food_id,
-                servings=food_input.servings
-            )
-            self.db.add(food_model)
-
-    def _get_log_entry_foods(self, log_entry_id: int) -> list[MealFood] | None:
-        """Get foods for a log entry"""
-        food_repo = FoodRepository(self.db)
-        food_models = self.db.query(LogEntryFoodModel).filter(
-            LogEntryFoodModel.log_entry_id == log_entry_id
+    def _sync_children(self, junction_cls, key_column, log_entry_id: int, rows: list[dict]) -> None:
+        """Make a log entry's rows in junction_cls hold rows (the values of its other columns), in order.
+        Existing rows are matched to the new ones on key_column, walking both in order: a matched row
+        keeps its id and is only updated if its other values changed, and existing rows passed over are
+        deleted. Children are read back in id order, so once a new row has no match left, it and the
+        rows after it are inserted. Removing children or appending them only writes those children;
+        inserting one mid-list also rewrites the ones after it.
+        Costs one SELECT, plus at most one UPDATE, INSERT and DELETE for what changed.
+        """
+        columns = [c for c in junction_cls.__table__.columns if c.key not in ("id", "log_entry_id")]
+        existing = self.db.execute(
+            select(junction_cls.id, *columns)
+            .where(junction_cls.log_entry_id == log_entry_id)
+            .order_by(junction_cls.id)
         ).all()
         
-        if not food_models:
-            return None
+        updates, deletes = [], []
+        kept = 0  # rows[:kept] are matched to existing rows
+        position = 0  # existing[position:] are not matched or passed over yet
+        for new_row in rows:
+            match = next(
+                (i for i in range(position, len(existing)) if getattr(existing[i], key_column.key) == new_row[key_column.key]),
+                None
+            )
+            if match is None:
+                break
+            deletes.extend(row.id for row in existing[position:match])
+            if tuple(getattr(existing[match], c.key) for c in columns) != tuple(new_row[c.key] for c in columns):
+                updates.append({"id": existing[match].id, **new_row})
+            kept += 1
+            position = match + 1
+        deletes.extend(row.id for row in existing[position:])
+        inserts = [{"log_entry_id": log_entry_id, **new_row} for new_row in rows[kept:]]
         
-        foods = []
-        for fm in food_models:
-            foods.append(MealFood(
-                food=food_repo._model_to_schema(fm.food),
-                servings=fm.servings
-            ))
-        return foods if foods else None
+        if updates:
+            self.db.execute(update(junction_cls), updates)
+        # Inserted before the deletes: SQLite hands out max(id) + 1, which would reuse the deleted ids
+        if inserts:
+            self.db.execute(insert(junction_cls), inserts)
+        if deletes:
+            self.db.execute(
+                delete(junction_cls).where(junction_cls.id.in_(deletes)).execution_options(synchronize_session=False)
+            )
 
-    # =========================================================================
-    # Helper methods for handling log entry supplements
-    # =========================================================================
+    def _set_log_entry_foods(self, log_entry_id: int, foods_input) -> None:
+        """Set the foods for a log entry, writing only what changed"""
+        self._sync_children(LogEntryFoodModel, LogEntryFoodModel.food_id, log_entry_id, [
+            {"food_id": food_input.food_id, "servings": food_input.servings}
+            for food_input in foods_input or []
+        ])
 
     def _set_log_entry_supplements(self, log_entry_id: int, supplements_data: list[dict] | None) -> None:
-        """Set the supplements for a log entry (replaces existing supplements)
+        """Set the supplements for a log entry, writing only what changed
         supplements_data: list of {"supplement_id": int, "servings": float}
         """
-        # Delete existing supplements for this log entry
-        self.db.query(LogEntrySupplementModel).filter(
-            LogEntrySupplementModel.log_entry_id == log_entry_id
-        ).delete()
-        
-        if not supplements_data:
-            return
-        
-        # Add new supplements
-        for supp_data in supplements_data:
-            supp_model = LogEntrySupplementModel(
-                log_entry_id=log_entry_id,
-                supplement_id=supp_data["supplement_id"],
-                servings=supp_data["servings"]
-            )
-            self.db.add(supp_model)
+        self._sync_children(LogEntrySupplementModel, LogEntrySupplementModel.supplement_id, log_entry_id, [
+            {"supplement_id": supp_data["supplement_id"], "servings": supp_data["servings"]}
+            for supp_data in supplements_data or []
+        ])
 
-    def _get_log_entry_supplements(self, log_entry_id: int) -> list[LogEntrySupplement] | None:
-        """Get supplements for a log entry"""
-        supp_models = self.db.query(LogEntrySupplementModel).filter(
-            LogEntrySupplementModel.log_entry_id == log_entry_id
-        ).all()
-        
-        if not supp_models:
-            return None
-        
-        supplements = []
-        for sm in supp_models:
-            if sm.supplement is None:
-                continue
-            # Build the supplement schema
-            compounds = []
-            for sc in sm.supplement.supplement_compounds:
-                if sc.compound is None:
-                    continue
-                compound = Compound(
-                    id=sc.compound.id,
-                    name=sc.compound.name,
-                    unit=CompoundUnit(sc.compound.unit)
-                )
-                compounds.append(SupplementCompound(
-                    compound=compound,
-                    amount=sc.amount
-                ))
-            supplement = Supplement(
-                id=sm.supplement.id,
-                brand=sm.supplement.brand,
-                name=sm.supplement.name,
-                serving_name=sm.supplement.serving_name,
-                compounds=compounds
-            )
-            supplements.append(LogEntrySupplement(
-                supplement=supplement,
-                servings=sm.servings
-            ))
-        return supplements if supplements else None
+    def _set_log_entry_activities(self, log_entry_id: int, activity_ids: list[int] | None) -> None:
+        """Set the activities for a log entry, writing only what changed"""
+        self._sync_children(LogEntryActivityModel, LogEntryActivityModel.activity_id, log_entry_id, [
+            {"activity_id": activity_id} for activity_id in activity_ids or []
+        ])
+
+    def _set_log_entry_hydrations(self, log_entry_id: int, hydration_ids: list[int] | None) -> None:
+        """Set the hydration for a log entry, writing only what changed"""
+        self._sync_children(LogEntryHydrationModel, LogEntryHydrationModel.hydration_id, log_entry_id, [
+            {"hydration_id": hydration_id} for hydration_id in hydration_ids or []
+        ])
+
+    def _set_log_entry_cardios(self, log_entry_id: int, cardio_ids: list[int] | None) -> None:
+        """Set the cardio for a log entry, writing only what changed"""
+        self._sync_children(LogEntryCardioModel, LogEntryCardioModel.cardio_id, log_entry_id, [
+            {"cardio_id": cardio_id} for cardio_id in cardio_ids or []
+        ])
 
     # =========================================================================
-    # Helper methods for fetching related entities (for response)
+    # Bulk loaders for related entities (for response)
+    #
+    # Each loader fetches one kind of related row for a whole batch of log
+    # entries with IN-lists / selectinload, so building N log entries costs a
+    # fixed number of queries instead of several per entry.
     # =========================================================================
 
-    def _get_phase(self, phase_id: int | None) -> Phase | None:
-        if phase_id is None:
-            return None
-        model = self.db.query(PhaseModel).filter(PhaseModel.id == phase_id).first()
-        if model is None:
-            return None
-        return Phase(id=model.id, name=model.name)
-
-    def _get_sleep(self, sleep_id: int | None) -> Sleep | None:
-        if sleep_id is None:
-            return None
-        model = self.db.query(SleepModel).filter(SleepModel.id == sleep_id).first()
-        if model is None:
-            return None
-        naps = [Nap(id=i, date=model.date, duration=n["duration"]) 
-                for i, n in enumerate(model.naps or [], start=1)]
-        return Sleep(
-            id=model.id,
-            date=model.date,
-            duration=model.duration,
-            quality=model.quality,
-            notes=model.notes,
-            naps=naps
-        )
+    def _fetch_in(self, model_cls, column, ids, *options, order_by=None) -> list:
+        """Fetch rows where column is in ids, chunked to stay under SQLite's variable limit"""
+        unique_ids = list(dict.fromkeys(i for i in ids if i is not None))
+        rows = []
+        for start in range(0, len(unique_ids), IN_CHUNK_SIZE):
+            query = self.db.query(model_cls).filter(column.in_(unique_ids[start:start + IN_CHUNK_SIZE]))
+            if options:
+                query = query.options(*options)
+            if order_by is not None:
+                query = query.order_by(order_by)
+            rows.extend(query.all())
+        return rows
+
+    def _load_phases(self, phase_ids) -> dict[int, Phase]:
+        return phase_cache.get_many(self.db, phase_ids)
+
+    def _load_sleeps(self, sleep_ids) -> dict[int, Sleep]:
+        sleeps = {}
+        for model in self._fetch_in(SleepModel, SleepModel.id, sleep_ids):
+            naps = [Nap(id=i, date=model.date, duration=n["duration"]) 
+                    for i, n in enumerate(model.naps or [], start=1)]
+            sleeps[model.id] = Sleep(
+                id=model.id,
+                date=model.date,
+                duration=model.duration,
+                quality=model.quality,
+                notes=model.notes,
+                naps=naps
+            )
+        return sleeps
 
-    def _get_hydration(self, hydration_ids: list[int] | None) -> list[Hydration] | None:
-        if not hydration_ids:
-            return None
-        hydrations = []
-        for hydration_id in hydration_ids:
-            model = self.db.query(HydrationModel).filter(HydrationModel.id == hydration_id).first()
-            if model:
-                cup = Cup(
-                    id=model.cup.id,
-                    name=model.cup.name,
-                    amount=model.cup.amount,
-                    unit=HydrationUnit(model.cup.unit)
-                )
-                hydrations.append(Hydration(
-                    id=model.id,
-                    timestamp=model.timestamp,
-                    cup=cup,
-                    servings=model.servings
-                ))
-        return hydrations if hydrations else None
-
-    def _get_activities(self, log_entry_id: int) -> list[Activity] | None:
-        """Get activities for a log entry"""
-        activity_links = self.db.query(LogEntryActivityModel).filter(
-            LogEntryActivityModel.log_entry_id == log_entry_id
-        ).all()
-        
-        if not activity_links:
-            return None
-        
-        activities = []
-        for link in activity_links:
-            model = link.activity
-            if model:
-                exercises = []
-                for ex in model.exercises:
-                    sets = []
-                    for s in ex.sets:
-                        sets.append(ActivitySet(
-                            id=s.id,
-                            reps=s.reps,
-                            weight=s.weight,
-                            unit=Unit(s.unit) if s.unit else None,
-                            rir=s.rir,
-                            notes=s.notes
-                        ))
-                    
-                    exercise = Exercise(
-                        id=ex.exercise.id,
-                        name=ex.exercise.name,
-                        movement_pattern_id=ex.exercise.movement_pattern_id,
-                        notes=ex.exercise.notes
-                    )
-                    
-                    exercises.append(ActivityExercise(
-                        id=ex.id,
-                        exercise=exercise,
-                        position=ex.position,
-                        session_notes=ex.session_notes,
-                        sets=sets
-                    ))
-                
-                # Include workout info if available
-                workout_info = None
-                if model.workout:
-                    workout_info = ActivityWorkout(
-                        id=model.workout.id,
-                        name=model.workout.name,
-                        description=model.workout.description
-                    )
-                
-                activities.append(Activity(
-                    id=model.id,
-                    workout_id=model.workout_id,
-                    workout=workout_info,
-                    time=model.time,
-                    notes=model.notes,
-                    exercises=exercises
-                ))
-        return activities if activities else None
-
-    def _get_cardio(self, cardio_ids: list[int] | None) -> list[Cardio] | None:
-        if not cardio_ids:
-            return None
+    def _fetch_links(self, junction_cls, target_column, log_entry_ids) -> dict[int, list[int]]:
+        """Map log entry id -> linked ids from a junction table, in the order they were added.
+        Reads plain id pairs so no junction objects are built.
+        """
+        unique_ids = list(dict.fromkeys(log_entry_ids))
+        links: dict[int, list[int]] = {}
+        for start in range(0, len(unique_ids), IN_CHUNK_SIZE):
+            rows = self.db.query(junction_cls.log_entry_id, target_column).filter(
+                junction_cls.log_entry_id.in_(unique_ids[start:start + IN_CHUNK_SIZE])
+            ).order_by(junction_cls.id).all()
+            for log_entry_id, target_id in rows:
+                links.setdefault(log_entry_id, []).append(target_id)
+        return links
+
+    def _load_hydrations(self, log_entry_ids) -> dict[int, list[Hydration]]:
+        links = self._fetch_links(LogEntryHydrationModel, LogEntryHydrationModel.hydration_id, log_entry_ids)
+        models = self._fetch_in(HydrationModel, HydrationModel.id, (i for ids in links.values() for i in ids))
+        cups = cup_cache.get_many(self.db, (m.cup_id for m in models))
+        hydration_by_id = {
+            m.id: Hydration(
+                id=m.id,
+                timestamp=m.timestamp,
+                cup=cups[m.cup_id],
+                servings=m.servings
+            )
+            for m in models if m.cup_id in cups
+        }
+        # Silently drop links to deleted hydration
+        return {
+            log_entry_id: [hydration_by_id[i] for i in ids if i in hydration_by_id]
+            for log_entry_id, ids in links.items()
+        }
+
+    def _load_cardios(self, log_entry_ids) -> dict[int, list[Cardio]]:
         cardio_repo = CardioRepository(self.db)
-        cardios = []
-        for cardio_id in cardio_ids:
-            cardio = cardio_repo.get_by_id(cardio_id)
-            if cardio:
-                cardios.append(cardio)
-        return cardios if cardios else None
-
-
-    def _get_stress(self, stress_id: int | None) -> Stress | None:
-        if stress_id is None:
-            return None
-        model = self.db.query(StressModel).filter(StressModel.id == stress_id).first()
-        if model is None:
-            return None
-        return Stress(
-            id=model.id,
-            timestamp=model.timestamp,
-            level=StressLevel(model.level),
-            notes=model.notes
+        links = self._fetch_links(LogEntryCardioModel, LogEntryCardioModel.cardio_id, log_entry_ids)
+        cardio_by_id = {
+            m.id: cardio_repo._model_to_schema(m)
+            for m in self._fetch_in(CardioModel, CardioModel.id, (i for ids in links.values() for i in ids))
+        }
+        # Silently drop links to deleted cardio
+        return {
+            log_entry_id: [cardio_by_id[i] for i in ids if i in cardio_by_id]
+            for log_entry_id, ids in links.items()
+        }
+
+    def _load_stresses(self, stress_ids) -> dict[int, Stress]:
+        models = self._fetch_in(StressModel, StressModel.id, stress_ids)
+        return {
+            m.id: Stress(
+                id=m.id,
+                timestamp=m.timestamp,
+                level=StressLevel(m.level),
+                notes=m.notes
+            )
+            for m in models
+        }
+
+    def _load_carb_cycles(self, carb_cycle_day_ids) -> dict[int, LogEntryCarbCycle]:
+        """Map carb cycle day id -> the day's cycle (with all days) and the selected day"""
+        carb_cycle_repo = CarbCycleRepository(self.db)
+        day_models = self._fetch_in(
+            CarbCycleDayModel, CarbCycleDayModel.id, carb_cycle_day_ids,
+            selectinload(CarbCycleDayModel.carb_cycle).selectinload(CarbCycleModel.days),
         )
-
-    def _get_carb_cycle(self, carb_cycle_day_id: int | None) -> LogEntryCarbCycle | None:
-        if carb_cycle_day_id is None:
-            return None
-        day_model = self.db.query(CarbCycleDayModel).filter(
-            CarbCycleDayModel.id == carb_cycle_day_id
-        ).first()
-        if day_model is None:
-            return None
-        
-        cycle_model = day_model.carb_cycle
-        if cycle_model is None:
-            return None
-        
-        # Build carb cycle with all days
-        days = [
-            CarbCycleDay(
-                id=d.id,
-                day_type=CarbCycleDayType(d.day_type),
-                carbs=d.carbs,
-                position=d.position
+        carb_cycles = {}
+        for day_model in day_models:
+            cycle_model = day_model.carb_cycle
+            if cycle_model is None:
+                continue
+            carb_cycles[day_model.id] = LogEntryCarbCycle(
+                carb_cycle=carb_cycle_repo._model_to_schema(cycle_model),
+                selected_day=carb_cycle_repo._day_model_to_schema(day_model)
             )
-            for d in cycle_model.days
-        ]
-        
-        carb_cycle = CarbCycle(
-            id=cycle_model.id,
-            name=cycle_model.name,
-            description=cycle_model.description,
-            days=days
+        return carb_cycles
+
+    def _load_foods(self, log_entry_ids) -> dict[int, list[MealFood]]:
+        food_models = self._fetch_in(
+            LogEntryFoodModel, LogEntryFoodModel.log_entry_id, log_entry_ids,
+            order_by=LogEntryFoodModel.id,
         )
-        
-        selected_day = CarbCycleDay(
-            id=day_model.id,
-            day_type=CarbCycleDayType(day_model.day_type),
-            carbs=day_model.carbs,
-            position=day_model.position
+        food_by_id = food_cache.get_many(self.db, (fm.food_id for fm in food_models))
+        foods: dict[int, list[MealFood]] = {}
+        for fm in food_models:
+            # Silently drop links to deleted foods
+            if fm.food_id not in food_by_id:
+                continue
+            foods.setdefault(fm.log_entry_id, []).append(MealFood(
+                food=food_by_id[fm.food_id],
+                servings=fm.servings
+            ))
+        return foods
+
+    def _load_supplements(self, log_entry_ids) -> dict[int, list[LogEntrySupplement]]:
+        supplement_repo = SupplementRepository(self.db)
+        supp_models = self._fetch_in(
+            LogEntrySupplementModel, LogEntrySupplementModel.log_entry_id, log_entry_ids,
+            selectinload(LogEntrySupplementModel.supplement).selectinload(SupplementModel.supplement_compounds),
+            order_by=LogEntrySupplementModel.id,
         )
-        
-        return LogEntryCarbCycle(
-            carb_cycle=carb_cycle,
-            selected_day=selected_day
+        # Load every compound the batch needs into the cache at once
+        compound_cache.get_many(self.db, (
+            sc.compound_id for sm in supp_models if sm.supplement is not None for sc in sm.supplement.supplement_compounds
+        ))
+        supplements: dict[int, list[LogEntrySupplement]] = {}
+        for sm in supp_models:
+            if sm.supplement is None:
+                continue
+            supplements.setdefault(sm.log_entry_id, []).append(LogEntrySupplement(
+                supplement=supplement_repo._model_to_schema(sm.supplement),
+                servings=sm.servings
+            ))
+        return supplements
+
+    def _load_activities(self, log_entry_ids) -> dict[int, list[Activity]]:
+        activity_repo = ActivityRepository(self.db)
+        exercises_loader = selectinload(LogEntryActivityModel.activity).selectinload(ActivityModel.exercises)
+        activity_links = self._fetch_in(
+            LogEntryActivityModel, LogEntryActivityModel.log_entry_id, log_entry_ids,
+            exercises_loader.selectinload(ActivityExerciseModel.sets),
+            selectinload(LogEntryActivityModel.activity).selectinload(ActivityModel.workout),
+            order_by=LogEntryActivityModel.id,
         )
+        # Load every exercise the batch needs into the cache at once
+        exercise_cache.get_many(self.db, (
+            ex.exercise_id for link in activity_links if link.activity is not None for ex in link.activity.exercises
+        ))
+        activities: dict[int, list[Activity]] = {}
+        for link in activity_links:
+            if link.activity is None:
+                continue
+            activities.setdefault(link.log_entry_id, []).append(
+                activity_repo._model_to_schema(link.activity)
+            )
+        return activities
 
-    def _get_progress_pictures(self, log_entry_id: int) -> list[ProgressPicture] | None:
-        """Get progress pictures for a log entry"""
-        models = self.db.query(ProgressPictureModel).filter(
-            ProgressPictureModel.log_entry_id == log_entry_id
-        ).order_by(ProgressPictureModel.created_at.desc()).all()
-        
-        if not models:
-            return None
-        
-        pictures = []
+    def _load_progress_pictures(self, log_entry_ids) -> dict[int, list[ProgressPicture]]:
+        models = self._fetch_in(
+            ProgressPictureModel, ProgressPictureModel.log_entry_id, log_entry_ids,
+            order_by=ProgressPictureModel.created_at.desc(),
+        )
+        pictures: dict[int, list[ProgressPicture]] = {}
         for m in models:
-            pictures.append(ProgressPicture(
+            pictures.setdefault(m.log_entry_id, []).append(ProgressPicture(
                 id=m.id,
                 label=m.label,
                 filename=m.filename,
                 original_filename=m.original_filename,
                 mime_type=m.mime_type,
                 created_at=m.created_at,
+                # Set even though it is the default, so routes using response_model_exclude_unset keep the key
+                log_entry_date=None,
                 url=f"/api/progress-pictures/file/{m.filename}"
             ))
-        return pictures if pictures else None
+        return pictures
 
-    def _set_log_entry_activities(self, log_entry_id: int, activity_ids: list[int] | None) -> None:
-        """Set the activities for a log entry (replaces existing activities)"""
-        # Delete existing activity links for this log entry
-        self.db.query(LogEntryActivityModel).filter(
-            LogEntryActivityModel.log_entry_id == log_entry_id
-        ).delete()
-        
-        if not activity_ids:
-            return
-        
-        # Add new activity links
-        for activity_id in activity_ids:
-            link = LogEntryActivityModel(
-                log_entry_id=log_entry_id,
-                activity_id=activity_id
-            )
-            self.db.add(link)
+    def _models_to_schemas(self, models: list[LogEntryModel], fields: set[str] | None = None) -> list[LogEntry]:
+        """Build LogEntry schemas for a batch of models using a fixed number of queries.
+        fields: LogEntry fields to populate (id and timestamp are always included), or None for all.
+        Loaders for sections that are not requested are skipped and those fields are left as None.
+        """
+        if not models:
+            return []
+        log_entry_ids = [m.id for m in models]
+
+        def wants(field: str) -> bool:
+            return fields is None or field in fields
+
+        phases = self._load_phases(m.phase_id for m in models) if wants("phase") else {}
+        sleeps = self._load_sleeps(m.sleep_id for m in models) if wants("sleep") else {}
+        hydrations = self._load_hydrations(log_entry_ids) if wants("hydration") else {}
+        cardios = self._load_cardios(log_entry_ids) if wants("cardio") else {}
+        stresses = self._load_stresses(m.stress_id for m in models) if wants("stress") else {}
+        carb_cycles = (self._load_carb_cycles(m.carb_cycle_day_id for m in models)
+                       if wants("carb_cycle") else {})
+        foods = self._load_foods(log_entry_ids) if wants("foods") else {}
+        supplements = self._load_supplements(log_entry_ids) if wants("supplements") else {}
+        activities = self._load_activities(log_entry_ids) if wants("activities") else {}
+        pictures = self._load_progress_pictures(log_entry_ids) if wants("progress_pictures") else {}
+
+        log_entries = []
+        for model in models:
+            sections = {
+                "phase": lambda: phases.get(model.phase_id),
+                "morning_weight": lambda: model.morning_weight,
+                "sleep": lambda: sleeps.get(model.sleep_id),
+                "hydration": lambda: hydrations.get(model.id) or None,
+                "foods": lambda: foods.get(model.id),
+                "activities": lambda: activities.get(model.id),
+                "cardio": lambda: cardios.get(model.id) or None,
+                "supplements": lambda: supplements.get(model.id),
+                "stress": lambda: stresses.get(model.stress_id),
+                "num_standard_drinks": lambda: model.num_standard_drinks,
+                "notes": lambda: model.notes,
+                "carb_cycle": lambda: carb_cycles.get(model.carb_cycle_day_id),
+                "progress_pictures": lambda: pictures.get(model.id),
+            }
+            values = {name: build() for name, build in sections.items() if wants(name)}
+            log_entries.append(LogEntry(id=model.id, timestamp=model.timestamp, **values))
+        return log_entries
 
     def _model_to_schema(self, model: LogEntryModel) -> LogEntry:
-        return LogEntry(
-            id=model.id,
-            timestamp=model.timestamp,
-            phase=self._get_phase(model.phase_id),
-            morning_weight=model.morning_weight,
-            sleep=self._get_sleep(model.sleep_id),
-            hydration=self._get_hydration(model.hydration_ids),
-            foods=self._get_log_entry_foods(model.id),
-            activities=self._get_activities(model.id),
-            cardio=self._get_cardio(model.cardio_ids),
-            supplements=self._get_log_entry_supplements(model.id),
-            stress=self._get_stress(model.stress_id),
-            num_standard_drinks=model.num_standard_drinks,
-            notes=model.notes,
-            carb_cycle=self._get_carb_cycle(model.carb_cycle_day_id),
-            progress_pictures=self._get_progress_pictures(model.id),
-        )
+        return self._models_to_schemas([model])[0]
 
     # =========================================================================
     # CRUD Operations
     # =========================================================================
 
-    def get_by_id(self, log_entry_id: int) -> LogEntry | None:
+    def get_by_id(self, log_entry_id: int, fields: set[str] | None = None) -> LogEntry | None:
         model = self.db.query(LogEntryModel).filter(LogEntryModel.id == log_entry_id).first()
         if model is None:
             return None
-        return self._model_to_schema(model)
+        return self._models_to_schemas([model], fields)[0]
 
-    def get_all(self) -> list[LogEntry]:
+    def get_all(self, fields: set[str] | None = None) -> list[LogEntry]:
         models = self.db.query(LogEntryModel).all()
-        return [self._model_to_schema(m) for m in models]
+        return self._models_to_schemas(models, fields)
 
-    def get_by_date(self, date_str: str) -> LogEntry | None:
+    def get_by_date(self, date_str: str, fields: set[str] | None = None) -> LogEntry | None:
         """Get log entry by date (YYYY-MM-DD format). Matches entries where timestamp date equals the given date."""
-        from sqlalchemy import func
-        model = self.db.query(LogEntryModel).filter(
-            func.date(LogEntryModel.timestamp) == date_str
-        ).first()
+        try:
+            entry_date = date.fromisoformat(date_str)
+        except ValueError:
+            return None
+        model = self.db.query(LogEntryModel).filter(LogEntryModel.entry_date == entry_date).first()
         if model is None:
             return None
-        return self._model_to_schema(model)
+        return self._models_to_schemas([model], fields)[0]
+
+    def get_in_range(self, start: date, end: date, fields: set[str] | None = None) -> list[LogEntry]:
+        """Get log entries whose timestamp falls on a day between start and end (inclusive)"""
+        models = self.db.query(LogEntryModel).filter(
+            LogEntryModel.entry_date >= start,
+            LogEntryModel.entry_date <= end
+        ).order_by(LogEntryModel.timestamp, LogEntryModel.id).all()
+        return self._models_to_schemas(models, fields)
+
+    def get_page(self, after: tuple[datetime, int] | None, limit: int,
+                 fields: set[str] | None = None) -> tuple[list[LogEntry], bool]:
+        """Keyset-paginated listing ordered by (timestamp, id).
+        after: (timestamp, id) of the last entry on the previous page, or None for the first page.
+        Returns the page and whether more entries follow it.
+        """
+        query = self.db.query(LogEntryModel)
+        if after is not None:
+            after_timestamp, after_id = after
+            query = query.filter(or_(
+                LogEntryModel.timestamp > after_timestamp,
+                and_(LogEntryModel.timestamp == after_timestamp, LogEntryModel.id > after_id)
+            ))
+        # Fetch one extra row to learn whether another page exists
+        models = query.order_by(LogEntryModel.timestamp, LogEntryModel.id).limit(limit + 1).all()
+        has_more = len(models) > limit
+        return self._models_to_schemas(models[:limit], fields), has_more
+
+    def iter_all(self, chunk_size: int, fields: set[str] | None = None) -> Iterator[list[LogEntry]]:
+        """Yield every log entry ordered by (timestamp, id), chunk_size entries at a time.
+        Rows are fetched from the cursor as they are consumed, so memory stays bounded by the chunk.
+        """
+        query = select(LogEntryModel).order_by(LogEntryModel.timestamp, LogEntryModel.id)
+        for models in self.db.scalars(query, execution_options={"yield_per": chunk_size}).partitions():
+            yield self._models_to_schemas(models, fields)
 
     def create(self, log_entry: LogEntryRequest) -> LogEntry:
         # Process all inputs - create new entities or get existing IDs
@@ -581,8 +607,6 @@ class LogEntryRepository:
             phase_id=phase_id,
             morning_weight=log_entry.morning_weight,
             sleep_id=sleep_id,
-            hydration_ids=hydration_ids,
-            cardio_ids=cardio_ids,
             stress_id=stress_id,
             num_standard_drinks=log_entry.num_standard_drinks,
             notes=log_entry.notes,
@@ -597,7 +621,11 @@ class LogEntryRepository:
         self._set_log_entry_supplements(model.id, supplements_data)
         # Set activities for this log entry
         self._set_log_entry_activities(model.id, activity_ids)
+        # Set hydration and cardio for this log entry
+        self._set_log_entry_hydrations(model.id, hydration_ids)
+        self._set_log_entry_cardios(model.id, cardio_ids)
         
+        DailyMetricsRepository(self.db).mark_dirty([model.timestamp.date()])
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -616,12 +644,12 @@ class LogEntryRepository:
         supplements_data = self._create_or_get_supplements(log_entry.supplements)
         stress_id = self._create_or_get_stress(log_entry.stress)
 
+        # Both the old and the new day's stats change
+        DailyMetricsRepository(self.db).mark_dirty([model.timestamp.date(), log_entry.timestamp.date()])
         model.timestamp = log_entry.timestamp
         model.phase_id = phase_id
         model.morning_weight = log_entry.morning_weight
         model.sleep_id = sleep_id
-        model.hydration_ids = hydration_ids
-        model.cardio_ids = cardio_ids
         model.stress_id = stress_id
         model.num_standard_drinks = log_entry.num_standard_drinks
         model.notes = log_entry.notes
@@ -633,6 +661,9 @@ class LogEntryRepository:
         self._set_log_entry_supplements(model.id, supplements_data)
         # Update activities for this log entry
         self._set_log_entry_activities(model.id, activity_ids)
+        # Update hydration and cardio for this log entry
+        self._set_log_entry_hydrations(model.id, hydration_ids)
+        self._set_log_entry_cardios(model.id, cardio_ids)
         
         self.db.commit()
         self.db.refresh(model)
@@ -643,14 +674,273 @@ class LogEntryRepository:
         if model is None:
             return None
         log_entry = self._model_to_schema(model)
+        DailyMetricsRepository(self.db).mark_dirty([model.timestamp.date()])
         self.db.delete(model)
         self.db.commit()
         return log_entry
 
     def delete_all(self) -> list[LogEntry]:
         models = self.db.query(LogEntryModel).all()
-        log_entries = [self._model_to_schema(m) for m in models]
-        for model in models:
-            self.db.delete(model)
+        log_entries = self._models_to_schemas(models)
+        # Bulk-delete junction rows instead of letting the ORM cascade lazy-load them per entry
+        for junction in (LogEntryFoodModel, LogEntrySupplementModel, LogEntryActivityModel,
+                         LogEntryHydrationModel, LogEntryCardioModel):
+            self.db.query(junction).delete(synchronize_session=False)
+        self.db.query(LogEntryModel).delete(synchronize_session=False)
+        DailyMetricsRepository(self.db).clear()
         self.db.commit()
         return log_entries
+
+    # =========================================================================
+    # Partial updates
+    # =========================================================================
+
+    def _check_exists(self, model_cls, row_id: int) -> None:
+        if self.db.scalar(select(model_cls.id).where(model_cls.id == row_id)) is None:
+            raise ValueError(f"Not found: {model_cls.__tablename__} {row_id}")
+
+    def _food_row_id(self, log_entry_id: int, index: int) -> int:
+        """Id of the log entry's food row at index, in the order foods are returned"""
+        row_id = self.db.scalar(
+            select(LogEntryFoodModel.id)
+            .where(LogEntryFoodModel.log_entry_id == log_entry_id)
+            .order_by(LogEntryFoodModel.id)
+            .offset(index)
+            .limit(1)
+        )
+        if row_id is None:
+            raise ValueError(f"No food at index {index}")
+        return row_id
+
+    def patch(self, log_entry_id: int, operations: list) -> set[str] | None:
+        """Apply PATCH operations in order, touching only the tables they concern.
+        Returns the names of the LogEntry sections that changed, or None if the log entry doesn't exist.
+        Raises ValueError if an operation refers to something that doesn't exist; nothing is written then.
+        """
+        model = self.db.get(LogEntryModel, log_entry_id)
+        if model is None:
+            return None
+        
+        changed = set()
+        try:
+            for operation in operations:
+                if isinstance(operation, AppendHydrationOperation):
+                    hydration = operation.hydration
+                    if isinstance(hydration, HydrationExisting):
+                        self._check_exists(HydrationModel, hydration.id)
+                    else:
+                        self._check_exists(CupModel, hydration.cup_id)
+                    hydration_id = self._create_or_get_hydration([hydration])[0]
+                    self.db.execute(insert(LogEntryHydrationModel), {"log_entry_id": log_entry_id, "hydration_id": hydration_id})
+                    changed.add("hydration")
+                elif isinstance(operation, RemoveHydrationOperation):
+                    # Unlinks the hydration from this day; the hydration itself is kept
+                    result = self.db.execute(
+                        delete(LogEntryHydrationModel)
+                        .where(LogEntryHydrationModel.log_entry_id == log_entry_id,
+                               LogEntryHydrationModel.hydration_id == operation.hydration_id)
+                        .execution_options(synchronize_session=False)
+                    )
+                    if result.rowcount == 0:
+                        raise ValueError(f"Hydration {operation.hydration_id} is not in this log entry")
+                    changed.add("hydration")
+                elif isinstance(operation, AddFoodOperation):
+                    self._check_exists(FoodModel, operation.food_id)
+                    self.db.execute(
+                        insert(LogEntryFoodModel),
+                        {"log_entry_id": log_entry_id, "food_id": operation.food_id, "servings": operation.servings}
+                    )
+                    changed.add("foods")
+                elif isinstance(operation, UpdateFoodOperation):
+                    row_id = self._food_row_id(log_entry_id, operation.index)
+                    self.db.execute(update(LogEntryFoodModel), [{"id": row_id, "servings": operation.servings}])
+                    changed.add("foods")
+                elif isinstance(operation, RemoveFoodOperation):
+                    row_id = self._food_row_id(log_entry_id, operation.index)
+                    self.db.execute(
+                        delete(LogEntryFoodModel).where(LogEntryFoodModel.id == row_id)
+                        .execution_options(synchronize_session=False)
+                    )
+                    changed.add("foods")
+                elif isinstance(operation, SetMorningWeightOperation):
+                    model.morning_weight = operation.morning_weight
+                    changed.add("morning_weight")
+        except ValueError:
+            self.db.rollback()
+            raise
+        
+        DailyMetricsRepository(self.db).mark_dirty([model.timestamp.date()])
+        self.db.commit()
+        return changed
+
+    # =========================================================================
+    # Bulk import
+    #
+    # Rows are collected per table with primary keys assigned up front, then
+    # each table is written with a single executemany. The ORM unit of work
+    # would insert one row per statement on SQLite, as it needs each new id
+    # back before it can insert the rows that reference it.
+    # =========================================================================
+
+    def _references(self, log_entry: LogEntryRequest) -> dict:
+        """Ids of existing rows a log entry request points at, keyed by model"""
+        def existing(items, cls):
+            return [i.id for i in items or [] if isinstance(i, cls)]
+
+        new_activities = [a for a in log_entry.activities or [] if isinstance(a, ActivityNew)]
+        new_supplements = [s for s in log_entry.supplements or [] if isinstance(s, SupplementNew)]
+        return {
+            PhaseModel: existing([log_entry.phase], PhaseExisting),
+            SleepModel: existing([log_entry.sleep], SleepExisting),
+            StressModel: existing([log_entry.stress], StressExisting),
+            CarbCycleDayModel: [log_entry.carb_cycle_day_id] if log_entry.carb_cycle_day_id is not None else [],
+            FoodModel: [f.food_id for f in log_entry.foods or []],
+            SupplementModel: existing(log_entry.supplements, SupplementExisting),
+            CompoundModel: [c.compound_id for s in new_supplements for c in s.compounds],
+            ActivityModel: existing(log_entry.activities, ActivityExisting),
+            WorkoutModel: [a.workout_id for a in new_activities if a.workout_id is not None],
+            ExerciseModel: [ex.exercise_id for a in new_activities for ex in a.exercises],
+            HydrationModel: existing(log_entry.hydration, HydrationExisting),
+            CupModel: [h.cup_id for h in log_entry.hydration or [] if isinstance(h, HydrationNew)],
+            CardioModel: existing(log_entry.cardio, CardioExisting),
+        }
+
+    def find_missing_references(self, log_entries: list[LogEntryRequest]) -> list[str | None]:
+        """For each log entry request, describe the referenced ids that don't exist, or None.
+        Checks the whole batch with one query per referenced table.
+        """
+        references = [self._references(log_entry) for log_entry in log_entries]
+        found = {}
+        for model_cls in references[0] if references else []:
+            ids = [i for refs in references for i in refs[model_cls]]
+            found[model_cls] = {row[0] for row in self._fetch_in(model_cls.id, model_cls.id, ids)}
+        messages = []
+        for refs in references:
+            missing = [
+                f"{model_cls.__tablename__} {i}"
+                for model_cls, ids in refs.items()
+                for i in dict.fromkeys(ids) if i not in found[model_cls]
+            ]
+            messages.append(f"Not found: {', '.join(missing)}" if missing else None)
+        return messages
+
+    def bulk_create(self, log_entries: list[LogEntryRequest]) -> list[int]:
+        """Insert log entries and their new nested entities in one transaction.
+        Returns the new log entry ids. Referenced ids must exist; see find_missing_references().
+        """
+        # Marking the dates dirty is the first write of the transaction. It takes SQLite's write
+        # lock, so no other connection can insert rows with the ids handed out below.
+        DailyMetricsRepository(self.db).mark_dirty(log_entry.timestamp.date() for log_entry in log_entries)
+
+        rows: dict[type, list[dict]] = {model_cls: [] for model_cls in BULK_INSERT_ORDER}
+        next_ids: dict[type, int] = {}
+
+        def add(model_cls, **values) -> int:
+            if model_cls not in next_ids:
+                next_ids[model_cls] = (self.db.query(func.max(model_cls.id)).scalar() or 0) + 1
+            values["id"] = next_ids[model_cls]
+            next_ids[model_cls] += 1
+            rows[model_cls].append(values)
+            return values["id"]
+
+        ids = [self._add_log_entry_rows(add, log_entry) for log_entry in log_entries]
+        for model_cls in BULK_INSERT_ORDER:
+            if rows[model_cls]:
+                # render_nulls keeps None values in the statement, so rows differing only in
+                # which columns are null still share one executemany
+                self.db.execute(insert(model_cls).execution_options(render_nulls=True), rows[model_cls])
+        self.db.commit()
+        return ids
+
+    def _add_log_entry_rows(self, add, log_entry: LogEntryRequest) -> int:
+        phase_id = sleep_id = stress_id = None
+        if isinstance(log_entry.phase, PhaseExisting):
+            phase_id = log_entry.phase.id
+        elif isinstance(log_entry.phase, PhaseNew):
+            phase_id = add(PhaseModel, name=log_entry.phase.name)
+        sleep = log_entry.sleep
+        if isinstance(sleep, SleepExisting):
+            sleep_id = sleep.id
+        elif isinstance(sleep, SleepNew):
+            sleep_id = add(
+                SleepModel,
+                date=sleep.date,
+                duration=sleep.duration,
+                quality=sleep.quality,
+                notes=sleep.notes,
+                naps=[{"duration": n.duration} for n in sleep.naps]
+            )
+        stress = log_entry.stress
+        if isinstance(stress, StressExisting):
+            stress_id = stress.id
+        elif isinstance(stress, StressNew):
+            stress_id = add(StressModel, timestamp=stress.timestamp, level=stress.level.value, notes=stress.notes)
+
+        log_entry_id = add(
+            LogEntryModel,
+            timestamp=log_entry.timestamp,
+            entry_date=log_entry.timestamp.date(),
+            phase_id=phase_id,
+            morning_weight=log_entry.morning_weight,
+            sleep_id=sleep_id,
+            stress_id=stress_id,
+            num_standard_drinks=log_entry.num_standard_drinks,
+            notes=log_entry.notes,
+            carb_cycle_day_id=log_entry.carb_cycle_day_id,
+        )
+
+        for food in log_entry.foods or []:
+            add(LogEntryFoodModel, log_entry_id=log_entry_id, food_id=food.food_id, servings=food.servings)
+        for supp in log_entry.supplements or []:
+            if isinstance(supp, SupplementExisting):
+                supplement_id = supp.id
+            else:
+                supplement_id = add(SupplementModel, brand=supp.brand, name=supp.name, serving_name=supp.serving_name)
+                for comp_req in supp.compounds:
+                    add(SupplementCompoundModel, supplement_id=supplement_id,
+                        compound_id=comp_req.compound_id, amount=comp_req.amount)
+            add(LogEntrySupplementModel, log_entry_id=log_entry_id, supplement_id=supplement_id, servings=supp.servings)
+        for activity in log_entry.activities or []:
+            if isinstance(activity, ActivityExisting):
+                activity_id = activity.id
+            else:
+                activity_id = add(ActivityModel, workout_id=activity.workout_id, time=activity.time, notes=activity.notes)
+                for position, ex in enumerate(activity.exercises):
+                    activity_exercise_id = add(
+                        ActivityExerciseModel,
+                        activity_id=activity_id,
+                        exercise_id=ex.exercise_id,
+                        position=position,
+                        session_notes=ex.session_notes
+                    )
+                    for s in ex.sets:
+                        add(
+                            ActivitySetModel,
+                            activity_exercise_id=activity_exercise_id,
+                            reps=s.reps,
+                            weight=s.weight,
+                            unit=s.unit.value if s.unit else None,
+                            rir=s.rir,
+                            notes=s.notes
+                        )
+            add(LogEntryActivityModel, log_entry_id=log_entry_id, activity_id=activity_id)
+        for hydration in log_entry.hydration or []:
+            if isinstance(hydration, HydrationExisting):
+                hydration_id = hydration.id
+            else:
+                hydration_id = add(HydrationModel, timestamp=hydration.timestamp,
+                                   cup_id=hydration.cup_id, servings=hydration.servings)
+            add(LogEntryHydrationModel, log_entry_id=log_entry_id, hydration_id=hydration_id)
+        for cardio in log_entry.cardio or []:
+            if isinstance(cardio, CardioExisting):
+                cardio_id = cardio.id
+            else:
+                cardio_id = add(
+                    CardioModel,
+                    name=cardio.name,
+                    time=cardio.time,
+                    exercise_type=cardio.exercise.type,
+                    exercise_data=cardio.exercise.model_dump()
+                )
+            add(LogEntryCardioModel, log_entry_id=log_entry_id, cardio_id=cardio_id)
+        return log_entry_id
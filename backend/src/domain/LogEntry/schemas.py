@@ -40,3 +40,15 @@ class LogEntry(BaseModel):
     notes: str | None = None
     carb_cycle: LogEntryCarbCycle | None = None
     progress_pictures: list[ProgressPicture] | None = None
+
+
+class LogEntryImportError(BaseModel):
+    """A row of a bulk import that was not imported"""
+    line: int  # 1-based line (NDJSON) or row (CSV, counting the header) in the uploaded file
+    error: str
+
+
+class LogEntryImportResult(BaseModel):
+    imported: int
+    ids: list[int]
+    errors: list[LogEntryImportError]
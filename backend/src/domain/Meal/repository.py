@@ -2,51 +2,22 @@ from sqlalchemy.orm import Session
 from src.api.schemas import MealRequest
 from src.domain.Meal.models import MealModel, MealFoodModel
 from src.domain.Meal.schemas import Meal, MealFood
-from src.domain.Food.models import FoodModel
-from src.domain.Food.schemas import Food, Protein, Carbs, Fat, AminoAcid
+from src.domain.Food.repository import food_cache
 
 
 class MealRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def _food_model_to_schema(self, model: FoodModel) -> Food:
-        """Convert FoodModel to Food schema"""
-        amino_acids = None
-        if model.protein_amino_acids:
-            amino_acids = [AminoAcid(aa) for aa in model.protein_amino_acids]
-        
-        return Food(
-            id=model.id,
-            name=model.name,
-            serving_name=model.serving_name,
-            serving_size=model.serving_size,
-            calories=model.calories,
-            protein=Protein(
-                grams=model.protein_grams,
-                complete_amino_acid_profile=model.protein_complete_amino_acid_profile,
-                amino_acids=amino_acids
-            ),
-            carbs=Carbs(
-                grams=model.carbs_grams,
-                fiber=model.carbs_fiber,
-                sugar=model.carbs_sugar,
-                added_sugars=model.carbs_added_sugars
-            ),
-            fat=Fat(
-                grams=model.fat_grams,
-                saturated=model.fat_saturated,
-                monounsaturated=model.fat_monounsaturated,
-                polyunsaturated=model.fat_polyunsaturated,
-                trans=model.fat_trans
-            )
-        )
-
     def _model_to_schema(self, model: MealModel) -> Meal:
+        foods = food_cache.get_many(self.db, [mf.food_id for mf in model.meal_foods])
         meal_foods = []
         for mf in model.meal_foods:
+            # Skip if food was deleted (orphaned reference)
+            if mf.food_id not in foods:
+                continue
             meal_foods.append(MealFood(
-                food=self._food_model_to_schema(mf.food),
+                food=foods[mf.food_id],
                 servings=mf.servings
             ))
         
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from src.domain.Phase.models import PhaseModel
 from src.domain.Phase.schemas import Phase
 from src.api.schemas import PhaseRequest
+from src.reference_cache import ReferenceCache
 
 
 class PhaseRepository:
@@ -15,10 +16,7 @@ class PhaseRepository:
         )
 
     def get_by_id(self, phase_id: int) -> Phase | None:
-        model = self.db.query(PhaseModel).filter(PhaseModel.id == phase_id).first()
-        if model is None:
-            return None
-        return self._model_to_schema(model)
+        return phase_cache.get(self.db, phase_id)
 
     def get_all(self) -> list[Phase]:
         models = self.db.query(PhaseModel).all()
@@ -41,6 +39,7 @@ class PhaseRepository:
         model.name = phase.name
         
         self.db.commit()
+        phase_cache.invalidate([phase_id])
         self.db.refresh(model)
         return self._model_to_schema(model)
 
@@ -51,6 +50,7 @@ class PhaseRepository:
         phase = self._model_to_schema(model)
         self.db.delete(model)
         self.db.commit()
+        phase_cache.invalidate([phase_id])
         return phase
 
     def delete_all(self) -> list[Phase]:
@@ -59,5 +59,8 @@ class PhaseRepository:
         for model in models:
             self.db.delete(model)
         self.db.commit()
+        phase_cache.invalidate()
         return phases
 
+
+phase_cache = ReferenceCache("phases", PhaseModel, lambda db, model: PhaseRepository(db)._model_to_schema(model))
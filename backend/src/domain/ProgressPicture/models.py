@@ -9,7 +9,7 @@ class ProgressPictureModel(Base):
     __tablename__ = "progress_pictures"
 
     id = Column(Integer, primary_key=True, index=True)
-    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False)
+    log_entry_id = Column(Integer, ForeignKey('log_entries.id'), nullable=False, index=True)
     label = Column(String, nullable=True)
     filename = Column(String, nullable=False)
     original_filename = Column(String, nullable=False)
@@ -0,0 +1,59 @@
+"""Resized copies of progress pictures, generated on first request and cached on disk"""
+import os
+import uuid
+from enum import Enum
+from pathlib import Path
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+
+class PictureSize(str, Enum):
+    THUMB = "thumb"    # Gallery grids
+    MEDIUM = "medium"  # Lightbox and comparison views
+
+
+# Longest side in pixels for each size; pictures already smaller are not upscaled
+MAX_DIMENSIONS = {
+    PictureSize.THUMB: 400,
+    PictureSize.MEDIUM: 1280,
+}
+
+WEBP_QUALITY = 80
+
+
+def variant_path(variant_dir: Path, filename: str, size: PictureSize) -> Path:
+    return variant_dir / f"{Path(filename).stem}_{size.value}.webp"
+
+
+def get_or_create_variant(source: Path, variant_dir: Path, size: PictureSize) -> Path | None:
+    """Path of the resized WebP copy of source, creating it if needed.
+    Returns None if the picture can't be decoded (e.g. HEIC), in which case the original should be served.
+    """
+    dest = variant_path(variant_dir, source.name, size)
+    if dest.exists():
+        return dest
+    try:
+        with Image.open(source) as image:
+            max_dimension = MAX_DIMENSIONS[size]
+            # Lets the JPEG decoder scale down while decoding, which is much faster than a full decode
+            image.draft("RGB", (max_dimension, max_dimension))
+            # Phone cameras store rotation in EXIF; browsers apply it to the original, so bake it in
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                # Alpha channels (LA, PA) and palette/colour-key transparency all need RGBA to survive
+                image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+            image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+            # Write under a temporary name so concurrent requests never serve a partial file
+            tmp = dest.with_name(f".{uuid.uuid4()}.tmp")
+            try:
+                image.save(tmp, "WEBP", quality=WEBP_QUALITY, method=4)
+                os.replace(tmp, dest)
+            finally:
+                tmp.unlink(missing_ok=True)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError):
+        return None
+    return dest
+
+
+def delete_variants(variant_dir: Path, filename: str) -> None:
+    for size in PictureSize:
+        variant_path(variant_dir, filename, size).unlink(missing_ok=True)
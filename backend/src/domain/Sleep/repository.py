@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from src.domain.Sleep.models import SleepModel
 from src.domain.Sleep.schemas import Sleep, Nap
 from src.api.schemas import SleepRequest
+from src.domain.LogEntry.models import LogEntryModel
+from src.domain.Stats.repository import DailyMetricsRepository
 
 
 class SleepRepository:
@@ -56,6 +58,7 @@ class SleepRepository:
         model.notes = sleep.notes
         model.naps = naps_data
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.sleep_id == sleep_id)
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -66,6 +69,7 @@ class SleepRepository:
             return None
         sleep = self._model_to_schema(model)
         self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.sleep_id == sleep_id)
         self.db.commit()
         return sleep
 
@@ -74,6 +78,7 @@ class SleepRepository:
         sleeps = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
         return sleeps
 
@@ -0,0 +1,81 @@
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from src.database import data_version
+from .schemas import StatsQueryRequest, StatsQueryResponse
+
+
+# Tables a stats query reads. A write to any of them makes cached results stale.
+# daily_metrics is left out: it is derived from these and refreshed by reads.
+STATS_TABLES = (
+    "log_entries", "log_entry_foods", "log_entry_supplements", "log_entry_activities",
+    "log_entry_hydrations", "log_entry_cardio",
+    "foods", "activities", "activity_exercises", "activity_sets", "exercises",
+    "cardio", "sleep", "hydration", "cups", "stress", "supplement_compounds", "mesocycles",
+)
+
+# Request fields that only serve to resolve the date range; the resolved range is keyed instead
+RANGE_FIELDS = {"date_range_type", "start_date", "end_date", "mesocycle_id"}
+
+
+class StatsCache:
+    """LRU cache of stats query responses.
+    Entries are keyed by the request and its resolved date range, so relative ranges such as
+    LAST_7_DAYS move to a new key when the day changes. Each entry remembers the data version it
+    was computed at and is dropped on lookup once any stats table has been written since.
+    """
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], StatsQueryResponse]] = OrderedDict()
+        self._lock = Lock()
+
+    def key(self, request: StatsQueryRequest, start: date, end: date) -> str:
+        canonical = request.model_dump(mode="json", exclude=RANGE_FIELDS)
+        canonical["range"] = [start.isoformat(), end.isoformat()]
+        return hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+
+    def version(self) -> tuple[int, ...]:
+        return data_version(STATS_TABLES)
+
+    def get(self, key: str) -> StatsQueryResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == self.version():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, version: tuple[int, ...], response: StatsQueryResponse) -> None:
+        with self._lock:
+            self._entries[key] = (version, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else None,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+stats_cache = StatsCache()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Date, Float, Boolean
 from datetime import datetime
 from src.database import Base
 
@@ -18,3 +18,39 @@ class StatsConfigurationModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+
+
+class DailyMetricsModel(Base):
+    """Materialized per-day values of the unfiltered stats metrics.
+    Write paths mark affected dates dirty; dirty dates are recomputed before they are read.
+    Column names match MetricType values.
+    """
+    __tablename__ = "daily_metrics"
+
+    date = Column(Date, primary_key=True)
+    dirty = Column(Boolean, nullable=False, default=True)
+    # Bumped each time the date is marked dirty, so a refresh only clears the flag if no write
+    # marked the date again while it was computing
+    dirty_version = Column(Integer, nullable=False, default=0, server_default="0")
+
+    weight = Column(Float, nullable=True)
+    calories = Column(Float, nullable=True)
+    protein = Column(Float, nullable=True)
+    complete_protein = Column(Float, nullable=True)
+    carbs = Column(Float, nullable=True)
+    fat = Column(Float, nullable=True)
+    fiber = Column(Float, nullable=True)
+    sugar = Column(Float, nullable=True)
+    workout_count = Column(Float, nullable=True)
+    total_sets = Column(Float, nullable=True)
+    total_reps = Column(Float, nullable=True)
+    total_volume = Column(Float, nullable=True)
+    cardio_minutes = Column(Float, nullable=True)
+    cardio_sessions = Column(Float, nullable=True)
+    sleep_duration = Column(Float, nullable=True)
+    sleep_quality = Column(Float, nullable=True)
+    hydration_oz = Column(Float, nullable=True)
+    hydration_ml = Column(Float, nullable=True)
+    supplement_count = Column(Float, nullable=True)
+    stress_level = Column(Float, nullable=True)
+    alcohol_drinks = Column(Float, nullable=True)
@@ -1,13 +1,18 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import date, datetime, timedelta
-from .models import StatsConfigurationModel
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from src.database import IN_CHUNK_SIZE
+from sqlalchemy import func, case, and_, literal, true, update, delete, bindparam
+from datetime import date, timedelta
+from .models import StatsConfigurationModel, DailyMetricsModel
 from .schemas import (
     StatsConfiguration, StatsConfigurationRequest, StatsConfigurationConfig,
     StatsQueryRequest, StatsQueryResponse, MetricData, DataPoint,
     MetricType, DateRangeType, AggregationType, TrainingFilterType, CardioFilterType
 )
-from src.domain.LogEntry.models import LogEntryModel, LogEntryFoodModel
+from src.domain.LogEntry.models import (
+    LogEntryModel, LogEntryFoodModel, LogEntrySupplementModel, LogEntryActivityModel,
+    LogEntryHydrationModel, LogEntryCardioModel,
+)
 from src.domain.Food.models import FoodModel
 from src.domain.Activity.models import ActivityModel, ActivityExerciseModel, ActivitySetModel
 from src.domain.Cardio.models import CardioModel
@@ -56,12 +61,63 @@ METRIC_INFO = {
     MetricType.ALCOHOL_DRINKS: {"label": "Alcohol", "unit": "drinks"},
 }
 
+# Counts and totals add up over a week or month; levels, rates and daily intake are averaged
+SUMMED_METRICS = {
+    MetricType.WORKOUT_COUNT, MetricType.TOTAL_SETS, MetricType.TOTAL_REPS, MetricType.TOTAL_VOLUME,
+    MetricType.EXERCISE_REPS, MetricType.EXERCISE_SETS, MetricType.EXERCISE_VOLUME,
+    MetricType.CARDIO_DURATION, MetricType.CARDIO_DISTANCE, MetricType.CARDIO_MINUTES, MetricType.CARDIO_SESSIONS,
+    MetricType.ALCOHOL_DRINKS,
+}
+
+# Request fields that change the per-day values of live (non-rollup) metrics
+FILTER_FIELDS = {
+    "training_filter_type", "exercise_id", "movement_pattern_id", "workout_id", "training_mesocycle_id",
+    "cardio_filter_type", "supplement_ids", "compound_ids",
+}
+
+# Food column summed (times servings) for each nutrition metric
+FOOD_NUTRIENT_COLUMNS = {
+    MetricType.CALORIES: FoodModel.calories,
+    MetricType.PROTEIN: FoodModel.protein_grams,
+    MetricType.CARBS: FoodModel.carbs_grams,
+    MetricType.FAT: FoodModel.fat_grams,
+    MetricType.FIBER: FoodModel.carbs_fiber,
+    MetricType.SUGAR: FoodModel.carbs_sugar,
+}
+
+# exercise_data field read by each cardio-specific metric
+CARDIO_FIELDS = {
+    MetricType.CARDIO_DURATION: 'duration_minutes',
+    MetricType.CARDIO_DISTANCE: 'distance',
+    MetricType.CARDIO_SPEED: 'speed',
+    MetricType.CARDIO_INCLINE: 'incline',
+}
+
+# Cardio metrics that add up over the day; the others are averaged
+SUMMED_CARDIO_FIELDS = {MetricType.CARDIO_DURATION, MetricType.CARDIO_DISTANCE}
+
+ML_PER_OZ = 29.5735
+
+# Numeric value of each stress level
+STRESS_LEVEL_VALUES = {'very_low': 1, 'low': 2, 'moderate': 3, 'high': 4, 'very_high': 5}
+
+# Metrics that don't depend on request filters; served from the daily_metrics rollup
+ROLLUP_METRICS = [
+    MetricType.WEIGHT, MetricType.CALORIES, MetricType.PROTEIN, MetricType.COMPLETE_PROTEIN,
+    MetricType.CARBS, MetricType.FAT, MetricType.FIBER, MetricType.SUGAR,
+    MetricType.WORKOUT_COUNT, MetricType.TOTAL_SETS, MetricType.TOTAL_REPS, MetricType.TOTAL_VOLUME,
+    MetricType.CARDIO_MINUTES, MetricType.CARDIO_SESSIONS,
+    MetricType.SLEEP_DURATION, MetricType.SLEEP_QUALITY,
+    MetricType.HYDRATION_OZ, MetricType.HYDRATION_ML,
+    MetricType.SUPPLEMENT_COUNT, MetricType.STRESS_LEVEL, MetricType.ALCOHOL_DRINKS,
+]
+
 
 class StatsRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def _get_date_range(self, request: StatsQueryRequest) -> tuple[date, date]:
+    def get_date_range(self, request: StatsQueryRequest) -> tuple[date, date]:
         """Calculate actual date range based on request"""
         today = date.today()
         
@@ -99,300 +155,218 @@ class StatsRepository:
         
         return today - timedelta(days=30), today
 
-    def _get_log_entries_in_range(self, start: date, end: date):
-        """Get all log entries within date range"""
-        return self.db.query(LogEntryModel).filter(
-            func.date(LogEntryModel.timestamp) >= start,
-            func.date(LogEntryModel.timestamp) <= end
-        ).all()
-
-    def _aggregate_by_period(self, data: dict[date, float], start: date, end: date, 
-                             aggregation: AggregationType) -> list[DataPoint]:
-        """Aggregate data points by the specified period"""
-        result = []
-        current = start
+    def _aggregate_by_period(self, data: dict[date, float], start: date, end: date,
+                             aggregation: AggregationType, summed: bool = False) -> list[DataPoint]:
+        """Aggregate data points by the specified period.
+        Each day is mapped straight to its bucket index (day offset, week offset or month offset from start),
+        so the work is one pass over the data plus one per period. Buckets sum or average their values.
+        """
+        start_ordinal = start.toordinal()
+        if aggregation == AggregationType.MONTHLY:
+            start_month = start.year * 12 + start.month - 1
+            num_periods = end.year * 12 + end.month - 1 - start_month + 1
+            keys = [f"{(start_month + i) // 12:04d}-{(start_month + i) % 12 + 1:02d}" for i in range(num_periods)]
+            bucket_of = lambda d: d.year * 12 + d.month - 1 - start_month
+        else:
+            days_per_period = 7 if aggregation == AggregationType.WEEKLY else 1
+            num_periods = (end.toordinal() - start_ordinal) // days_per_period + 1
+            keys = [date.fromordinal(start_ordinal + i * days_per_period).isoformat() for i in range(num_periods)]
+            bucket_of = lambda d: (d.toordinal() - start_ordinal) // days_per_period
         
-        while current <= end:
-            if aggregation == AggregationType.DAILY:
-                period_end = current
-                period_key = current.isoformat()
-            elif aggregation == AggregationType.WEEKLY:
-                period_end = min(current + timedelta(days=6), end)
-                period_key = current.isoformat()
-            elif aggregation == AggregationType.MONTHLY:
-                # Go to end of month
-                if current.month == 12:
-                    next_month = current.replace(year=current.year + 1, month=1, day=1)
-                else:
-                    next_month = current.replace(month=current.month + 1, day=1)
-                period_end = min(next_month - timedelta(days=1), end)
-                period_key = current.strftime("%Y-%m")
-            
-            # Sum values for this period
-            period_values = []
-            check_date = current
-            while check_date <= period_end:
-                if check_date in data and data[check_date] is not None:
-                    period_values.append(data[check_date])
-                check_date += timedelta(days=1)
-            
-            if period_values:
-                # Use average for rates/levels, sum for counts
-                result.append(DataPoint(date=period_key, value=sum(period_values) / len(period_values)))
-            else:
-                result.append(DataPoint(date=period_key, value=None))
-            
-            # Move to next period
-            if aggregation == AggregationType.DAILY:
-                current += timedelta(days=1)
-            elif aggregation == AggregationType.WEEKLY:
-                current += timedelta(days=7)
-            elif aggregation == AggregationType.MONTHLY:
-                if current.month == 12:
-                    current = current.replace(year=current.year + 1, month=1, day=1)
-                else:
-                    current = current.replace(month=current.month + 1, day=1)
+        sums = [0.0] * num_periods
+        counts = [0] * num_periods
+        for day, value in data.items():
+            if value is None or day < start or day > end:
+                continue
+            bucket = bucket_of(day)
+            sums[bucket] += value
+            counts[bucket] += 1
         
-        return result
+        return [
+            DataPoint(date=key, value=(total if summed else total / count) if count else None)
+            for key, total, count in zip(keys, sums, counts)
+        ]
+
+    # =========================================================================
+    # SQL pushdown: metrics compile to per-day aggregates over a shared source
+    # =========================================================================
+
+    def _filter_range(self, query, start: date, end: date):
+        """Restrict a query joined on LogEntryModel to entries dated between start and end"""
+        return query.filter(LogEntryModel.entry_date >= start, LogEntryModel.entry_date <= end)
+
+    def _compile_metric(self, metric: MetricType, request: StatsQueryRequest):
+        """Compile a metric into (source, aggregate, positive_only).
+        Metrics with the same source are evaluated together in one grouped query; per-metric
+        conditions are folded into the aggregate so they don't restrict the shared rows.
+        positive_only drops days whose value isn't > 0. Returns None for unknown metrics.
+        """
+        if metric == MetricType.WEIGHT:
+            weight = LogEntryModel.morning_weight
+            return "entry", func.avg(case((weight != 0, weight))), False
+        if metric == MetricType.ALCOHOL_DRINKS:
+            drinks = LogEntryModel.num_standard_drinks
+            return "entry", func.sum(case((drinks != 0, drinks))), False
+
+        if metric in FOOD_NUTRIENT_COLUMNS:
+            amount = func.coalesce(FOOD_NUTRIENT_COLUMNS[metric], 0) * LogEntryFoodModel.servings
+            return "foods", func.sum(amount), True
+        if metric == MetricType.COMPLETE_PROTEIN:
+            amount = func.coalesce(FoodModel.protein_grams, 0) * LogEntryFoodModel.servings
+            return "foods", func.sum(case((FoodModel.protein_complete_amino_acid_profile.is_(True), amount))), True
+
+        if metric == MetricType.WORKOUT_COUNT:
+            return "activities", func.count(LogEntryActivityModel.id), False
+
+        reps = func.coalesce(ActivitySetModel.reps, 0)
+        volume = reps * func.coalesce(ActivitySetModel.weight, 0)
+        if metric == MetricType.TOTAL_SETS:
+            return "sets", func.count(ActivitySetModel.id), True
+        if metric == MetricType.TOTAL_REPS:
+            return "sets", func.sum(reps), True
+        if metric == MetricType.TOTAL_VOLUME:
+            return "sets", func.sum(volume), True
+        if metric in [MetricType.EXERCISE_WEIGHT, MetricType.EXERCISE_REPS,
+                      MetricType.EXERCISE_SETS, MetricType.EXERCISE_VOLUME]:
+            # Aggregates of a filtered-out set are NULL, so days without matching sets have no value
+            condition = self._training_filter_condition(request)
+            if metric == MetricType.EXERCISE_WEIGHT:
+                # Use max weight for the day
+                condition = and_(condition, ActivitySetModel.weight != 0)
+                return "sets", func.max(case((condition, ActivitySetModel.weight))), False
+            per_set = {
+                MetricType.EXERCISE_SETS: literal(1),
+                MetricType.EXERCISE_REPS: reps,
+                MetricType.EXERCISE_VOLUME: volume,
+            }[metric]
+            return "sets", func.sum(case((condition, per_set))), False
+
+        if metric == MetricType.SUPPLEMENT_COUNT:
+            return "supplements", func.count(LogEntrySupplementModel.id), False
+        if metric == MetricType.SUPPLEMENT_SERVINGS:
+            selected = LogEntrySupplementModel.supplement_id.in_(request.supplement_ids or [])
+            return "supplements", func.sum(case((selected, LogEntrySupplementModel.servings))), True
+        if metric == MetricType.COMPOUND_AMOUNT:
+            selected = SupplementCompoundModel.compound_id.in_(request.compound_ids or [])
+            amount = SupplementCompoundModel.amount * LogEntrySupplementModel.servings
+            return "compounds", func.sum(case((selected, amount))), True
+
+        if metric == MetricType.SLEEP_DURATION:
+            return "sleep", func.avg(SleepModel.duration), False
+        if metric == MetricType.SLEEP_QUALITY:
+            return "sleep", func.avg(SleepModel.quality), False
+        if metric == MetricType.STRESS_LEVEL:
+            return "stress", func.avg(case(STRESS_LEVEL_VALUES, value=StressModel.level, else_=3)), False
+
+        if metric == MetricType.CARDIO_SESSIONS:
+            # Links to deleted cardio still count as a session
+            return "cardio", func.count(LogEntryCardioModel.id), True
+        if metric == MetricType.CARDIO_MINUTES:
+            minutes = func.json_extract(CardioModel.exercise_data, "$.duration_minutes")
+            return "cardio", func.sum(func.coalesce(minutes, 0)), True
+        if metric in CARDIO_FIELDS:
+            value = func.json_extract(CardioModel.exercise_data, f"$.{CARDIO_FIELDS[metric]}")
+            condition = value != 0
+            if request.cardio_filter_type != CardioFilterType.NONE:
+                condition = and_(condition, CardioModel.exercise_type == request.cardio_filter_type.value)
+            aggregate = func.sum if metric in SUMMED_CARDIO_FIELDS else func.avg
+            return "cardio", aggregate(case((condition, value))), False
 
-    def _get_metric_data(self, metric: MetricType, entries: list, 
-                         start: date, end: date, aggregation: AggregationType,
-                         request: StatsQueryRequest | None = None) -> MetricData:
-        """Get data for a specific metric"""
-        data_by_date: dict[date, float] = {}
+        if metric in [MetricType.HYDRATION_OZ, MetricType.HYDRATION_ML]:
+            amount = CupModel.amount * HydrationModel.servings
+            is_oz = CupModel.unit == 'oz'
+            if metric == MetricType.HYDRATION_OZ:
+                amount = case((is_oz, amount), else_=amount / ML_PER_OZ)
+            else:
+                amount = case((is_oz, amount * ML_PER_OZ), else_=amount)
+            return "hydration", func.sum(amount), True
+
+        return None
+
+    def _training_filter_condition(self, request: StatsQueryRequest):
+        """Condition on the joined set rows for the request's training filter"""
+        if request.training_filter_type == TrainingFilterType.WORKOUT and request.workout_id:
+            return ActivityModel.workout_id == request.workout_id
+        if request.training_filter_type == TrainingFilterType.EXERCISE and request.exercise_id:
+            return ExerciseModel.id == request.exercise_id
+        if request.training_filter_type == TrainingFilterType.MOVEMENT_PATTERN and request.movement_pattern_id:
+            return ExerciseModel.movement_pattern_id == request.movement_pattern_id
+        return true()
+
+    def _join_source(self, query, source: str):
+        """Join the rows a metric source aggregates over onto a log entry query"""
+        if source == "foods":
+            return query.join(
+                LogEntryFoodModel, LogEntryFoodModel.log_entry_id == LogEntryModel.id
+            ).join(FoodModel, FoodModel.id == LogEntryFoodModel.food_id)
+        if source == "activities":
+            return query.join(LogEntryActivityModel, LogEntryActivityModel.log_entry_id == LogEntryModel.id)
+        if source == "sets":
+            return query.join(
+                LogEntryActivityModel, LogEntryActivityModel.log_entry_id == LogEntryModel.id
+            ).join(
+                ActivityModel, ActivityModel.id == LogEntryActivityModel.activity_id
+            ).join(
+                ActivityExerciseModel, ActivityExerciseModel.activity_id == ActivityModel.id
+            ).outerjoin(
+                # Sets of a deleted exercise still count towards the day's totals
+                ExerciseModel, ExerciseModel.id == ActivityExerciseModel.exercise_id
+            ).join(
+                ActivitySetModel, ActivitySetModel.activity_exercise_id == ActivityExerciseModel.id
+            )
+        if source == "supplements":
+            return query.join(LogEntrySupplementModel, LogEntrySupplementModel.log_entry_id == LogEntryModel.id)
+        if source == "compounds":
+            return query.join(
+                LogEntrySupplementModel, LogEntrySupplementModel.log_entry_id == LogEntryModel.id
+            ).join(
+                SupplementCompoundModel, SupplementCompoundModel.supplement_id == LogEntrySupplementModel.supplement_id
+            )
+        if source == "sleep":
+            return query.join(SleepModel, SleepModel.id == LogEntryModel.sleep_id)
+        if source == "stress":
+            return query.join(StressModel, StressModel.id == LogEntryModel.stress_id)
+        if source == "cardio":
+            return query.join(
+                LogEntryCardioModel, LogEntryCardioModel.log_entry_id == LogEntryModel.id
+            ).outerjoin(CardioModel, CardioModel.id == LogEntryCardioModel.cardio_id)
+        if source == "hydration":
+            return query.join(
+                LogEntryHydrationModel, LogEntryHydrationModel.log_entry_id == LogEntryModel.id
+            ).join(
+                HydrationModel, HydrationModel.id == LogEntryHydrationModel.hydration_id
+            ).join(CupModel, CupModel.id == HydrationModel.cup_id)
+        return query
+
+    def _compute_daily_values(self, metrics: list[MetricType], start: date, end: date,
+                              request: StatsQueryRequest) -> dict[MetricType, dict[date, float]]:
+        """Compute per-day values from the raw rows, one grouped query per metric source"""
+        by_source: dict[str, list[tuple[MetricType, object, bool]]] = {}
+        for metric in dict.fromkeys(metrics):
+            compiled = self._compile_metric(metric, request)
+            if compiled is not None:
+                source, aggregate, positive_only = compiled
+                by_source.setdefault(source, []).append((metric, aggregate, positive_only))
         
-        for entry in entries:
-            entry_date = entry.timestamp.date() if isinstance(entry.timestamp, datetime) else entry.timestamp
-            
-            if metric == MetricType.WEIGHT:
-                if entry.morning_weight:
-                    data_by_date[entry_date] = entry.morning_weight
-                    
-            elif metric == MetricType.ALCOHOL_DRINKS:
-                if entry.num_standard_drinks:
-                    data_by_date[entry_date] = entry.num_standard_drinks
-                    
-            elif metric in [MetricType.CALORIES, MetricType.PROTEIN, MetricType.CARBS, 
-                          MetricType.FAT, MetricType.FIBER, MetricType.SUGAR]:
-                # Sum nutrition from foods
-                total = 0
-                for food_entry in entry.log_entry_foods:
-                    food = food_entry.food
-                    servings = food_entry.servings
-                    if metric == MetricType.CALORIES:
-                        total += (food.calories or 0) * servings
-                    elif metric == MetricType.PROTEIN:
-                        total += (food.protein_grams or 0) * servings
-                    elif metric == MetricType.CARBS:
-                        total += (food.carbs_grams or 0) * servings
-                    elif metric == MetricType.FAT:
-                        total += (food.fat_grams or 0) * servings
-                    elif metric == MetricType.FIBER:
-                        total += (food.carbs_fiber or 0) * servings
-                    elif metric == MetricType.SUGAR:
-                        total += (food.carbs_sugar or 0) * servings
-                if total > 0:
-                    data_by_date[entry_date] = total
-            
-            elif metric == MetricType.COMPLETE_PROTEIN:
-                # Sum protein only from foods with complete amino acid profile
-                total = 0
-                for food_entry in entry.log_entry_foods:
-                    food = food_entry.food
-                    if food.protein_complete_amino_acid_profile:
-                        total += (food.protein_grams or 0) * food_entry.servings
-                if total > 0:
-                    data_by_date[entry_date] = total
-            
-            elif metric in [MetricType.EXERCISE_WEIGHT, MetricType.EXERCISE_REPS, 
-                          MetricType.EXERCISE_SETS, MetricType.EXERCISE_VOLUME]:
-                # Exercise-specific metrics with filters
-                if request:
-                    values = []
-                    for activity_link in entry.log_entry_activities:
-                        activity = activity_link.activity
-                        if not activity:
-                            continue
-                        
-                        # Apply workout filter
-                        if request.training_filter_type == TrainingFilterType.WORKOUT:
-                            if request.workout_id and activity.workout_id != request.workout_id:
-                                continue
-                        
-                        for ex in activity.exercises:
-                            exercise = ex.exercise
-                            
-                            # Apply exercise filter
-                            if request.training_filter_type == TrainingFilterType.EXERCISE:
-                                if request.exercise_id and exercise.id != request.exercise_id:
-                                    continue
-                            
-                            # Apply movement pattern filter
-                            if request.training_filter_type == TrainingFilterType.MOVEMENT_PATTERN:
-                                if request.movement_pattern_id and exercise.movement_pattern_id != request.movement_pattern_id:
-                                    continue
-                            
-                            for s in ex.sets:
-                                if metric == MetricType.EXERCISE_SETS:
-                                    values.append(1)
-                                elif metric == MetricType.EXERCISE_REPS:
-                                    values.append(s.reps or 0)
-                                elif metric == MetricType.EXERCISE_WEIGHT:
-                                    if s.weight:
-                                        values.append(s.weight)
-                                elif metric == MetricType.EXERCISE_VOLUME:
-                                    values.append((s.reps or 0) * (s.weight or 0))
-                    
-                    if values:
-                        if metric == MetricType.EXERCISE_WEIGHT:
-                            # Use max weight for the day
-                            data_by_date[entry_date] = max(values)
-                        else:
-                            # Sum for reps, sets, volume
-                            data_by_date[entry_date] = sum(values)
-                    
-            elif metric == MetricType.WORKOUT_COUNT:
-                count = len(entry.log_entry_activities)
-                if count > 0:
-                    data_by_date[entry_date] = count
-                    
-            elif metric in [MetricType.TOTAL_SETS, MetricType.TOTAL_REPS, MetricType.TOTAL_VOLUME]:
-                total = 0
-                for activity_link in entry.log_entry_activities:
-                    activity = activity_link.activity
-                    if activity:
-                        for ex in activity.exercises:
-                            for s in ex.sets:
-                                if metric == MetricType.TOTAL_SETS:
-                                    total += 1
-                                elif metric == MetricType.TOTAL_REPS:
-                                    total += s.reps or 0
-                                elif metric == MetricType.TOTAL_VOLUME:
-                                    total += (s.reps or 0) * (s.weight or 0)
-                if total > 0:
-                    data_by_date[entry_date] = total
-                    
-            elif metric in [MetricType.CARDIO_MINUTES, MetricType.CARDIO_SESSIONS]:
-                if entry.cardio_ids:
-                    if metric == MetricType.CARDIO_SESSIONS:
-                        data_by_date[entry_date] = len(entry.cardio_ids)
-                    else:
-                        total_minutes = 0
-                        for cardio_id in entry.cardio_ids:
-                            cardio = self.db.query(CardioModel).filter(CardioModel.id == cardio_id).first()
-                            if cardio and cardio.exercise_data:
-                                total_minutes += cardio.exercise_data.get('duration_minutes', 0)
-                        if total_minutes > 0:
-                            data_by_date[entry_date] = total_minutes
-            
-            elif metric in [MetricType.CARDIO_DURATION, MetricType.CARDIO_DISTANCE, 
-                          MetricType.CARDIO_SPEED, MetricType.CARDIO_INCLINE]:
-                # Cardio-specific metrics with optional type filter
-                if entry.cardio_ids and request:
-                    values = []
-                    for cardio_id in entry.cardio_ids:
-                        cardio = self.db.query(CardioModel).filter(CardioModel.id == cardio_id).first()
-                        if not cardio:
-                            continue
-                        
-                        # Apply cardio type filter
-                        if request.cardio_filter_type != CardioFilterType.NONE:
-                            if cardio.exercise_type != request.cardio_filter_type.value:
-                                continue
-                        
-                        data = cardio.exercise_data or {}
-                        
-                        if metric == MetricType.CARDIO_DURATION:
-                            if data.get('duration_minutes'):
-                                values.append(data['duration_minutes'])
-                        elif metric == MetricType.CARDIO_DISTANCE:
-                            if data.get('distance'):
-                                values.append(data['distance'])
-                        elif metric == MetricType.CARDIO_SPEED:
-                            if data.get('speed'):
-                                values.append(data['speed'])
-                        elif metric == MetricType.CARDIO_INCLINE:
-                            if data.get('incline'):
-                                values.append(data['incline'])
-                    
-                    if values:
-                        # Sum for duration/distance, average for speed/incline
-                        if metric in [MetricType.CARDIO_DURATION, MetricType.CARDIO_DISTANCE]:
-                            data_by_date[entry_date] = sum(values)
-                        else:
-                            data_by_date[entry_date] = sum(values) / len(values)
-                            
-            elif metric == MetricType.SLEEP_DURATION:
-                if entry.sleep_id:
-                    sleep = self.db.query(SleepModel).filter(SleepModel.id == entry.sleep_id).first()
-                    if sleep:
-                        data_by_date[entry_date] = sleep.duration
-                        
-            elif metric == MetricType.SLEEP_QUALITY:
-                if entry.sleep_id:
-                    sleep = self.db.query(SleepModel).filter(SleepModel.id == entry.sleep_id).first()
-                    if sleep:
-                        data_by_date[entry_date] = sleep.quality
-                        
-            elif metric in [MetricType.HYDRATION_OZ, MetricType.HYDRATION_ML]:
-                if entry.hydration_ids:
-                    total = 0
-                    for hyd_id in entry.hydration_ids:
-                        hyd = self.db.query(HydrationModel).filter(HydrationModel.id == hyd_id).first()
-                        if hyd and hyd.cup:
-                            amount = hyd.cup.amount * hyd.servings
-                            if hyd.cup.unit == 'oz':
-                                if metric == MetricType.HYDRATION_OZ:
-                                    total += amount
-                                else:
-                                    total += amount * 29.5735  # Convert to ml
-                            else:  # ml
-                                if metric == MetricType.HYDRATION_ML:
-                                    total += amount
-                                else:
-                                    total += amount / 29.5735  # Convert to oz
-                    if total > 0:
-                        data_by_date[entry_date] = total
-                        
-            elif metric == MetricType.SUPPLEMENT_COUNT:
-                count = len(entry.log_entry_supplements)
-                if count > 0:
-                    data_by_date[entry_date] = count
-            
-            elif metric == MetricType.SUPPLEMENT_SERVINGS:
-                # Track servings for specific supplements
-                if request and request.supplement_ids:
-                    total_servings = 0
-                    for supp_entry in entry.log_entry_supplements:
-                        if supp_entry.supplement_id in request.supplement_ids:
-                            total_servings += supp_entry.servings
-                    if total_servings > 0:
-                        data_by_date[entry_date] = total_servings
-            
-            elif metric == MetricType.COMPOUND_AMOUNT:
-                # Track total amount of specific compounds
-                if request and request.compound_ids:
-                    total_amount = 0
-                    for supp_entry in entry.log_entry_supplements:
-                        supplement = supp_entry.supplement
-                        if supplement:
-                            # Get compound amounts from supplement
-                            for sc in supplement.supplement_compounds:
-                                if sc.compound_id in request.compound_ids:
-                                    total_amount += sc.amount * supp_entry.servings
-                    if total_amount > 0:
-                        data_by_date[entry_date] = total_amount
-                    
-            elif metric == MetricType.STRESS_LEVEL:
-                if entry.stress_id:
-                    stress = self.db.query(StressModel).filter(StressModel.id == entry.stress_id).first()
-                    if stress:
-                        # Convert stress level to numeric
-                        level_map = {'very_low': 1, 'low': 2, 'moderate': 3, 'high': 4, 'very_high': 5}
-                        data_by_date[entry_date] = level_map.get(stress.level, 3)
-
-        # Aggregate data
-        data_points = self._aggregate_by_period(data_by_date, start, end, aggregation)
+        results: dict[MetricType, dict[date, float]] = {}
+        day = LogEntryModel.entry_date
+        for source, compiled_metrics in by_source.items():
+            query = self.db.query(day, *[aggregate for _, aggregate, _ in compiled_metrics])
+            query = self._filter_range(self._join_source(query, source), start, end).group_by(day)
+            for metric, _, _ in compiled_metrics:
+                results[metric] = {}
+            for row in query.all():
+                row_date = row[0]
+                for (metric, _, positive_only), value in zip(compiled_metrics, row[1:]):
+                    if value is None or (positive_only and value <= 0):
+                        continue
+                    results[metric][row_date] = value
+        return results
+
+    def _build_metric_data(self, metric: MetricType, data_by_date: dict[date, float],
+                           start: date, end: date, aggregation: AggregationType) -> MetricData:
+        """Aggregate per-day values into periods and summarize them"""
+        data_points = self._aggregate_by_period(data_by_date, start, end, aggregation, metric in SUMMED_METRICS)
         
         # Calculate stats
         values = [dp.value for dp in data_points if dp.value is not None]
@@ -410,22 +384,156 @@ class StatsRepository:
             total=sum(values) if values else None
         )
 
-    def query_stats(self, request: StatsQueryRequest) -> StatsQueryResponse:
-        """Execute a stats query and return the data"""
-        start_date, end_date = self._get_date_range(request)
-        entries = self._get_log_entries_in_range(start_date, end_date)
+    def query_stats(self, request: StatsQueryRequest,
+                    date_range: tuple[date, date] | None = None) -> StatsQueryResponse:
+        """Execute a stats query and return the data.
+        date_range is the request's already resolved range, if the caller has it.
+        """
+        return self.query_stats_batch([request], [date_range] if date_range else None)[0]
+
+    def query_stats_batch(self, requests: list[StatsQueryRequest],
+                          date_ranges: list[tuple[date, date]] | None = None) -> list[StatsQueryResponse]:
+        """Execute several stats queries, sharing the per-day computation between them.
+        Rollup metrics are read once over the union of all date ranges; live metrics are computed
+        once per distinct set of filters over the union of that group's ranges.
+        """
+        date_ranges = date_ranges or [self.get_date_range(request) for request in requests]
+        data_by_request: list[dict[MetricType, dict[date, float]]] = [{} for _ in requests]
+        
+        # Filter-independent metrics come from the daily rollup, the rest from the raw rows
+        rollup = list(dict.fromkeys(m for r in requests for m in r.metrics if m in ROLLUP_METRICS))
+        if rollup:
+            rollup_data = DailyMetricsRepository(self.db).get_values(
+                rollup, min(s for s, _ in date_ranges), max(e for _, e in date_ranges)
+            )
+            for data in data_by_request:
+                data.update(rollup_data)
+        
+        groups: dict[str, list[int]] = {}
+        for i, request in enumerate(requests):
+            if any(m not in ROLLUP_METRICS for m in request.metrics):
+                groups.setdefault(request.model_dump_json(include=FILTER_FIELDS), []).append(i)
+        for indices in groups.values():
+            live = list(dict.fromkeys(
+                m for i in indices for m in requests[i].metrics if m not in ROLLUP_METRICS
+            ))
+            live_data = self._compute_daily_values(
+                live,
+                min(date_ranges[i][0] for i in indices),
+                max(date_ranges[i][1] for i in indices),
+                requests[indices[0]]
+            )
+            for i in indices:
+                data_by_request[i].update(live_data)
         
-        metrics_data = []
-        for metric in request.metrics:
-            metric_data = self._get_metric_data(metric, entries, start_date, end_date, request.aggregation, request)
-            metrics_data.append(metric_data)
+        responses = []
+        for request, (start_date, end_date), data_by_metric in zip(requests, date_ranges, data_by_request):
+            metrics_data = [
+                self._build_metric_data(metric, data_by_metric.get(metric, {}), start_date, end_date, request.aggregation)
+                for metric in request.metrics
+            ]
+            responses.append(StatsQueryResponse(
+                metrics=metrics_data,
+                start_date=start_date.isoformat(),
+                end_date=end_date.isoformat(),
+                aggregation=request.aggregation
+            ))
+        return responses
+
+
+class DailyMetricsRepository:
+    """Materialized per-day values of ROLLUP_METRICS.
+    Write paths that change a day's stats call mark_dirty / mark_entry_dates_dirty before committing;
+    dirty dates are recomputed from the raw rows the next time they are read.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def mark_dirty(self, dates) -> None:
+        """Flag dates for recomputation, creating their rollup rows if needed"""
+        rows = [{"date": d, "dirty": True} for d in dict.fromkeys(dates)]
+        # Two bound variables per row
+        for offset in range(0, len(rows), IN_CHUNK_SIZE // 2):
+            stmt = sqlite_insert(DailyMetricsModel).values(rows[offset:offset + IN_CHUNK_SIZE // 2])
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[DailyMetricsModel.date],
+                set_={"dirty": True, "dirty_version": DailyMetricsModel.dirty_version + 1}
+            ))
+
+    def mark_entry_dates_dirty(self, *criteria) -> None:
+        """Flag the dates of every log entry matching criteria (all entries if none are given)"""
+        rows = self.db.query(LogEntryModel.entry_date).filter(*criteria).distinct().all()
+        self.mark_dirty(row[0] for row in rows)
+
+    def mark_missing_dirty(self) -> None:
+        """Flag dates that have log entries but no rollup row, e.g. after the table was created"""
+        missing = self.db.query(LogEntryModel.entry_date).outerjoin(
+            DailyMetricsModel, DailyMetricsModel.date == LogEntryModel.entry_date
+        ).filter(DailyMetricsModel.date.is_(None)).distinct().all()
+        self.mark_dirty(row[0] for row in missing)
+
+    def clear(self) -> None:
+        self.db.query(DailyMetricsModel).delete(synchronize_session=False)
+
+    def refresh(self, start: date, end: date) -> dict[date, dict[MetricType, float | None]]:
+        """Recompute the dirty dates between start and end, returning the values computed per date.
+        Each date is only written back if its dirty_version is still the one read here: a writer that
+        marks it dirty again mid-refresh leaves it dirty, to be recomputed on the next read.
+        """
+        versions = dict(self.db.query(DailyMetricsModel.date, DailyMetricsModel.dirty_version).filter(
+            DailyMetricsModel.dirty.is_(True),
+            DailyMetricsModel.date >= start,
+            DailyMetricsModel.date <= end
+        ).all())
+        if not versions:
+            return {}
+        dirty = list(versions)
         
-        return StatsQueryResponse(
-            metrics=metrics_data,
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
-            aggregation=request.aggregation
+        # One computation over the span of dirty dates; only the dirty rows are written
+        first, last = min(dirty), max(dirty)
+        stats = StatsRepository(self.db)
+        request = StatsQueryRequest(
+            metrics=ROLLUP_METRICS, date_range_type=DateRangeType.CUSTOM, start_date=first, end_date=last
         )
+        values = stats._compute_daily_values(ROLLUP_METRICS, first, last, request)
+        entry_dates = {
+            row[0] for row in stats._filter_range(self.db.query(LogEntryModel.entry_date), first, last).distinct().all()
+        }
+        
+        # Core executemany on the table: ORM bulk updates match on the primary key only
+        table = DailyMetricsModel.__table__
+        snapshot = (table.c.date == bindparam("b_date")) & (table.c.dirty_version == bindparam("b_version"))
+        updates = [
+            {"b_date": d, "b_version": versions[d], "dirty": False, **{m.value: values[m].get(d) for m in ROLLUP_METRICS}}
+            for d in dirty if d in entry_dates
+        ]
+        if updates:
+            self.db.execute(update(table).where(snapshot), updates)
+        # Dates whose last log entry is gone have nothing left to roll up
+        emptied = [{"b_date": d, "b_version": versions[d]} for d in dirty if d not in entry_dates]
+        if emptied:
+            self.db.execute(delete(table).where(snapshot), emptied)
+        self.db.commit()
+        return {d: {m: values[m].get(d) for m in ROLLUP_METRICS} for d in dirty}
+
+    def get_values(self, metrics: list[MetricType], start: date, end: date) -> dict[MetricType, dict[date, float]]:
+        """Per-day values of rollup metrics between start and end"""
+        computed = self.refresh(start, end)
+        columns = [getattr(DailyMetricsModel, metric.value) for metric in metrics]
+        rows = self.db.query(DailyMetricsModel.date, DailyMetricsModel.dirty, *columns).filter(
+            DailyMetricsModel.date >= start,
+            DailyMetricsModel.date <= end
+        ).all()
+        results: dict[MetricType, dict[date, float]] = {metric: {} for metric in metrics}
+        for row in rows:
+            row_values = zip(metrics, row[2:])
+            if row[1] and row[0] in computed:
+                # Marked dirty again during the refresh, so not written back; this read uses what it computed
+                row_values = ((metric, computed[row[0]][metric]) for metric in metrics)
+            for metric, value in row_values:
+                if value is not None:
+                    results[metric][row[0]] = value
+        return results
 
 
 class StatsConfigurationRepository:
@@ -454,6 +562,12 @@ class StatsConfigurationRepository:
         ).first()
         return self._model_to_schema(model) if model else None
 
+    def get_by_ids(self, config_ids: list[int]) -> dict[int, StatsConfiguration]:
+        models = self.db.query(StatsConfigurationModel).filter(
+            StatsConfigurationModel.id.in_(config_ids)
+        ).all()
+        return {m.id: self._model_to_schema(m) for m in models}
+
     def create(self, request: StatsConfigurationRequest) -> StatsConfiguration:
         model = StatsConfigurationModel(
             name=request.name,
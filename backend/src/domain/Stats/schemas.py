@@ -154,6 +154,18 @@ class StatsQueryResponse(BaseModel):
     aggregation: AggregationType
 
 
+class StatsBatchQueryRequest(BaseModel):
+    """Several stats queries evaluated together"""
+    queries: list[StatsQueryRequest] = []
+    configuration_ids: list[int] = []  # Saved configurations to evaluate
+
+
+class StatsBatchQueryResponse(BaseModel):
+    """Responses in the order of the request's queries and configuration_ids"""
+    queries: list[StatsQueryResponse]
+    configurations: list[StatsQueryResponse]
+
+
 # Configuration schemas
 class StatsConfigurationConfig(BaseModel):
     """The actual configuration content"""
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from .repository import StatsRepository, StatsConfigurationRepository
+from .cache import stats_cache
 from .schemas import (
     StatsQueryRequest, StatsQueryResponse,
     StatsConfiguration, StatsConfigurationRequest
@@ -7,8 +8,33 @@ from .schemas import (
 
 
 def query_stats(db: Session, request: StatsQueryRequest) -> StatsQueryResponse:
+    return query_stats_batch(db, [request])[0]
+
+
+def query_stats_batch(db: Session, requests: list[StatsQueryRequest]) -> list[StatsQueryResponse]:
+    """Answer each query from the cache where possible and compute the rest in one batch"""
+    # Snapshot the version first so a write committed mid-query leaves the entries stale
+    version = stats_cache.version()
     repo = StatsRepository(db)
-    return repo.query_stats(request)
+    date_ranges = [repo.get_date_range(request) for request in requests]
+    keys = [stats_cache.key(request, *date_range) for request, date_range in zip(requests, date_ranges)]
+    responses = [stats_cache.get(key) for key in keys]
+    
+    missing = [i for i, response in enumerate(responses) if response is None]
+    if missing:
+        computed = repo.query_stats_batch([requests[i] for i in missing], [date_ranges[i] for i in missing])
+        for i, response in zip(missing, computed):
+            stats_cache.put(keys[i], version, response)
+            responses[i] = response
+    return responses
+
+
+def configuration_to_request(config: StatsConfiguration) -> StatsQueryRequest:
+    return StatsQueryRequest(**config.config.model_dump(exclude={"chart_type"}))
+
+
+def get_cache_info() -> dict:
+    return stats_cache.info()
 
 
 def get_all_configurations(db: Session) -> list[StatsConfiguration]:
@@ -21,6 +47,11 @@ def get_configuration(db: Session, config_id: int) -> StatsConfiguration | None:
     return repo.get_by_id(config_id)
 
 
+def get_configurations_by_ids(db: Session, config_ids: list[int]) -> dict[int, StatsConfiguration]:
+    repo = StatsConfigurationRepository(db)
+    return repo.get_by_ids(config_ids)
+
+
 def create_configuration(db: Session, request: StatsConfigurationRequest) -> StatsConfiguration:
     repo = StatsConfigurationRepository(db)
     return repo.create(request)
@@ -2,6 +2,8 @@ from sqlalchemy.orm import Session
 from src.domain.Stress.models import StressModel
 from src.domain.Stress.schemas import Stress, StressLevel
 from src.api.schemas import StressRequest
+from src.domain.LogEntry.models import LogEntryModel
+from src.domain.Stats.repository import DailyMetricsRepository
 
 
 class StressRepository:
@@ -46,6 +48,7 @@ class StressRepository:
         model.level = stress.level.value
         model.notes = stress.notes
         
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.stress_id == stress_id)
         self.db.commit()
         self.db.refresh(model)
         return self._model_to_schema(model)
@@ -56,6 +59,7 @@ class StressRepository:
             return None
         stress = self._model_to_schema(model)
         self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty(LogEntryModel.stress_id == stress_id)
         self.db.commit()
         return stress
 
@@ -64,6 +68,7 @@ class StressRepository:
         stresses = [self._model_to_schema(m) for m in models]
         for model in models:
             self.db.delete(model)
+        DailyMetricsRepository(self.db).mark_entry_dates_dirty()
         self.db.commit()
         return stresses
 
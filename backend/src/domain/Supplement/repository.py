@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from src.domain.Supplement.models import SupplementModel, SupplementCompoundModel
 from src.domain.Supplement.schemas import Supplement, SupplementCompound
-from src.domain.Compound.schemas import Compound, CompoundUnit
+from src.domain.Compound.repository import compound_cache
 
 
 class SupplementRepository:
@@ -9,18 +9,14 @@ class SupplementRepository:
         self.db = db
 
     def _model_to_schema(self, model: SupplementModel) -> Supplement:
+        compound_by_id = compound_cache.get_many(self.db, [sc.compound_id for sc in model.supplement_compounds])
         compounds = []
         for sc in model.supplement_compounds:
             # Skip if compound was deleted (orphaned reference)
-            if sc.compound is None:
+            if sc.compound_id not in compound_by_id:
                 continue
-            compound = Compound(
-                id=sc.compound.id,
-                name=sc.compound.name,
-                unit=CompoundUnit(sc.compound.unit)
-            )
             compounds.append(SupplementCompound(
-                compound=compound,
+                compound=compound_by_id[sc.compound_id],
                 amount=sc.amount
             ))
         
@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from src.domain.Workout.models import WorkoutModel, WorkoutItemModel
 from src.domain.Workout.schemas import Workout, WorkoutItem
-from src.domain.Exercise.schemas import Exercise
+from src.domain.Exercise.repository import exercise_cache
 from src.domain.MovementPattern.schemas import MovementPattern
 
 
@@ -10,19 +10,12 @@ class WorkoutRepository:
         self.db = db
 
     def _model_to_schema(self, model: WorkoutModel) -> Workout:
+        exercise_by_id = exercise_cache.get_many(self.db, [item.exercise_id for item in model.items])
         items = []
         for item in model.items:
-            exercise = None
+            exercise = exercise_by_id.get(item.exercise_id)
             movement_pattern = None
             
-            if item.exercise:
-                exercise = Exercise(
-                    id=item.exercise.id,
-                    name=item.exercise.name,
-                    movement_pattern_id=item.exercise.movement_pattern_id,
-                    notes=item.exercise.notes
-                )
-            
             if item.movement_pattern:
                 movement_pattern = MovementPattern(
                     id=item.movement_pattern.id,
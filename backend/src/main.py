@@ -21,7 +21,9 @@ from src.api.supplement_cycle import supplement_cycle_router
 from src.api.mesocycle import mesocycle_router
 from src.api.progress_picture import progress_picture_router
 from src.api.stats import stats_router
-from src.database import init_db
+from src.api.export import export_router
+from src.database import init_db, async_engine
+from src.reference_cache import get_reference_cache_info
 from src.swagger_ui import DARK_SWAGGER_HTML
 
 app = FastAPI(
@@ -42,15 +44,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/cache/reference")
+def reference_cache_info():
+    """Get hit/miss counters and size of each reference data cache (foods, exercises, cups, compounds, phases)"""
+    return get_reference_cache_info()
+
 @app.on_event("startup")
 def on_startup():
     init_db()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await async_engine.dispose()
     
 app.include_router(log_entry_router)
 app.include_router(food_router)
@@ -72,4 +84,5 @@ app.include_router(supplement_cycle_router)
 app.include_router(mesocycle_router)
 app.include_router(progress_picture_router)
 app.include_router(stats_router)
+app.include_router(export_router)
 
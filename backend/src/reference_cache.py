@@ -0,0 +1,121 @@
+"""In-process cache of reference data schemas (foods, exercises, cups, compounds, phases) by id.
+Log entries, meals, activities and supplements embed these in every response; the cache lets their
+builders reuse one prebuilt schema per row instead of loading and converting the row each time.
+Cached schemas are shared between responses and must not be modified.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Iterable, TypeVar
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.database import IN_CHUNK_SIZE
+
+T = TypeVar("T")
+
+# Every cache by name, for the stats endpoint
+reference_caches: dict[str, "ReferenceCache"] = {}
+
+# Bumped by every invalidation. A session remembers its value when its transaction begins, since
+# rows it loads later still come from that transaction's snapshot.
+_generation = 0
+_generation_lock = Lock()
+
+
+@event.listens_for(Session, "after_begin")
+def _snapshot_generation(session, transaction, connection):
+    session.info["reference_generation"] = _generation
+
+
+def _read_generation(db: Session) -> int:
+    """Generation that rows db loads now are at least as new as"""
+    if db.in_transaction():
+        return db.info.get("reference_generation", _generation)
+    return _generation
+
+
+class ReferenceCache(Generic[T]):
+    """LRU cache of one kind of reference schema, keyed by id.
+    The owning repository calls invalidate after committing an update or delete. Rows read in a
+    transaction that began before an invalidation are returned but not stored, so a read that raced
+    a write can't put the old version back.
+    """
+    def __init__(self, name: str, model_cls, to_schema: Callable[[Session, object], T], max_size: int = 10_000):
+        self.name = name
+        self.model_cls = model_cls
+        self.to_schema = to_schema
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[int, T] = OrderedDict()
+        self._lock = Lock()
+        reference_caches[name] = self
+
+    def get(self, db: Session, id: int) -> T | None:
+        return self.get_many(db, [id]).get(id)
+
+    def get_many(self, db: Session, ids: Iterable[int]) -> dict[int, T]:
+        """Schemas for the given ids, loading the ones not cached with one query per IN_CHUNK_SIZE ids.
+        Ids with no row are left out.
+        """
+        generation = _read_generation(db)
+        found: dict[int, T] = {}
+        missing = []
+        with self._lock:
+            for id in dict.fromkeys(i for i in ids if i is not None):
+                schema = self._entries.get(id)
+                if schema is None:
+                    missing.append(id)
+                else:
+                    self._entries.move_to_end(id)
+                    found[id] = schema
+            self.hits += len(found)
+            self.misses += len(missing)
+        if not missing:
+            return found
+
+        loaded = {}
+        id_column = self.model_cls.id
+        for start in range(0, len(missing), IN_CHUNK_SIZE):
+            for model in db.query(self.model_cls).filter(id_column.in_(missing[start:start + IN_CHUNK_SIZE])):
+                loaded[model.id] = self.to_schema(db, model)
+        found.update(loaded)
+
+        with self._lock:
+            if generation == _generation:
+                self._entries.update(loaded)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return found
+
+    def invalidate(self, ids: Iterable[int] | None = None) -> None:
+        """Drop the given ids, or every entry if ids is None"""
+        global _generation
+        with _generation_lock:
+            _generation += 1
+        with self._lock:
+            if ids is None:
+                self._entries.clear()
+            else:
+                for id in ids:
+                    self._entries.pop(id, None)
+
+    def clear(self) -> None:
+        self.invalidate()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else None,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+def get_reference_cache_info() -> dict[str, dict]:
+    return {name: cache.info() for name, cache in reference_caches.items()}
@@ -0,0 +1,177 @@
+import os
+
+# Set before src is imported, so the module-level engines don't open ./fitness.db
+os.environ["DATABASE_URL"] = "sqlite://"
+
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from src.database import Base, create_db_engine, get_db, get_async_db
+from src.domain.Food.search import ensure_search_index, food_usage_cache
+from src.domain.Stats.cache import stats_cache
+from src.main import app
+from src.reference_cache import reference_caches
+
+
+class StatementLog:
+    """SQL statements an engine executed, recorded by a before_cursor_execute listener.
+    An executemany counts as one statement.
+    """
+    def __init__(self, engine):
+        self.statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def clear(self) -> None:
+        self.statements.clear()
+
+    @property
+    def selects(self) -> list[str]:
+        return [s for s in self.statements if s.lstrip().upper().startswith("SELECT")]
+
+    @property
+    def writes(self) -> list[str]:
+        return [s for s in self.statements if not s.lstrip().upper().startswith("SELECT")]
+
+
+def reset_caches() -> None:
+    """Empty the process-wide caches, whose entries would otherwise outlive a test's database"""
+    for cache in reference_caches.values():
+        cache.clear()
+    food_usage_cache.clear()
+    stats_cache.clear()
+
+
+def create_test_client(engine, async_engine=None) -> TestClient:
+    """Client for the app running on engine, with the schema created and the search index built.
+    Startup events are not run, so the module-level engines are never touched.
+    """
+    Base.metadata.create_all(bind=engine)
+    SessionTest = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionTest()
+    try:
+        ensure_search_index(db)
+    finally:
+        db.close()
+
+    def get_test_db():
+        db = SessionTest()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    if async_engine is not None:
+        AsyncSessionTest = async_sessionmaker(async_engine, autoflush=False)
+
+        async def get_test_async_db():
+            async with AsyncSessionTest() as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = get_test_async_db
+    reset_caches()
+    return TestClient(app)
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine, one database per test"""
+    engine = create_db_engine("sqlite://")
+    yield engine
+    app.dependency_overrides.clear()
+    reset_caches()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine) -> TestClient:
+    return create_test_client(engine)
+
+
+@pytest.fixture
+def statements(engine) -> StatementLog:
+    return StatementLog(engine)
+
+
+@pytest.fixture
+def count_statements(client, statements):
+    """Make one request and return the number of SELECTs and writes it issued, with the caches cold"""
+    def count(method: str, path: str, **kwargs) -> tuple[int, int]:
+        reset_caches()
+        statements.clear()
+        response = client.request(method, path, **kwargs)
+        assert response.status_code in (200, 204), response.text
+        return len(statements.selects), len(statements.writes)
+    return count
+
+
+@pytest.fixture
+def references(client) -> dict:
+    """One of each kind of row a log entry can point at, plus a few foods"""
+    def post(path, body):
+        response = client.post(path, json=body)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    compound = post("/compounds/", {"name": "Vitamin D", "unit": "iu"})
+    exercise = post("/exercises/", {"name": "Squat"})
+    carb_cycle = post("/carb-cycles/", {"name": "Cycle", "days": [{"day_type": "high", "carbs": 300}]})
+    return {
+        "phase": post("/phases/", {"name": "Bulk"})["id"],
+        "cup": post("/cups/", {"name": "Bottle", "amount": 16, "unit": "oz"})["id"],
+        "supplement": post("/supplements/", {
+            "brand": "Brand", "name": "D3", "serving_name": "1 cap",
+            "compounds": [{"compound_id": compound["id"], "amount": 1000}],
+        })["id"],
+        "exercise": exercise["id"],
+        "carb_cycle_day": carb_cycle["days"][0]["id"],
+        "foods": [
+            post("/foods/", {
+                "name": f"Food {i}", "serving_name": "100 g", "serving_size": 100, "calories": 100 + i,
+                "protein": {"grams": 10, "complete_amino_acid_profile": True},
+                "carbs": {"grams": 20, "fiber": 2, "sugar": 3}, "fat": {"grams": 5},
+            })["id"]
+            for i in range(10)
+        ],
+    }
+
+
+def log_entry_body(references: dict, day: int, num_foods: int = 3) -> dict:
+    """Request body for a log entry with every section filled in, day days after 2024-01-01"""
+    timestamp = datetime(2024, 1, 1, 8) + timedelta(days=day)
+    return {
+        "timestamp": timestamp.isoformat(),
+        "phase": {"type": "existing", "id": references["phase"]},
+        "morning_weight": 180.5,
+        "sleep": {"type": "new", "date": timestamp.date().isoformat(), "duration": 420, "quality": 7, "naps": [{"duration": 20}]},
+        "hydration": [{"type": "new", "timestamp": timestamp.isoformat(), "cup_id": references["cup"], "servings": 2}],
+        "foods": [{"food_id": food_id, "servings": 1.5} for food_id in references["foods"][:num_foods]],
+        "activities": [{"type": "new", "time": timestamp.isoformat(), "exercises": [
+            {"exercise_id": references["exercise"], "sets": [{"reps": 8, "weight": 100, "unit": "lb"}]},
+        ]}],
+        "cardio": [{"type": "new", "name": "Walk", "time": timestamp.isoformat(), "exercise": {"type": "walking", "duration_minutes": 30, "distance": 2}}],
+        "supplements": [{"type": "existing", "id": references["supplement"], "servings": 2}],
+        "stress": {"type": "new", "timestamp": timestamp.isoformat(), "level": "low"},
+        "num_standard_drinks": 1,
+        "notes": f"Day {day}",
+        "carb_cycle_day_id": references["carb_cycle_day"],
+    }
+
+
+@pytest.fixture
+def create_log_entries(client, references):
+    """Create log entries on consecutive days, returning their ids"""
+    def create(count: int, first_day: int = 0, **kwargs) -> list[int]:
+        ids = []
+        for day in range(first_day, first_day + count):
+            response = client.post("/log-entries/", json=log_entry_body(references, day, **kwargs))
+            assert response.status_code == 200, response.text
+            ids.append(response.json()["id"])
+        return ids
+    return create
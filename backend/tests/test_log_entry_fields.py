@@ -0,0 +1,27 @@
+from src.domain.LogEntry.schemas import LogEntry
+
+
+def test_unrequested_sections_are_omitted(client, create_log_entries):
+    log_entry_id, = create_log_entries(1)
+    for path in (
+        "/log-entries/?fields=morning_weight",
+        "/log-entries/?fields=morning_weight&limit=10",
+        "/log-entries/range?start=2024-01-01&end=2024-01-01&fields=morning_weight",
+    ):
+        entries = client.get(path).json()
+        assert [set(entry) for entry in entries] == [{"id", "timestamp", "morning_weight"}]
+    for path in (f"/log-entries/{log_entry_id}?fields=morning_weight", "/log-entries/date/2024-01-01?fields=morning_weight"):
+        assert set(client.get(path).json()) == {"id", "timestamp", "morning_weight"}
+
+
+def test_requested_sections_without_data_are_null(client, create_log_entries):
+    log_entry_id, = create_log_entries(1)
+    entry = client.get(f"/log-entries/{log_entry_id}?fields=progress_pictures,notes").json()
+    assert entry == {"id": log_entry_id, "timestamp": "2024-01-01T08:00:00", "progress_pictures": None, "notes": "Day 0"}
+
+
+def test_every_section_is_returned_without_fields(client, create_log_entries):
+    log_entry_id, = create_log_entries(1)
+    entry = client.get(f"/log-entries/{log_entry_id}").json()
+    assert set(entry) == set(LogEntry.model_fields)
+    assert entry["progress_pictures"] is None
@@ -0,0 +1,77 @@
+from datetime import date
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.domain.LogEntry.repository import LogEntryRepository
+
+# Index each table read when building log entries by date must be searched with
+INDEX_BY_TABLE = {
+    "log_entries": "ix_log_entries_entry_date",
+    "log_entry_foods": "ix_log_entry_foods_log_entry_id",
+    "log_entry_supplements": "ix_log_entry_supplements_log_entry_id",
+    "log_entry_activities": "ix_log_entry_activities_log_entry_id",
+    "log_entry_hydrations": "ix_log_entry_hydrations_log_entry_id",
+    "log_entry_cardio": "ix_log_entry_cardio_log_entry_id",
+    "activity_exercises": "ix_activity_exercises_activity_id",
+    "activity_sets": "ix_activity_sets_activity_exercise_id",
+    "progress_pictures": "ix_progress_pictures_log_entry_id",
+}
+
+
+@pytest.mark.parametrize("path", [
+    "/log-entries/",
+    "/log-entries/?limit=100",
+    "/log-entries/range?start=2024-01-01&end=2024-12-31",
+])
+def test_listing_query_count_does_not_grow_with_entries(client, count_statements, create_log_entries, path):
+    """Related rows are loaded per kind for the whole batch, not per log entry"""
+    create_log_entries(5)
+    selects_for_5, _ = count_statements("GET", path)
+    create_log_entries(45, first_day=5)
+    selects_for_50, _ = count_statements("GET", path)
+    assert selects_for_50 == selects_for_5
+    assert len(client.get(path).json()) == 50
+
+
+def test_get_by_date_query_count_matches_listing_one_entry(client, count_statements, create_log_entries):
+    create_log_entries(1)
+    by_date, _ = count_statements("GET", "/log-entries/date/2024-01-01")
+    listing, _ = count_statements("GET", "/log-entries/")
+    assert by_date <= listing
+
+
+def test_delete_all_statement_count_does_not_grow_with_entries(client, count_statements, create_log_entries):
+    create_log_entries(5)
+    for_5 = count_statements("DELETE", "/log-entries/")
+    create_log_entries(50, first_day=5)
+    for_50 = count_statements("DELETE", "/log-entries/")
+    assert for_50 == for_5
+    assert client.get("/log-entries/").json() == []
+
+
+@pytest.mark.parametrize("read", [
+    lambda repository: repository.get_by_date("2024-01-02"),
+    lambda repository: repository.get_in_range(date(2024, 1, 2), date(2024, 1, 5)),
+], ids=["get_by_date", "get_in_range"])
+def test_date_lookups_search_indexes(engine, create_log_entries, read):
+    create_log_entries(10)
+    selects = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    with Session(engine) as db:
+        assert read(LogEntryRepository(db))
+    event.remove(engine, "before_cursor_execute", record)
+
+    with engine.connect() as conn:
+        plan = [
+            row[-1]
+            for statement, parameters in selects
+            for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        ]
+    for table, index in INDEX_BY_TABLE.items():
+        assert any(step.startswith(f"SEARCH {table} USING INDEX {index} ") for step in plan), (table, plan)
+        assert not any(step == f"SCAN {table}" or step.startswith(f"SCAN {table} ") for step in plan), (table, plan)
@@ -0,0 +1,88 @@
+import re
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.domain.LogEntry.models import LogEntryFoodModel
+
+WRITE = re.compile(r"\s*(INSERT INTO|UPDATE|DELETE FROM)\s+(\w+)", re.IGNORECASE)
+
+# Every PUT flags the day for the stats rollup
+MARK_DIRTY = ("INSERT INTO", "daily_metrics")
+
+
+def put_body(entry: dict) -> dict:
+    """PUT request restating a log entry response, referencing its existing rows"""
+    return {
+        "timestamp": entry["timestamp"],
+        "phase": {"type": "existing", "id": entry["phase"]["id"]},
+        "morning_weight": entry["morning_weight"],
+        "sleep": {"type": "existing", "id": entry["sleep"]["id"]},
+        "hydration": [{"type": "existing", "id": h["id"]} for h in entry["hydration"]],
+        "foods": [{"food_id": f["food"]["id"], "servings": f["servings"]} for f in entry["foods"]],
+        "activities": [{"type": "existing", "id": a["id"]} for a in entry["activities"]],
+        "cardio": [{"type": "existing", "id": c["id"]} for c in entry["cardio"]],
+        "supplements": [{"type": "existing", "id": s["supplement"]["id"], "servings": s["servings"]} for s in entry["supplements"]],
+        "stress": {"type": "existing", "id": entry["stress"]["id"]},
+        "num_standard_drinks": entry["num_standard_drinks"],
+        "notes": entry["notes"],
+        "carb_cycle_day_id": entry["carb_cycle"]["selected_day"]["id"],
+    }
+
+
+def food_rows(engine, log_entry_id: int) -> list[tuple[int, int]]:
+    """(row id, food id) of a log entry's foods, in the order they are returned"""
+    with Session(engine) as db:
+        return db.execute(
+            select(LogEntryFoodModel.id, LogEntryFoodModel.food_id)
+            .where(LogEntryFoodModel.log_entry_id == log_entry_id)
+            .order_by(LogEntryFoodModel.id)
+        ).all()
+
+
+def append_food(body):
+    body["foods"].append({"food_id": body["foods"][0]["food_id"], "servings": 3.0})
+
+
+def set_notes(body):
+    body["notes"] = "Changed"
+
+
+@pytest.mark.parametrize("edit, expected_writes", [
+    (lambda body: None, []),
+    (set_notes, [("UPDATE", "log_entries")]),
+    (append_food, [("INSERT INTO", "log_entry_foods")]),
+    (lambda body: body["foods"].pop(0), [("DELETE FROM", "log_entry_foods")]),
+    (lambda body: body["foods"].pop(), [("DELETE FROM", "log_entry_foods")]),
+], ids=["unchanged", "notes-only", "append", "remove-first", "remove-last"])
+def test_put_writes_only_what_changed(client, engine, statements, create_log_entries, edit, expected_writes):
+    log_entry_id, = create_log_entries(1, num_foods=10)
+    body = put_body(client.get(f"/log-entries/{log_entry_id}").json())
+    rows_before = food_rows(engine, log_entry_id)
+    edit(body)
+
+    statements.clear()
+    response = client.put(f"/log-entries/{log_entry_id}", json=body)
+    assert response.status_code == 200
+    writes = [WRITE.match(statement).groups() for statement in statements.writes]
+    assert writes == [MARK_DIRTY, *expected_writes]
+
+    # Responses follow the request, and rows that survive keep their id and food
+    assert put_body(response.json()) == body
+    rows_after = food_rows(engine, log_entry_id)
+    assert [food_id for _, food_id in rows_after] == [f["food_id"] for f in body["foods"]]
+    surviving = set(rows_before) & set(rows_after)
+    assert len(surviving) == min(len(rows_before), len(rows_after))
+
+
+def test_put_inserting_a_food_first_keeps_request_order(client, engine, create_log_entries):
+    log_entry_id, = create_log_entries(1, num_foods=5)
+    body = put_body(client.get(f"/log-entries/{log_entry_id}").json())
+    rows_before = dict(food_rows(engine, log_entry_id))
+    body["foods"].insert(0, {"food_id": body["foods"][2]["food_id"], "servings": 9.0})
+
+    response = client.put(f"/log-entries/{log_entry_id}", json=body)
+    assert put_body(response.json()) == body
+    assert put_body(client.get(f"/log-entries/{log_entry_id}").json()) == body
+    # No row id ends up pointing at a different food
+    for row_id, food_id in food_rows(engine, log_entry_id):
+        assert rows_before.get(row_id, food_id) == food_id
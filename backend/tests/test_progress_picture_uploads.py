@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+import httpx
+import pytest
+from conftest import create_test_client, reset_caches
+from src.api import progress_picture
+from src.database import create_async_db_engine, create_db_engine
+from src.main import app
+
+UPLOADS = 8
+UPLOAD_SIZE = 4 * 1024 * 1024
+
+# Time the simulated disk takes to write a MiB
+SECONDS_PER_MIB = 0.25
+
+# Slowest a GET may take while the uploads are running
+MAX_GET_SECONDS = 0.5
+
+
+class SlowFile:
+    """File whose writes block like a slow disk, so a write made on the event loop stalls every request"""
+    def __init__(self, path, mode):
+        self.file = open(path, mode)
+
+    def write(self, data: bytes) -> int:
+        time.sleep(len(data) / (1024 * 1024) * SECONDS_PER_MIB)
+        return self.file.write(data)
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@pytest.fixture
+def async_setup(tmp_path, monkeypatch):
+    """Client on a file database shared by the sync and async engines, saving uploads to a slow disk under tmp_path"""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_db_engine(url)
+    async_engine = create_async_db_engine(url)
+    monkeypatch.setattr(progress_picture, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(progress_picture, "open", SlowFile, raising=False)
+    yield create_test_client(engine, async_engine), async_engine, tmp_path
+    app.dependency_overrides.clear()
+    reset_caches()
+    engine.dispose()
+
+
+def test_parallel_uploads_leave_other_requests_responsive(async_setup):
+    client, async_engine, upload_dir = async_setup
+    log_entry_id = client.post("/log-entries/", json={"timestamp": "2024-01-01T08:00:00"}).json()["id"]
+    payload = b"\xff\xd8\xff\xe0" + os.urandom(UPLOAD_SIZE)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            async def upload():
+                response = await http.post(
+                    f"/api/progress-pictures/{log_entry_id}", files={"file": ("front.jpg", payload, "image/jpeg")}
+                )
+                return response.status_code
+
+            async def get_while(uploads):
+                latencies = []
+                while not all(task.done() for task in uploads):
+                    for path in ("/health", f"/log-entries/{log_entry_id}?fields=notes"):
+                        start = time.perf_counter()
+                        response = await http.get(path)
+                        latencies.append(time.perf_counter() - start)
+                        assert response.status_code == 200
+                    await asyncio.sleep(0.01)
+                return latencies
+
+            uploads = [asyncio.create_task(upload()) for _ in range(UPLOADS)]
+            latencies = await get_while(uploads)
+            statuses = await asyncio.gather(*uploads)
+        await async_engine.dispose()
+        return statuses, latencies
+
+    statuses, latencies = asyncio.run(run())
+    assert statuses == [200] * UPLOADS
+    assert len(latencies) >= 10
+    assert max(latencies) < MAX_GET_SECONDS, max(latencies)
+    saved = [path for path in upload_dir.iterdir() if path.suffix == ".jpg"]
+    assert len(saved) == UPLOADS
+    assert all(path.stat().st_size == len(payload) for path in saved)
+    assert len(client.get("/api/progress-pictures/all").json()) == UPLOADS
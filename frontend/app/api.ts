@@ -1,6 +1,9 @@
 import type {
   LogEntry,
   LogEntryRequest,
+  LogEntryPatchOperation,
+  LogEntryImportResult,
+  ExportDataset,
   Phase,
   Food,
   Meal,
@@ -28,6 +31,8 @@ import type {
   ProgressPicture,
   StatsQueryRequest,
   StatsQueryResponse,
+  StatsBatchQueryRequest,
+  StatsBatchQueryResponse,
   StatsConfiguration,
   StatsConfigurationRequest,
 } from './types';
@@ -57,6 +62,22 @@ async function fetchApi<T>(endpoint: string, options?: RequestInit): Promise<T>
 
 export const logEntryApi = {
   getAll: () => fetchApi<LogEntry[]>('/log-entries/'),
+  // `fields` limits which sections the server loads; the rest are left out of the response
+  getRange: (start: string, end: string, fields?: (keyof LogEntry)[]) =>
+    fetchApi<LogEntry[]>(`/log-entries/range?start=${start}&end=${end}${fields ? `&fields=${fields.join(',')}` : ''}`),
+  getPage: async (after?: string | null, limit = 100): Promise<{ entries: LogEntry[]; nextCursor: string | null }> => {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (after) {
+      params.set('after', after);
+    }
+    
+    const res = await fetch(`${API_BASE}/log-entries/?${params}`);
+    if (!res.ok) {
+      throw new Error(`API Error: ${res.status} ${res.statusText}`);
+    }
+    
+    return { entries: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+  },
   getById: (id: number) => fetchApi<LogEntry>(`/log-entries/${id}`),
   getByDate: (date: string) => fetchApi<LogEntry | null>(`/log-entries/date/${date}`),
   create: (data: LogEntryRequest) => fetchApi<LogEntry>('/log-entries/', {
@@ -67,7 +88,29 @@ export const logEntryApi = {
     method: 'PUT',
     body: JSON.stringify(data),
   }),
+  // Returns id, timestamp and only the sections the operations changed
+  patch: (id: number, operations: LogEntryPatchOperation[]) => fetchApi<Partial<LogEntry>>(`/log-entries/${id}`, {
+    method: 'PATCH',
+    body: JSON.stringify({ operations }),
+  }),
   delete: (id: number) => fetchApi<LogEntry>(`/log-entries/${id}`, { method: 'DELETE' }),
+  // NDJSON (one LogEntryRequest per line) or CSV; the format is taken from the file extension
+  import: async (file: File): Promise<LogEntryImportResult> => {
+    const formData = new FormData();
+    formData.append('file', file);
+    
+    const res = await fetch(`${API_BASE}/log-entries/import`, {
+      method: 'POST',
+      body: formData,
+    });
+    
+    if (!res.ok) {
+      const error = await res.json().catch(() => ({ detail: res.statusText }));
+      throw new Error(error.detail || `Import failed: ${res.status}`);
+    }
+    
+    return res.json();
+  },
 };
 
 // ============================================================================
@@ -90,6 +133,8 @@ export const phaseApi = {
 
 export const foodApi = {
   getAll: () => fetchApi<Food[]>('/foods/'),
+  search: (q: string, limit = 20) =>
+    fetchApi<Food[]>(`/foods/search?q=${encodeURIComponent(q)}&limit=${limit}`),
   getById: (id: number) => fetchApi<Food>(`/foods/${id}`),
   create: (data: Omit<Food, 'id'>) => fetchApi<Food>('/foods/', {
     method: 'POST',
@@ -391,7 +436,9 @@ export const progressPictureApi = {
   delete: (pictureId: number) => 
     fetchApi<{ status: string }>(`/api/progress-pictures/${pictureId}`, { method: 'DELETE' }),
   
-  getFileUrl: (filename: string) => `${API_BASE}/api/progress-pictures/file/${filename}`,
+  // size: resized WebP copy (thumb ~400px, medium ~1280px); omit for the original upload
+  getFileUrl: (filename: string, size?: 'thumb' | 'medium') =>
+    `${API_BASE}/api/progress-pictures/file/${filename}${size ? `?size=${size}` : ''}`,
 };
 
 // ============================================================================
@@ -404,6 +451,11 @@ export const statsApi = {
     body: JSON.stringify(request),
   }),
   
+  queryBatch: (request: StatsBatchQueryRequest) => fetchApi<StatsBatchQueryResponse>('/api/stats/query-batch', {
+    method: 'POST',
+    body: JSON.stringify(request),
+  }),
+  
   getMetrics: () => fetchApi<{ value: string; label: string }[]>('/api/stats/metrics'),
   getDateRangeTypes: () => fetchApi<{ value: string; label: string }[]>('/api/stats/date-range-types'),
   getAggregationTypes: () => fetchApi<{ value: string; label: string }[]>('/api/stats/aggregation-types'),
@@ -422,3 +474,13 @@ export const statsApi = {
   deleteConfiguration: (id: number) => fetchApi<{ status: string }>(`/api/stats/configurations/${id}`, { method: 'DELETE' }),
 };
 
+
+// ============================================================================
+// Export API
+// ============================================================================
+
+export const exportApi = {
+  // Streamed download; use as an <a href> so the browser saves it without buffering it in memory
+  getDownloadUrl: (dataset: ExportDataset, format: 'ndjson' | 'csv' = 'ndjson') =>
+    `${API_BASE}/export/${dataset}?format=${format}`,
+};
@@ -290,7 +290,7 @@ export default function ProgressPicturesSection({
                   style={{ cursor: 'pointer' }}
                 >
                   <img 
-                    src={progressPictureApi.getFileUrl(pic.filename)} 
+                    src={progressPictureApi.getFileUrl(pic.filename, 'thumb')} 
                     alt={pic.label || 'Progress picture'} 
                   />
                 </div>
@@ -334,7 +334,7 @@ export default function ProgressPicturesSection({
               ×
             </button>
             <img 
-              src={progressPictureApi.getFileUrl(viewingPicture.filename)} 
+              src={progressPictureApi.getFileUrl(viewingPicture.filename, 'medium')} 
               alt={viewingPicture.label || 'Progress picture'} 
             />
             {viewingPicture.label && (
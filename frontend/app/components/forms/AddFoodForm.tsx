@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import type { Food, Meal, LogEntryFoodInput } from '../../types';
 import { foodApi, mealApi } from '../../api';
 
@@ -56,12 +56,16 @@ const initialNewFood: NewFoodData = {
   fat_cholesterol: '',
 };
 
+// Wait this long after the last keystroke before searching
+const SEARCH_DEBOUNCE_MS = 150;
+
 const toNum = (val: string): number => {
   const n = parseFloat(val);
   return isNaN(n) ? 0 : n;
 };
 
 export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
+  // Foods the form has seen (search results picked or foods created), not the whole catalog
   const [availableFoods, setAvailableFoods] = useState<Food[]>([]);
   const [availableMeals, setAvailableMeals] = useState<Meal[]>([]);
   const [selectedItems, setSelectedItems] = useState<SelectedItem[]>([]);
@@ -69,17 +73,50 @@ export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
   const [showNewFood, setShowNewFood] = useState(false);
   const [newFood, setNewFood] = useState<NewFoodData>(initialNewFood);
   const [creatingFood, setCreatingFood] = useState(false);
+  const [foodQuery, setFoodQuery] = useState('');
+  const [searchResults, setSearchResults] = useState<Food[]>([]);
+  const searchTimerRef = useRef<NodeJS.Timeout | null>(null);
+  const latestQueryRef = useRef('');
 
   useEffect(() => {
-    Promise.all([foodApi.getAll(), mealApi.getAll()])
-      .then(([foods, meals]) => {
-        setAvailableFoods(foods);
-        setAvailableMeals(meals);
-      })
+    mealApi.getAll()
+      .then(setAvailableMeals)
       .catch(console.error)
       .finally(() => setLoading(false));
+    return () => {
+      if (searchTimerRef.current) clearTimeout(searchTimerRef.current);
+    };
   }, []);
 
+  const searchFoods = (query: string) => {
+    setFoodQuery(query);
+    latestQueryRef.current = query;
+    if (searchTimerRef.current) clearTimeout(searchTimerRef.current);
+    if (!query.trim()) {
+      setSearchResults([]);
+      return;
+    }
+    searchTimerRef.current = setTimeout(async () => {
+      try {
+        const results = await foodApi.search(query);
+        // Ignore responses to queries the user has already typed past
+        if (latestQueryRef.current === query) setSearchResults(results);
+      } catch (error) {
+        console.error('Failed to search foods:', error);
+      }
+    }, SEARCH_DEBOUNCE_MS);
+  };
+
+  const rememberFood = (food: Food) => {
+    setAvailableFoods((foods) => (foods.some(f => f.id === food.id) ? foods : [...foods, food]));
+  };
+
+  const selectFood = (food: Food) => {
+    rememberFood(food);
+    setSelectedItems([...selectedItems, { type: 'food', id: food.id, multiplier: String(food.serving_size) }]);
+    searchFoods('');
+  };
+
   const getFoodById = (id: number) => availableFoods.find(f => f.id === id);
   const getMealById = (id: number) => availableMeals.find(m => m.id === id);
 
@@ -177,11 +214,8 @@ export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
     onSubmit(foods);
   };
 
-  const addItem = () => {
-    if (availableFoods.length > 0) {
-      const food = availableFoods[0];
-      setSelectedItems([...selectedItems, { type: 'food', id: food.id, multiplier: String(food.serving_size) }]);
-    } else if (availableMeals.length > 0) {
+  const addMeal = () => {
+    if (availableMeals.length > 0) {
       setSelectedItems([...selectedItems, { type: 'meal', id: availableMeals[0].id, multiplier: '1' }]);
     }
   };
@@ -236,7 +270,7 @@ export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
         },
       };
       const created = await foodApi.create(foodData as any);
-      setAvailableFoods([...availableFoods, created]);
+      rememberFood(created);
       setSelectedItems([...selectedItems, { type: 'food', id: created.id, multiplier: String(created.serving_size) }]);
       setShowNewFood(false);
       setNewFood(initialNewFood);
@@ -256,7 +290,6 @@ export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
   };
 
   const totals = calculateTotals();
-  const hasItems = availableFoods.length > 0 || availableMeals.length > 0;
 
   return (
     <form onSubmit={handleSubmit} className="form">
@@ -506,21 +539,40 @@ export default function AddFoodForm({ onSubmit, onCancel }: AddFoodFormProps) {
           <div className="form-loading">Loading foods...</div>
         ) : (
           <>
-            {hasItems && (
+            <input
+              type="text"
+              value={foodQuery}
+              onChange={(e) => searchFoods(e.target.value)}
+              className="exercise-search-input"
+              placeholder="Search foods..."
+              style={{ marginTop: '0.5rem' }}
+            />
+            {searchResults.length > 0 && (
+              <div className="exercise-list" style={{ marginTop: '0.5rem' }}>
+                {searchResults.map((f) => (
+                  <button
+                    key={f.id}
+                    type="button"
+                    className="exercise-list-item"
+                    onClick={() => selectFood(f)}
+                  >
+                    {f.name}
+                  </button>
+                ))}
+              </div>
+            )}
+
+            {availableMeals.length > 0 && (
               <button
                 type="button"
                 className="btn-add-small"
-                onClick={addItem}
+                onClick={addMeal}
                 style={{ marginTop: '0.5rem', marginBottom: '0.5rem' }}
               >
-                + Add Food
+                + Add Meal
               </button>
             )}
 
-            {selectedItems.length === 0 && !hasItems && !showNewFood && (
-              <div className="form-empty">No foods available. Create a new food above.</div>
-            )}
-
             {selectedItems.map((item, index) => {
               const macros = calculateItemMacros(item);
               const isFood = item.type === 'food';
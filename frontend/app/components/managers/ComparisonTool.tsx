@@ -175,7 +175,7 @@ export default function ComparisonTool() {
       const newPhoto: ComparisonPhoto = {
         id: `photo-${Date.now()}-${picture.id}`,
         pictureId: picture.id,
-        url: `${API_BASE}${picture.url}`,
+        url: `${API_BASE}${picture.url}?size=medium`,
         label: picture.label,
         date: picture.log_entry_date || picture.created_at,
         gridColumn: col,
@@ -552,7 +552,7 @@ export default function ComparisonTool() {
                           className={`picture-picker-item ${selectedPictures.has(picture.id) ? 'selected' : ''}`}
                           onClick={() => togglePictureSelection(picture.id)}
                         >
-                          <img src={`${API_BASE}${picture.url}`} alt={picture.label || 'Progress photo'} />
+                          <img src={`${API_BASE}${picture.url}?size=thumb`} alt={picture.label || 'Progress photo'} />
                           {selectedPictures.has(picture.id) && (
                             <div className="picture-picker-item-check">✓</div>
                           )}
@@ -87,8 +87,8 @@ export default function WeightManager({ onWeightUpdated }: WeightManagerProps) {
   const fetchWeights = useCallback(async () => {
     setLoading(true);
     try {
-      const logEntries = await logEntryApi.getAll();
       const last6Weeks = getLastNWeeks(6);
+      const logEntries = await logEntryApi.getRange(last6Weeks[last6Weeks.length - 1], last6Weeks[0], ['morning_weight']);
       
       // Create a map of date -> log entry for quick lookup
       const entryMap = new Map<string, LogEntry>();
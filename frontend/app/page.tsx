@@ -1,7 +1,7 @@
 'use client';
 
 import { useEffect, useState, useCallback, useRef } from 'react';
-import type { LogEntry, LogEntryRequest, Exercise } from './types';
+import type { LogEntry, LogEntryRequest, LogEntryPatchOperation, Exercise } from './types';
 import { logEntryApi, activityApi, exerciseApi } from './api';
 import Sidebar, { View } from './components/Sidebar';
 import DaySelector from './components/DaySelector';
@@ -139,6 +139,13 @@ export default function Home() {
     }
   };
 
+  // Quick edits to the loaded entry: send only the change and merge back the sections it returns
+  const patchLogEntry = async (operations: LogEntryPatchOperation[]) => {
+    if (!logEntry) return;
+    const changed = await logEntryApi.patch(logEntry.id, operations);
+    setLogEntry(prev => (prev && prev.id === changed.id ? { ...prev, ...changed } : prev));
+  };
+
   // Ensure a log entry exists for the current date and return its ID
   const ensureLogEntry = async (): Promise<number | undefined> => {
     // If we already have the log entry in state, return its ID
@@ -199,11 +206,11 @@ export default function Home() {
 
   const handleAddFoodSubmit = async (foods: { food_id: number; servings: number }[]) => {
     try {
-      // Get existing foods and add new ones
-      const existingFoods = logEntry?.foods?.map(f => ({ food_id: f.food.id, servings: f.servings })) || [];
-      await createOrUpdateLogEntry({
-        foods: [...existingFoods, ...foods],
-      });
+      if (logEntry) {
+        await patchLogEntry(foods.map(f => ({ op: 'add_food' as const, food_id: f.food_id, servings: f.servings })));
+      } else {
+        await createOrUpdateLogEntry({ foods });
+      }
       closeModal();
     } catch (error) {
       console.error('Failed to add food:', error);
@@ -712,18 +719,21 @@ export default function Home() {
   };
 
   const handleHydrationSubmit = async (data: HydrationFormData) => {
-    const existingHydration = logEntry?.hydration?.map(h => ({ type: 'existing' as const, id: h.id })) || [];
-    await createOrUpdateLogEntry({
-      hydration: [
-        ...existingHydration,
-        {
-          type: 'new',
-          timestamp: data.timestamp,
-          cup_id: data.cup_id,
-          servings: data.servings,
-        },
-      ],
-    });
+    const hydration = {
+      type: 'new' as const,
+      timestamp: data.timestamp,
+      cup_id: data.cup_id,
+      servings: data.servings,
+    };
+    try {
+      if (logEntry) {
+        await patchLogEntry([{ op: 'append_hydration', hydration }]);
+      } else {
+        await createOrUpdateLogEntry({ hydration: [hydration] });
+      }
+    } catch (error) {
+      console.error('Failed to add hydration:', error);
+    }
     closeModal();
   };
 
@@ -742,10 +752,7 @@ export default function Home() {
     if (!confirmed) return;
     
     try {
-      const remainingHydration = logEntry.hydration.filter((_, idx) => idx !== hydrationIndex);
-      await createOrUpdateLogEntry({
-        hydration: remainingHydration.map(h => ({ type: 'existing' as const, id: h.id })),
-      });
+      await patchLogEntry([{ op: 'remove_hydration', hydration_id: hydrationItem.id }]);
     } catch (error) {
       console.error('Failed to remove hydration:', error);
     }
@@ -1091,10 +1098,7 @@ export default function Home() {
     if (!confirmed) return;
     
     try {
-      const remainingFoods = logEntry.foods.filter((_, idx) => idx !== foodIndex);
-      await createOrUpdateLogEntry({
-        foods: remainingFoods.map(f => ({ food_id: f.food.id, servings: f.servings })),
-      });
+      await patchLogEntry([{ op: 'remove_food', index: foodIndex }]);
     } catch (error) {
       console.error('Failed to remove food:', error);
     }
@@ -1102,7 +1106,8 @@ export default function Home() {
 
   // Debounce timer for food grams changes
   const foodSaveTimerRef = useRef<NodeJS.Timeout | null>(null);
-  const pendingFoodUpdateRef = useRef<{ foods: { food_id: number; servings: number }[] } | null>(null);
+  // Food index -> servings edited since the last save
+  const pendingFoodUpdateRef = useRef<Map<number, number>>(new Map());
 
   const handleFoodGramsChange = (foodIndex: number, grams: number) => {
     if (!logEntry?.foods) return;
@@ -1118,13 +1123,9 @@ export default function Home() {
     });
     setLogEntry({ ...logEntry, foods: updatedFoods });
 
-    const foodsPayload = updatedFoods.map(f => ({
-      food_id: f.food.id,
-      servings: f.servings,
-    }));
-
     // Store the pending update
-    pendingFoodUpdateRef.current = { foods: foodsPayload };
+    pendingFoodUpdateRef.current.set(foodIndex, newServings);
+    const logEntryId = logEntry.id;
 
     // Clear existing timer and set a new one (debounce)
     if (foodSaveTimerRef.current) {
@@ -1134,18 +1135,17 @@ export default function Home() {
     // Save after 500ms of no changes
     foodSaveTimerRef.current = setTimeout(async () => {
       const pending = pendingFoodUpdateRef.current;
-      if (!pending) return;
+      if (pending.size === 0) return;
+      pendingFoodUpdateRef.current = new Map();
 
       try {
-        await createOrUpdateLogEntry({
-          foods: pending.foods,
-        }, true); // Skip refetch - we already updated optimistically
+        // Only the edited foods are sent; the response isn't merged since we already updated optimistically
+        await logEntryApi.patch(logEntryId, Array.from(pending, ([index, servings]) => ({ op: 'update_food' as const, index, servings })));
       } catch (error) {
         console.error('Failed to update food grams:', error);
         // On error, refetch to get correct state
         fetchLogEntry(selectedDate);
       }
-      pendingFoodUpdateRef.current = null;
     }, 500);
   };
 
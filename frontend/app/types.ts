@@ -464,6 +464,28 @@ export interface LogEntryRequest {
   carb_cycle_day_id?: number;
 }
 
+// One step of PATCH /log-entries/{id}; foods are addressed by their position in the entry's foods
+export type LogEntryPatchOperation =
+  | { op: 'append_hydration'; hydration: { type: "existing"; id: number } | { type: "new"; timestamp: string; cup_id: number; servings: number } }
+  | { op: 'remove_hydration'; hydration_id: number }
+  | { op: 'add_food'; food_id: number; servings: number }
+  | { op: 'update_food'; index: number; servings: number }
+  | { op: 'remove_food'; index: number }
+  | { op: 'set_morning_weight'; morning_weight: number | null };
+
+// Result of a bulk import; `line` is the 1-based line (NDJSON) or row (CSV) that failed
+export interface LogEntryImportResult {
+  imported: number;
+  ids: number[];
+  errors: { line: number; error: string }[];
+}
+
+// Datasets available from GET /export/{dataset}
+export type ExportDataset =
+  | 'log-entries' | 'foods' | 'meals' | 'exercises' | 'workouts' | 'activities'
+  | 'cardio' | 'sleep' | 'stress' | 'hydration' | 'supplements' | 'phases'
+  | 'training-sets';  // one flat row per set
+
 // ============================================================================
 // Stats Types
 // ============================================================================
@@ -563,6 +585,16 @@ export interface StatsQueryResponse {
   aggregation: AggregationType;
 }
 
+export interface StatsBatchQueryRequest {
+  queries?: StatsQueryRequest[];
+  configuration_ids?: number[];
+}
+
+export interface StatsBatchQueryResponse {
+  queries: StatsQueryResponse[];         // In the order of the request's queries
+  configurations: StatsQueryResponse[];  // In the order of configuration_ids
+}
+
 export interface StatsConfigurationConfig {
   metrics: MetricType[];
   date_range_type: DateRangeType;